@@ -0,0 +1,68 @@
+import time
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+from Common.Config import BASE_URL
+from Common.Waits import Wait, url_contains
+
+SESSION_COOKIE = "session-username"
+SESSION_LIFETIME = 600  # SauceDemo sets its session cookie to expire after 10 minutes
+VALID_PASSWORD = "secret_sauce"
+
+# Personas that SauceDemo lets through the login form. locked_out_user is left
+# out on purpose: it never gets a session, so it always goes through the form.
+SESSION_USERS = [
+    "standard_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+]
+
+
+def page_url(page=""):
+    return urljoin(BASE_URL, page)
+
+
+def ui_login(driver, username, password=VALID_PASSWORD):
+    driver.get(BASE_URL)
+    driver.find_element(By.ID, "user-name").send_keys(username)
+    driver.find_element(By.ID, "password").send_keys(password)
+    driver.find_element(By.ID, "login-button").click()
+    Wait(driver, 10).until(url_contains("inventory.html"))
+
+
+def set_session(driver, username, lifetime=SESSION_LIFETIME):
+    """Plants the SauceDemo session cookie; the browser must already be on the app origin."""
+    driver.add_cookie({
+        "name": SESSION_COOKIE,
+        "value": username,
+        "path": "/",
+        "expiry": int(time.time()) + lifetime,
+    })
+
+
+def login(driver, username, password=VALID_PASSWORD, page="inventory.html"):
+    """
+    Logs in and lands on `page`. Known personas with the valid password skip
+    the login form: the session cookie is set directly and the target page is
+    loaded in a single navigation. Anything else falls back to the form.
+
+    Args:
+        driver: The WebDriver session to log in.
+        username (str): SauceDemo username.
+        password (str, optional): Password, "secret_sauce" by default.
+        page (str, optional): Page to land on, relative to the base URL.
+    """
+    if username not in SESSION_USERS or password != VALID_PASSWORD:
+        ui_login(driver, username, password)
+        if page != "inventory.html":
+            driver.get(page_url(page))
+        return
+
+    if not driver.current_url.startswith(BASE_URL):
+        driver.get(BASE_URL)
+    set_session(driver, username)
+    driver.get(page_url(page))
+    Wait(driver, 10).until(url_contains(page))
@@ -0,0 +1,99 @@
+import math
+import random
+from collections import namedtuple
+
+# Two-sided 95% Student t critical values by degrees of freedom; larger
+# samples use the normal value.
+T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+Z_95 = 1.96
+BOOTSTRAP_RESAMPLES = 1000
+
+BenchmarkSettings = namedtuple("BenchmarkSettings", "warmup iterations percentile")
+
+
+class BenchmarkStats(namedtuple("BenchmarkStats", "count min median p95 p99 mean stddev mean_ci percentile percentile_value percentile_ci")):
+    """
+    Summary of one step's samples. `mean_ci` is the 95% t-interval of the
+    mean; `percentile_ci` a 95% bootstrap interval of the chosen percentile.
+    Intervals are None with fewer than two samples.
+    """
+
+    def describe(self, unit="s"):
+        if self.count == 1:
+            return f"{self.median:.2f}{unit}"
+        line = (f"n={self.count} min {self.min:.2f}{unit} median {self.median:.2f}{unit} "
+                f"p95 {self.p95:.2f}{unit} p99 {self.p99:.2f}{unit} stddev {self.stddev:.2f}{unit}, "
+                f"mean {self.mean:.2f}{unit} [{self.mean_ci[0]:.2f}, {self.mean_ci[1]:.2f}]")
+        return line + (f", p{self.percentile:g} [{self.percentile_ci[0]:.2f}, {self.percentile_ci[1]:.2f}]")
+
+
+def percentile(samples, q):
+    """q-th percentile (0-100) with linear interpolation between closest ranks, as numpy does by default."""
+    ordered = sorted(samples)
+    if not ordered:
+        raise ValueError("percentile of no samples")
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def mean_interval(samples):
+    count = len(samples)
+    if count < 2:
+        return None
+    mean = sum(samples) / count
+    stddev = math.sqrt(sum((value - mean) ** 2 for value in samples) / (count - 1))
+    half = T_95.get(count - 1, Z_95) * stddev / math.sqrt(count)
+    return mean - half, mean + half
+
+
+def bootstrap_interval(samples, q, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    """95% percentile-bootstrap interval of the q-th percentile; seeded so reports are reproducible."""
+    if len(samples) < 2:
+        return None
+    rng = random.Random(seed)
+    estimates = sorted(percentile(rng.choices(samples, k=len(samples)), q) for _ in range(resamples))
+    return percentile(estimates, 2.5), percentile(estimates, 97.5)
+
+
+def summarize(samples, q=95):
+    count = len(samples)
+    mean = sum(samples) / count
+    stddev = math.sqrt(sum((value - mean) ** 2 for value in samples) / (count - 1)) if count > 1 else 0.0
+    return BenchmarkStats(
+        count=count,
+        min=min(samples),
+        median=percentile(samples, 50),
+        p95=percentile(samples, 95),
+        p99=percentile(samples, 99),
+        mean=mean,
+        stddev=stddev,
+        mean_ci=mean_interval(samples),
+        percentile=q,
+        percentile_value=percentile(samples, q),
+        percentile_ci=bootstrap_interval(samples, q),
+    )
+
+
+def run_iterations(iteration, settings, reset=None):
+    """
+    Calls `iteration()` settings.warmup times without keeping the result and
+    then settings.iterations times, calling `reset()` (if given) before each
+    one so every run starts from the same state.
+
+    Returns:
+        The results of the measured iterations, in order.
+    """
+    results = []
+    for index in range(settings.warmup + settings.iterations):
+        if reset is not None:
+            reset()
+        result = iteration()
+        if index >= settings.warmup:
+            results.append(result)
+    return results
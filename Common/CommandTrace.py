@@ -0,0 +1,205 @@
+import json
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import namedtuple
+
+import selenium
+
+from Common import Waits
+from Common.Config import PROJECT_ROOT
+from Common.PerfHistory import current_run_id
+
+TRACES_DIR = os.path.join(PROJECT_ROOT, "Results", "Traces")
+
+# Every WebDriver command a traced browser sent: protocol command name
+# (e.g. "findElement", "getElementValueOfCssProperty"), when it started and
+# how long the round trip took, the test that was running, the first line
+# outside Selenium and Common that issued it, and whether it was an in-page
+# wait from Common.Waits.
+CommandRecord = namedtuple("CommandRecord", "command started seconds test site wait thread")
+
+TestCommands = namedtuple("TestCommands", "test count seconds wait_seconds slowest")
+
+_SELENIUM_DIR = os.path.dirname(selenium.__file__)
+_COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+_WAITS_FILE = Waits.__file__
+_LIBRARY_DIRS = tuple({sysconfig.get_path(name) for name in ("stdlib", "purelib", "platlib")})
+
+_records = []
+_records_lock = threading.Lock()
+_epoch = time.perf_counter()
+
+
+def _caller():
+    """
+    (call site, issued by a Wait) of the command being sent from this thread.
+    The site is the first line outside Selenium and Common; when that is
+    library code (pytest tearing down a fixture, a worker thread), it is the
+    outermost Common line instead.
+    """
+    frame = sys._getframe(1)
+    wait = False
+    common_site = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        site = f"{os.path.basename(filename)}:{frame.f_lineno}"
+        if filename == __file__ or filename.startswith(_SELENIUM_DIR):
+            pass
+        elif filename.startswith(_COMMON_DIR):
+            wait = wait or filename == _WAITS_FILE
+            common_site = site
+        elif filename.startswith(_LIBRARY_DIRS):
+            if common_site:
+                return common_site, wait
+        else:
+            return site, wait
+        frame = frame.f_back
+    return common_site or "?", wait
+
+
+def record_command(command, started, seconds):
+    site, wait = _caller()
+    test = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0]
+    record = CommandRecord(command, started, seconds, test, site, wait, threading.get_ident())
+    with _records_lock:
+        _records.append(record)
+
+
+def command_records(start=0):
+    """Every record so far, or the ones after the first `start` (see command_count())."""
+    with _records_lock:
+        return _records[start:]
+
+
+def command_count():
+    with _records_lock:
+        return len(_records)
+
+
+def instrument(driver):
+    """
+    Wraps the driver's command executor so every command it sends is timed
+    and recorded. Safe to call more than once on the same driver.
+    """
+    executor = getattr(driver, "command_executor", None)
+    if executor is None or getattr(executor, "_sauce_traced", False):
+        return driver
+    execute = executor.execute
+
+    def traced_execute(command, params=None):
+        started = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            record_command(command, started, time.perf_counter() - started)
+
+    executor.execute = traced_execute
+    executor._sauce_traced = True
+    return driver
+
+
+def per_test(records=None, slowest=3):
+    """One TestCommands per test, the test with the most protocol time first."""
+    grouped = {}
+    for record in command_records() if records is None else records:
+        grouped.setdefault(record.test, []).append(record)
+    summaries = [
+        TestCommands(test, len(commands), sum(c.seconds for c in commands),
+                     sum(c.seconds for c in commands if c.wait),
+                     sorted(commands, key=lambda c: c.seconds, reverse=True)[:slowest])
+        for test, commands in grouped.items()
+    ]
+    return sorted(summaries, key=lambda summary: summary.seconds, reverse=True)
+
+
+def call_sites(records):
+    """(site, command count, seconds) per call site, the one with the most round trips first."""
+    sites = {}
+    for record in records:
+        count, seconds = sites.get(record.site, (0, 0.0))
+        sites[record.site] = (count + 1, seconds + record.seconds)
+    return sorted(((site, count, seconds) for site, (count, seconds) in sites.items()),
+                  key=lambda entry: (entry[1], entry[2]), reverse=True)
+
+
+def check_budget(records, max_commands=None, max_seconds=None, top=5):
+    """
+    Returns why `records` went over a round-trip budget (more than
+    `max_commands` commands or `max_seconds` of protocol time) followed by
+    the `top` call sites with the most round trips, or [] when within budget.
+    In-page waits from Common.Waits count as commands, but the time they
+    block is waiting, not protocol time, and is only reported alongside.
+    """
+    seconds = sum(record.seconds for record in records if not record.wait)
+    waiting = sum(record.seconds for record in records if record.wait)
+    problems = []
+    if max_commands is not None and len(records) > max_commands:
+        problems.append(f"{len(records)} WebDriver commands, budget {max_commands}")
+    if max_seconds is not None and seconds > max_seconds:
+        problems.append(f"{seconds:.2f}s of WebDriver protocol time (plus {waiting:.2f}s waiting), "
+                        f"budget {max_seconds:g}s")
+    if not problems:
+        return []
+    lines = ["Round-trip budget exceeded: " + "; ".join(problems), "Top call sites:"]
+    for site, count, site_seconds in call_sites(records)[:top]:
+        commands = {}
+        for record in records:
+            if record.site == site:
+                commands[record.command] = commands.get(record.command, 0) + 1
+        breakdown = ", ".join(f"{name} x{n}" for name, n in sorted(commands.items(), key=lambda e: -e[1]))
+        lines.append(f"  {site}: {count} commands, {site_seconds:.2f}s ({breakdown})")
+    return lines
+
+
+def command_summary(count=10):
+    records = command_records()
+    if not records:
+        return []
+    total = sum(record.seconds for record in records)
+    waiting = sum(record.seconds for record in records if record.wait)
+    tests = per_test(records)
+    lines = [f"{len(records)} WebDriver commands took {total:.1f}s ({waiting:.1f}s of it waiting) "
+             f"across {len(tests)} tests; most protocol time:"]
+    for summary in tests[:count]:
+        lines.append(f"  {summary.seconds:6.2f}s  {summary.count:5d} commands, {summary.wait_seconds:.2f}s waiting  "
+                     f"{summary.test or '(outside tests)'}")
+        for record in summary.slowest:
+            lines.append(f"           {record.seconds:6.3f}s {record.command} ({record.site})")
+    return lines
+
+
+def trace_path():
+    """Results/Traces/<run id>-<pid>.json: every process of a sharded run gets its own file."""
+    return os.path.join(TRACES_DIR, f"{current_run_id()}-{os.getpid()}.json")
+
+
+def write_trace(path, records=None):
+    """
+    Saves the commands in Chrome's trace event format (open the file in
+    chrome://tracing or https://ui.perfetto.dev): one complete event per
+    command, one track per browser thread.
+    """
+    records = command_records() if records is None else records
+    pid = os.getpid()
+    events = []
+    for thread in sorted({record.thread for record in records}):
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread,
+                       "args": {"name": f"webdriver {thread}"}})
+    for record in records:
+        events.append({
+            "name": record.command,
+            "cat": "wait" if record.wait else "webdriver",
+            "ph": "X",
+            "ts": round((record.started - _epoch) * 1e6),
+            "dur": round(record.seconds * 1e6),
+            "pid": pid,
+            "tid": record.thread,
+            "args": {"test": record.test, "site": record.site},
+        })
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
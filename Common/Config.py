@@ -0,0 +1,10 @@
+import os
+
+# Root of the checkout; every module resolves its files relative to this.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Site under test. Point SAUCEDEMO_BASE_URL at the local stand-in
+# (python3 -m StandIn.Server) to run without the public site.
+BASE_URL = os.environ.get("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/")
+if not BASE_URL.endswith("/"):
+    BASE_URL += "/"
@@ -0,0 +1,107 @@
+import threading
+
+from selenium.webdriver.common.by import By
+
+from Common.Auth import login, page_url
+from Common.Snapshot import snapshot
+from Common.Styles import collect_styles, first_styles
+from Common.Waits import Wait, present, url_contains, visible
+
+# Colors of the page landmarks that the UI checks compare across personas;
+# the first match of each selector is used.
+LANDMARK_STYLES = {
+    "header_bg": (".header_secondary_container", "background-color"),
+    "footer_bg": ("footer", "background-color"),
+    "button_bg": (".btn", "background-color"),
+    "button_text": (".btn", "color"),
+    "product_title": (".inventory_item_name", "color"),
+    "product_description": (".inventory_item_desc", "color"),
+}
+
+
+def open_inventory(driver):
+    if "inventory.html" not in driver.current_url:
+        driver.get(page_url("inventory.html"))
+    Wait(driver, 10).until(present((By.CLASS_NAME, "inventory_list")))
+
+
+def open_cart(driver):
+    driver.find_element(By.CLASS_NAME, "shopping_cart_link").click()
+    Wait(driver, 10).until(url_contains("cart.html"))
+
+
+def open_checkout_info(driver):
+    driver.find_element(By.ID, "checkout").click()
+    Wait(driver, 10).until(url_contains("checkout-step-one.html"))
+
+
+def open_checkout_overview(driver):
+    driver.find_element(By.ID, "first-name").send_keys("John")
+    driver.find_element(By.ID, "last-name").send_keys("Doe")
+    driver.find_element(By.ID, "postal-code").send_keys("12345")
+    driver.find_element(By.ID, "continue").click()
+    Wait(driver, 10).until(url_contains("checkout-step-two.html"))
+
+
+def open_checkout_complete(driver):
+    driver.find_element(By.ID, "finish").click()
+    Wait(driver, 10).until(url_contains("checkout-complete.html"))
+
+
+def open_sidebar(driver):
+    driver.find_element(By.ID, "react-burger-menu-btn").click()
+    Wait(driver, 10).until(visible((By.CLASS_NAME, "bm-menu")))
+
+
+# The journey every page check shares, in order. Each step moves on from where
+# the previous one left off, so the whole walk is one navigation per page.
+JOURNEY = [
+    ("inventory", open_inventory),
+    ("cart", open_cart),
+    ("checkout-step-one", open_checkout_info),
+    ("checkout-step-two", open_checkout_overview),
+    ("checkout-complete", open_checkout_complete),
+    ("sidebar", open_sidebar),
+]
+
+
+def capture_page(driver):
+    """Everything the page checks read: structured state, styles of every text element, landmark colors."""
+    return {
+        "url": driver.current_url,
+        "state": snapshot(driver),
+        "styles": collect_styles(driver),
+        "landmarks": first_styles(driver, LANDMARK_STYLES),
+    }
+
+
+def crawl(driver, capture=capture_page):
+    """Walks JOURNEY once from the inventory page and returns {page name: capture(driver)}, in journey order."""
+    pages = {}
+    for name, open_page in JOURNEY:
+        open_page(driver)
+        pages[name] = capture(driver)
+    return pages
+
+
+class CrawlCache:
+    """
+    One crawl per persona per test session. The first test that asks for a
+    persona logs in and crawls; later tests get the cached pages without
+    touching the browser. A failed crawl is not cached and raises again for
+    the next caller.
+    """
+
+    def __init__(self, capture=capture_page):
+        self.capture = capture
+        self.pages = {}
+        self.crawls = 0
+        self._lock = threading.Lock()
+
+    def get(self, driver, username):
+        with self._lock:
+            if username not in self.pages:
+                login(driver, username)
+                self.pages[username] = crawl(driver, self.capture)
+                self.crawls += 1
+            return self.pages[username]
@@ -0,0 +1,212 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException
+
+from Common.CommandTrace import instrument
+from Common.Config import BASE_URL
+
+logger = logging.getLogger(__name__)
+
+
+def launch_firefox(headless=False):
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument("-headless")
+    return webdriver.Firefox(options=options)
+
+
+def browser_alive(driver):
+    try:
+        driver.current_url
+        return True
+    # A browser whose driver process is gone fails with connection errors
+    # from urllib3 rather than a WebDriverException.
+    except Exception:
+        return False
+
+
+def reset_browser(driver, window_size=None):
+    """
+    Returns a leased browser to a clean state so the next test starts as if
+    it had a fresh Firefox: no open alerts or extra tabs, no cookies, no
+    local/session storage and the original window size.
+    """
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    # Storage and cookies can only be cleared for the origin that is loaded,
+    # so tests that wandered off (e.g. the sidebar "About" link) are brought back.
+    if not driver.current_url.startswith(BASE_URL):
+        driver.get(BASE_URL)
+    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    driver.delete_all_cookies()
+
+    if window_size and driver.get_window_size() != window_size:
+        driver.set_window_size(window_size["width"], window_size["height"])
+
+
+class BrowserPool:
+    """
+    Keeps up to `size` Firefox sessions alive for the whole pytest session and
+    leases them to tests, so a run pays for one cold start per pooled browser
+    instead of one per module (or per test for function-scoped fixtures).
+    """
+
+    def __init__(self, size=1, headless=False, factory=None):
+        self.size = max(1, size)
+        self.headless = headless
+        self._factory = factory or (lambda: launch_firefox(headless=self.headless))
+        self._condition = threading.Condition()
+        self._idle = []
+        self._window_sizes = {}
+        self._launching = 0
+        self._closed = False
+
+        self.startup_times = []
+        self.leases = 0
+        self.discarded = 0
+
+    @property
+    def launched(self):
+        return len(self.startup_times)
+
+    def _live_count(self):
+        return len(self._window_sizes) + self._launching
+
+    def _launch(self):
+        start = time.perf_counter()
+        driver = instrument(self._factory())
+        elapsed = time.perf_counter() - start
+        logger.info(f"Started pooled Firefox in {elapsed:.2f}s")
+        return driver, elapsed
+
+    def warm(self, count=None):
+        """Starts browsers up front so the first tests do not pay for them."""
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self._condition:
+                if self._live_count() >= count:
+                    return
+                self._launching += 1
+            self._add_idle(*self._launch_or_release_slot())
+
+    def _launch_or_release_slot(self):
+        try:
+            return self._launch()
+        except Exception:
+            with self._condition:
+                self._launching -= 1
+                self._condition.notify()
+            raise
+
+    def _add_idle(self, driver, elapsed):
+        with self._condition:
+            self._launching -= 1
+            self.startup_times.append(elapsed)
+            self._window_sizes[driver] = driver.get_window_size()
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def acquire(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    self.leases += 1
+                    return driver
+                if self._live_count() < self.size:
+                    self._launching += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No pooled browser became free within {timeout}s")
+                self._condition.wait(remaining)
+
+        driver, elapsed = self._launch_or_release_slot()
+        with self._condition:
+            self._launching -= 1
+            self.startup_times.append(elapsed)
+            self._window_sizes[driver] = driver.get_window_size()
+            self.leases += 1
+        return driver
+
+    def release(self, driver):
+        try:
+            reset_browser(driver, self._window_sizes.get(driver))
+        # Not only WebDriverException: see browser_alive().
+        except Exception as e:
+            logger.warning(f"Discarding pooled browser that failed to reset: {e}")
+            self._discard(driver)
+            return
+
+        with self._condition:
+            if self._closed:
+                self._quit(driver)
+                return
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def _discard(self, driver):
+        with self._condition:
+            self._window_sizes.pop(driver, None)
+            self.discarded += 1
+            self._condition.notify()
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            drivers = list(self._window_sizes)
+            self._idle.clear()
+            self._window_sizes.clear()
+            self._condition.notify_all()
+        for driver in drivers:
+            self._quit(driver)
+        logger.info("Closed pooled WebDriver sessions")
+
+    def average_startup(self):
+        if not self.startup_times:
+            return 0.0
+        return sum(self.startup_times) / len(self.startup_times)
+
+    def saved_seconds(self):
+        """Startup time avoided by serving leases from already running browsers."""
+        reused = max(0, self.leases - self.launched)
+        return reused * self.average_startup()
+
+    def summary(self):
+        return (
+            f"browser pool: {self.launched} launched, {self.leases} leases, "
+            f"{self.discarded} discarded, avg startup {self.average_startup():.2f}s, "
+            f"~{self.saved_seconds():.1f}s of startup saved"
+        )
@@ -0,0 +1,35 @@
+from selenium.webdriver.common.by import By
+
+from Common.Auth import VALID_PASSWORD, ui_login
+from Common.Waits import Wait, url_contains, visible
+
+
+def go_to_cart(driver):
+    driver.find_element(By.CLASS_NAME, "shopping_cart_link").click()
+    Wait(driver, 10).until(url_contains("cart.html"))
+
+
+def go_back(driver):
+    driver.back()
+    Wait(driver, 10).until(url_contains("inventory.html"))
+
+
+def go_to_all_items(driver):
+    driver.find_element(By.ID, "react-burger-menu-btn").click()
+    Wait(driver, 5).until(visible((By.CLASS_NAME, "bm-menu")))
+    driver.find_element(By.ID, "inventory_sidebar_link").click()
+    Wait(driver, 10).until(url_contains("inventory.html"))
+
+
+def page_load_journey(username, password=VALID_PASSWORD):
+    """
+    The journey the performance checks time, as (step name, step, args) in
+    order: log in, open the cart, go back, and return to all items through
+    the sidebar. Each step is called as step(driver, *args).
+    """
+    return [
+        ("Login", ui_login, (username, password)),
+        ("GoToCart", go_to_cart, ()),
+        ("BackToInventory", go_back, ()),
+        ("AllItems", go_to_all_items, ()),
+    ]
@@ -0,0 +1,244 @@
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from Common.Benchmark import percentile
+
+REPORT_NAME = "LoadTest.txt"
+DEFAULT_PERSONAS = ["standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"]
+
+# Upper bounds (seconds) of the latency histogram buckets; the last one is open.
+HISTOGRAM_BOUNDS = [0.1, 0.25, 0.5, 1, 2, 5, 10]
+HISTOGRAM_WIDTH = 40
+
+Sample = namedtuple("Sample", "persona step seconds ok finished phase")
+
+RAMP_UP = "ramp-up"
+STEADY = "steady"
+
+
+class LoadRun:
+    """
+    Shared state of one load run: the phase clock, the stop signal and the
+    samples every virtual user reports.
+    """
+
+    def __init__(self, users, ramp_up, duration):
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.started = time.perf_counter()
+        self.stop = threading.Event()
+        self.samples = []
+        self.journeys = 0
+        self.failed_launches = 0
+        self._lock = threading.Lock()
+
+    @property
+    def steady_start(self):
+        return self.started + self.ramp_up
+
+    @property
+    def steady_end(self):
+        return self.steady_start + self.duration
+
+    def phase(self, at):
+        return RAMP_UP if at < self.steady_start else STEADY
+
+    def record(self, persona, step, seconds, ok):
+        finished = time.perf_counter()
+        with self._lock:
+            self.samples.append(Sample(persona, step, seconds, ok, finished, self.phase(finished)))
+
+    def journey_done(self):
+        with self._lock:
+            self.journeys += 1
+
+
+def virtual_user(index, run, persona, journey, launch, think_time):
+    """
+    One virtual user: waits for its slot in the ramp-up, starts its own
+    headless browser and repeats the journey until the run stops. A step
+    that raises is recorded as failed and the journey starts over; a browser
+    that died is replaced, and a user whose replacement cannot start stops.
+    """
+    # Imported here, not at the top: Common.DriverPool loads Common.Config,
+    # which must wait until main() has set the target (see main()).
+    from Common.DriverPool import browser_alive
+
+    start_at = run.started + run.ramp_up * index / max(1, run.users)
+    if run.stop.wait(max(0.0, start_at - time.perf_counter())):
+        return
+    driver = start_browser(index, run, launch)
+    if driver is None:
+        return
+
+    try:
+        while not run.stop.is_set():
+            driver.delete_all_cookies()
+            for step_name, step, args in journey(persona):
+                if run.stop.is_set():
+                    return
+                started = time.perf_counter()
+                try:
+                    step(driver, *args)
+                except Exception as e:
+                    run.record(persona, step_name, time.perf_counter() - started, False)
+                    if not browser_alive(driver):
+                        print(f"[vu {index}] browser died ({e}); relaunching")
+                        driver = start_browser(index, run, launch)
+                        if driver is None:
+                            return
+                    break
+                run.record(persona, step_name, time.perf_counter() - started, True)
+            else:
+                run.journey_done()
+            if think_time and run.stop.wait(think_time):
+                return
+    finally:
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def start_browser(index, run, launch):
+    """Returns a new browser for virtual user `index`, or None (counted as a failed launch) if it cannot start."""
+    try:
+        return launch()
+    except Exception as e:
+        print(f"[vu {index}] could not start a browser: {e}")
+        with run._lock:
+            run.failed_launches += 1
+        return None
+
+
+def histogram(values):
+    counts = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+    for value in values:
+        for index, bound in enumerate(HISTOGRAM_BOUNDS):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+    return counts
+
+
+def histogram_lines(values):
+    counts = histogram(values)
+    peak = max(counts) or 1
+    labels = [f"<= {bound:g}s" for bound in HISTOGRAM_BOUNDS] + [f" > {HISTOGRAM_BOUNDS[-1]:g}s"]
+    return [f"      {label:>8} {count:6d} {'#' * round(HISTOGRAM_WIDTH * count / peak)}"
+            for label, count in zip(labels, counts)]
+
+
+def report(run, personas, step_names, base_url):
+    steady = [sample for sample in run.samples if sample.phase == STEADY and sample.finished <= run.steady_end]
+    lines = [
+        f"Load test against {base_url}",
+        f"{run.users} virtual users, {run.ramp_up:g}s ramp-up, {run.duration:g}s steady state",
+        f"{run.journeys} journeys completed, {len(run.samples)} steps "
+        f"({len(run.samples) - len(steady)} outside the steady state are not counted below)",
+    ]
+    if run.failed_launches:
+        lines.append(f"{run.failed_launches} browser launches failed; each stopped its virtual user")
+    if run.duration > 0:
+        ok = sum(1 for sample in steady if sample.ok)
+        lines.append(f"steady-state throughput: {ok / run.duration:.2f} steps/s")
+
+    for persona in personas:
+        lines.append("")
+        lines.append(f"=== {persona} ===")
+        for step_name in step_names:
+            samples = [sample for sample in steady if sample.persona == persona and sample.step == step_name]
+            latencies = [sample.seconds for sample in samples if sample.ok]
+            errors = len(samples) - len(latencies)
+            throughput = len(latencies) / run.duration if run.duration > 0 else 0.0
+            if not latencies:
+                lines.append(f"  {step_name}: no successful samples ({errors} errors)")
+                continue
+            lines.append(
+                f"  {step_name}: {len(latencies)} ok, {errors} errors, {throughput:.2f}/s, "
+                f"p50 {percentile(latencies, 50):.2f}s p95 {percentile(latencies, 95):.2f}s "
+                f"p99 {percentile(latencies, 99):.2f}s max {max(latencies):.2f}s")
+            lines.extend(histogram_lines(latencies))
+    return lines
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Drive the performance journey with many concurrent headless browsers.")
+    parser.add_argument("-u", "--users", type=int, default=5, help="Concurrent virtual users (default 5).")
+    parser.add_argument("--ramp-up", type=float, default=10,
+                        help="Seconds over which the virtual users are started (default 10).")
+    parser.add_argument("--duration", type=float, default=60,
+                        help="Seconds of steady state, with every user running, that are measured (default 60).")
+    parser.add_argument("--personas", default=",".join(DEFAULT_PERSONAS),
+                        help="Comma-separated personas, assigned to the virtual users round-robin.")
+    parser.add_argument("--think-time", type=float, default=0, help="Pause between journeys of one user.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Site to load (default: $SAUCEDEMO_BASE_URL or the public site).")
+    target.add_argument("--stand-in", action="store_true", help="Start the local stand-in and load it.")
+    parser.add_argument("--headed", action="store_true", help="Show the browser windows.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    server = None
+    if args.stand_in:
+        from StandIn.Server import start_in_background
+        server = start_in_background()
+        os.environ["SAUCEDEMO_BASE_URL"] = server.base_url
+    elif args.base_url:
+        os.environ["SAUCEDEMO_BASE_URL"] = args.base_url
+
+    # Imported only now: Common.Config reads the base URL at import time, so
+    # nothing above may import it before the target is known.
+    from Common.Config import BASE_URL, PROJECT_ROOT
+    from Common.DriverPool import launch_firefox
+    from Common.Journeys import page_load_journey
+
+    personas = [persona.strip() for persona in args.personas.split(",") if persona.strip()]
+    step_names = [name for name, _, _ in page_load_journey(personas[0])]
+    run = LoadRun(args.users, args.ramp_up, args.duration)
+
+    threads = [
+        threading.Thread(
+            target=virtual_user, name=f"vu-{index}",
+            args=(index, run, personas[index % len(personas)], page_load_journey,
+                  lambda: launch_firefox(headless=not args.headed), args.think_time))
+        for index in range(args.users)
+    ]
+    print(f"Starting {args.users} virtual users against {BASE_URL} "
+          f"({args.ramp_up:g}s ramp-up, {args.duration:g}s steady state)")
+    for thread in threads:
+        thread.start()
+    try:
+        run.stop.wait(max(0.0, run.steady_end - time.perf_counter()))
+    except KeyboardInterrupt:
+        print("Interrupted; reporting what was measured so far")
+    run.stop.set()
+    for thread in threads:
+        thread.join()
+    if server is not None:
+        server.shutdown()
+
+    lines = report(run, personas, step_names, BASE_URL)
+    report_file = os.path.join(PROJECT_ROOT, "Results", REPORT_NAME)
+    os.makedirs(os.path.dirname(report_file), exist_ok=True)
+    with open(report_file, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    print("\n".join(lines))
+    print(f"\nReport saved to {report_file}")
+    return 0 if run.journeys or not args.users else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+import statistics
+import time
+
+# Marks the start of a step: remembers the moment (as an absolute epoch
+# timestamp, so it can be compared across documents) and starts recording DOM
+# mutations, which is how a client-side route change shows up in the page.
+MARK_SCRIPT = """
+const now = performance.timeOrigin + performance.now();
+if (window.__routeObserver) window.__routeObserver.disconnect();
+const timing = window.__routeTiming = {mark: now, last: null};
+window.__routeObserver = new MutationObserver(() => {
+    timing.last = performance.timeOrigin + performance.now();
+});
+window.__routeObserver.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+return now;
+"""
+
+# Reads what the browser itself recorded for the document that is showing
+# now, once it has finished loading and the DOM has been quiet for settleMs:
+# Navigation Timing (TTFB, DOMContentLoaded, load) and Paint Timing (FCP,
+# LCP) if the step loaded a new document, and the route time from the mark to
+# the last in-page change either way. All values are milliseconds.
+READ_TIMING_SCRIPT = """
+const [mark, settleMs] = arguments;
+const done = arguments[arguments.length - 1];
+const origin = performance.timeOrigin;
+const absolute = () => origin + performance.now();
+
+function lcp() {
+    return new Promise(resolve => {
+        if (!window.PerformanceObserver || !(PerformanceObserver.supportedEntryTypes || []).includes("largest-contentful-paint")) {
+            return resolve(null);
+        }
+        let latest = null;
+        const observer = new PerformanceObserver(list => {
+            const entries = list.getEntries();
+            if (entries.length) latest = entries[entries.length - 1].startTime;
+        });
+        observer.observe({type: "largest-contentful-paint", buffered: true});
+        // Buffered entries are delivered in a task of their own.
+        setTimeout(() => { observer.disconnect(); resolve(latest); }, 50);
+    });
+}
+
+function quiet() {
+    return new Promise(resolve => {
+        let last = null;
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            last = absolute();
+            clearTimeout(timer);
+            timer = setTimeout(finish, settleMs);
+        });
+        const finish = () => { observer.disconnect(); resolve(last); };
+        observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+        timer = setTimeout(finish, settleMs);
+    });
+}
+
+function loaded() {
+    return new Promise(resolve => {
+        if (document.readyState === "complete") return resolve();
+        window.addEventListener("load", () => setTimeout(resolve, 0), {once: true});
+    });
+}
+
+(async function () {
+    await loaded();
+    const lastMutation = await quiet();
+    const timing = window.__routeTiming;
+    const result = {kind: null, ttfb: null, dom_content_loaded: null, load: null, fcp: null, lcp: null, route: null};
+    const ends = [];
+
+    if (origin > mark) {
+        // The step loaded a new document.
+        result.kind = "navigation";
+        const nav = performance.getEntriesByType("navigation")[0];
+        if (nav) {
+            result.ttfb = nav.responseStart - nav.startTime;
+            result.dom_content_loaded = nav.domContentLoadedEventEnd - nav.startTime;
+            result.load = nav.loadEventEnd - nav.startTime;
+            ends.push(nav.loadEventEnd);
+        }
+        const fcp = performance.getEntriesByName("first-contentful-paint")[0];
+        if (fcp) {
+            result.fcp = fcp.startTime;
+            ends.push(fcp.startTime);
+        }
+        result.lcp = await lcp();
+        if (result.lcp !== null) ends.push(result.lcp);
+    } else if (timing && timing.mark === mark) {
+        // Same document: a client-side route change.
+        result.kind = "route";
+        if (timing.last !== null) ends.push(timing.last - origin);
+    } else {
+        // An older document came back from the back/forward cache.
+        result.kind = "restored";
+    }
+    if (lastMutation !== null) ends.push(lastMutation - origin);
+    if (ends.length) result.route = origin + Math.max(...ends) - mark;
+    done(result);
+})().catch(e => done({error: String(e)}));
+"""
+
+TIMING_FIELDS = ["ttfb", "dom_content_loaded", "load", "fcp", "lcp", "route"]
+TIMING_LABELS = {
+    "ttfb": "TTFB",
+    "dom_content_loaded": "DCL",
+    "load": "load",
+    "fcp": "FCP",
+    "lcp": "LCP",
+    "route": "route",
+}
+
+
+def measure_step(driver, step, *args, settle_ms=100):
+    """
+    Runs `step(driver, *args)` and returns (wall-clock seconds, browser timing
+    dict). The timing dict has `kind` ("navigation" when the step ended on a
+    new document, "route" for an in-page route change, "restored" for a
+    back/forward cache hit) and the TIMING_FIELDS in milliseconds; fields the
+    browser did not record are None.
+    """
+    mark = driver.execute_script(MARK_SCRIPT)
+    start = time.perf_counter()
+    step(driver, *args)
+    wall = time.perf_counter() - start
+    timing = driver.execute_async_script(READ_TIMING_SCRIPT, mark, settle_ms)
+    return wall, timing
+
+
+def median_timing(timings):
+    """Field-wise median of several timing dicts of the same step (fields missing everywhere stay None)."""
+    errors = [timing["error"] for timing in timings if timing.get("error")]
+    if len(errors) == len(timings):
+        return {"error": errors[-1]}
+    combined = {"kind": [timing["kind"] for timing in timings if not timing.get("error")][-1]}
+    for field in TIMING_FIELDS:
+        values = [timing[field] for timing in timings if timing.get(field) is not None]
+        combined[field] = statistics.median(values) if values else None
+    return combined
+
+
+def format_timing(timing):
+    if timing.get("error"):
+        return f"unavailable ({timing['error']})"
+    parts = [f"{TIMING_LABELS[field]} {timing[field]:.0f}ms" for field in TIMING_FIELDS if timing.get(field) is not None]
+    return f"{timing['kind']}: " + (", ".join(parts) if parts else "no entries")
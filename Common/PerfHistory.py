@@ -0,0 +1,246 @@
+import argparse
+import functools
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import namedtuple
+
+from Common.Config import PROJECT_ROOT
+
+DEFAULT_DB = os.path.join(PROJECT_ROOT, "Results", "perf_history.sqlite3")
+REPORT_NAME = "perf_regressions.txt"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    commit_sha TEXT NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    commit_sha TEXT NOT NULL,
+    username TEXT NOT NULL,
+    step TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    value REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_series ON samples (username, step, metric, run_id);
+CREATE INDEX IF NOT EXISTS samples_by_commit ON samples (commit_sha);
+"""
+
+Regression = namedtuple("Regression", "username step metric current baseline slowdown method statistic runs")
+
+
+def db_path():
+    return os.environ.get("SAUCEDEMO_PERF_DB", DEFAULT_DB)
+
+
+def current_run_id():
+    """
+    One id for everything a test run records. master.sh exports
+    SAUCEDEMO_RUN_ID so every pytest shard shares it; a standalone pytest
+    invocation makes up its own (and passes it on to its subprocesses).
+    """
+    run_id = os.environ.get("SAUCEDEMO_RUN_ID")
+    if not run_id:
+        run_id = os.environ["SAUCEDEMO_RUN_ID"] = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+    return run_id
+
+
+@functools.lru_cache(maxsize=None)
+def current_commit():
+    """The commit under test, looked up once per process (record_samples() runs once per series)."""
+    commit = os.environ.get("SAUCEDEMO_COMMIT")
+    if commit:
+        return commit
+    try:
+        return subprocess.run(["git", "rev-parse", "--short=12", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def connect(path=None):
+    path = path or db_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Several pytest shards write at the same time; WAL plus a generous busy
+    # timeout lets them queue up instead of failing with "database is locked".
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def record_samples(username, step, metric, values, path=None):
+    """Stores one timing series (iteration order) for the current run and commit."""
+    run_id, commit, now = current_run_id(), current_commit(), time.time()
+    rows = [(run_id, commit, username, step, metric, iteration, float(value), now)
+            for iteration, value in enumerate(values) if value is not None]
+    if not rows:
+        return
+    connection = connect(path)
+    try:
+        with connection:
+            connection.execute("INSERT OR IGNORE INTO runs (run_id, commit_sha, started_at) VALUES (?, ?, ?)",
+                               (run_id, commit, now))
+            connection.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    finally:
+        connection.close()
+
+
+def mann_whitney_greater(current, baseline):
+    """
+    One-sided Mann-Whitney U test that `current` tends to be larger than
+    `baseline` (normal approximation with tie correction).
+
+    Returns:
+        (U, p-value)
+    """
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    index = 0
+    while index < len(combined):
+        end = index
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        for position in range(index, end + 1):
+            ranks[position] = (index + end) / 2 + 1
+        tied = end - index + 1
+        tie_term += tied ** 3 - tied
+        index = end + 1
+
+    n1, n2 = len(current), len(baseline)
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def robust_z(value, baseline):
+    """How many scaled median absolute deviations `value` sits above the baseline median."""
+    center = statistics.median(baseline)
+    mad = statistics.median(abs(sample - center) for sample in baseline) * 1.4826
+    if mad == 0:
+        return math.inf if value > center else 0.0
+    return (value - center) / mad
+
+
+def detect_regressions(connection, run_id, baseline_runs=10, min_runs=3, alpha=0.01, z_limit=3.5,
+                       min_slowdown=0.10, metric="wall"):
+    """
+    Compares every (user, step) series of `run_id` with the same series in
+    the `baseline_runs` runs before it. A series regresses when its median is
+    at least `min_slowdown` above the baseline median and the difference is
+    significant: a one-sided Mann-Whitney U test below `alpha` when both
+    sides have 5+ samples, otherwise a robust z-score of the current median
+    against the baseline runs' medians above `z_limit`.
+    """
+    started = connection.execute("SELECT started_at FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    if started is None:
+        raise ValueError(f"Unknown run {run_id!r}")
+    previous = [row[0] for row in connection.execute(
+        "SELECT run_id FROM runs WHERE started_at < ? ORDER BY started_at DESC LIMIT ?", (started[0], baseline_runs))]
+
+    regressions = []
+    series = connection.execute(
+        "SELECT DISTINCT username, step FROM samples WHERE run_id = ? AND metric = ?", (run_id, metric)).fetchall()
+    for username, step in series:
+        query = "SELECT value FROM samples WHERE run_id = ? AND username = ? AND step = ? AND metric = ?"
+        current = [row[0] for row in connection.execute(query, (run_id, username, step, metric))]
+        per_run = {}
+        for baseline_run in previous:
+            values = [row[0] for row in connection.execute(query, (baseline_run, username, step, metric))]
+            if values:
+                per_run[baseline_run] = values
+        if len(per_run) < min_runs:
+            continue
+
+        pooled = [value for values in per_run.values() for value in values]
+        current_median = statistics.median(current)
+        baseline_median = statistics.median(pooled)
+        slowdown = current_median / baseline_median - 1 if baseline_median > 0 else 0.0
+        if slowdown < min_slowdown:
+            continue
+
+        if len(current) >= 5 and len(pooled) >= 5:
+            statistic, p_value = mann_whitney_greater(current, pooled)
+            significant, method = p_value < alpha, f"Mann-Whitney p={p_value:.4f}"
+        else:
+            statistic = robust_z(current_median, [statistics.median(values) for values in per_run.values()])
+            significant, method = statistic > z_limit, f"robust z={statistic:.1f}"
+        if significant:
+            regressions.append(Regression(username, step, metric, current_median, baseline_median, slowdown,
+                                          method, statistic, len(per_run)))
+    return regressions
+
+
+def latest_run(connection):
+    row = connection.execute("SELECT run_id FROM runs ORDER BY started_at DESC LIMIT 1").fetchone()
+    return row[0] if row else None
+
+
+def report_path(db):
+    """The regression report is written next to the database it was computed from."""
+    return os.path.join(os.path.dirname(os.path.abspath(db)), REPORT_NAME)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check the latest performance run against a rolling baseline of earlier runs.")
+    parser.add_argument("--db", default=db_path(), help=f"History database (default {DEFAULT_DB}).")
+    parser.add_argument("--run", default=os.environ.get("SAUCEDEMO_RUN_ID"),
+                        help="Run to check (default: $SAUCEDEMO_RUN_ID, else the latest run).")
+    parser.add_argument("--baseline-runs", type=int, default=10, help="Earlier runs forming the baseline.")
+    parser.add_argument("--min-runs", type=int, default=3, help="Baseline runs needed before a series is judged.")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the Mann-Whitney test.")
+    parser.add_argument("--min-slowdown", type=float, default=0.10,
+                        help="Smallest relative slowdown of the median that counts (default 0.10 = 10%%).")
+    parser.add_argument("--metric", default="wall", help="Metric to check (default: wall-clock seconds).")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No performance history at {args.db}; nothing to check.")
+        return 0
+    connection = connect(args.db)
+    try:
+        run_id = args.run or latest_run(connection)
+        if run_id is None:
+            print("Performance history is empty; nothing to check.")
+            return 0
+        try:
+            regressions = detect_regressions(connection, run_id, args.baseline_runs, args.min_runs, args.alpha,
+                                             min_slowdown=args.min_slowdown, metric=args.metric)
+        except ValueError as e:
+            print(f"{e}; nothing to check.")
+            return 0
+    finally:
+        connection.close()
+
+    lines = [f"Performance regression check for run {run_id} ({args.metric}):"]
+    for regression in regressions:
+        lines.append(f"  REGRESSION {regression.username} / {regression.step}: median {regression.current:.3f} "
+                     f"vs baseline {regression.baseline:.3f} (+{regression.slowdown:.0%}, {regression.method}, "
+                     f"{regression.runs} baseline runs)")
+    if not regressions:
+        lines.append("  no significant slowdowns")
+    report_file = report_path(args.db)
+    with open(report_file, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    print("\n".join(lines))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
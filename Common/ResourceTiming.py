@@ -0,0 +1,96 @@
+import json
+import os
+from urllib.parse import urlsplit
+
+from Common.Config import PROJECT_ROOT
+
+DEFAULT_BUDGETS_FILE = os.path.join(PROJECT_ROOT, "Performance", "Compiled", "ResourceBudgets.json")
+BUDGET_KEYS = ["requests", "transfer_bytes", "decoded_bytes"]
+
+# Returns the Resource Timing entries recorded since the previous call in the
+# same document (all of them after a navigation), with every phase broken out,
+# plus the navigation entry of a document that was not collected yet. Phases
+# are milliseconds; a phase the browser did not go through (cached resource,
+# reused connection) is 0.
+COLLECT_RESOURCES_SCRIPT = """
+const phases = entry => ({
+    name: entry.name,
+    type: entry.initiatorType || entry.entryType,
+    start: entry.startTime,
+    duration: entry.duration,
+    redirect: entry.redirectEnd - entry.redirectStart,
+    dns: entry.domainLookupEnd - entry.domainLookupStart,
+    connect: entry.connectEnd - entry.connectStart,
+    tls: entry.secureConnectionStart > 0 ? entry.connectEnd - entry.secureConnectionStart : 0,
+    wait: entry.responseStart > 0 ? entry.responseStart - entry.requestStart : 0,
+    download: entry.responseStart > 0 ? entry.responseEnd - entry.responseStart : 0,
+    transfer_bytes: entry.transferSize || 0,
+    encoded_bytes: entry.encodedBodySize || 0,
+    decoded_bytes: entry.decodedBodySize || 0,
+});
+if (performance.setResourceTimingBufferSize && !window.__resourceCursor) {
+    performance.setResourceTimingBufferSize(1000);
+}
+const entries = performance.getEntriesByType("resource");
+const cursor = window.__resourceCursor || 0;
+window.__resourceCursor = entries.length;
+const navigation = performance.getEntriesByType("navigation")[0];
+const fresh = !window.__documentCollected;
+window.__documentCollected = true;
+return {
+    url: location.href,
+    document: fresh && navigation ? phases(navigation) : null,
+    resources: entries.slice(cursor).map(phases),
+};
+"""
+
+
+def page_name(url):
+    """Budget key of a page: the last path segment, e.g. "inventory.html"; the login page is "index"."""
+    return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1] or "index"
+
+
+def collect_resources(driver):
+    """
+    Returns everything the page downloaded since the last call as
+    {"url", "page", "document", "resources", "totals"}; `document` is the
+    navigation entry when the page is a new document, else None.
+    """
+    record = driver.execute_script(COLLECT_RESOURCES_SCRIPT)
+    record["page"] = page_name(record["url"])
+    entries = record["resources"] + ([record["document"]] if record["document"] else [])
+    record["totals"] = {
+        "requests": len(entries),
+        "transfer_bytes": sum(entry["transfer_bytes"] for entry in entries),
+        "decoded_bytes": sum(entry["decoded_bytes"] for entry in entries),
+    }
+    return record
+
+
+def load_budgets(path=None):
+    """
+    Budgets are {page name or "default": {budget key: limit}}; a page's own
+    limits override the defaults key by key.
+    """
+    with open(path or DEFAULT_BUDGETS_FILE) as f:
+        return json.load(f)
+
+
+def budget_for(budgets, page):
+    limits = dict(budgets.get("default", {}))
+    limits.update(budgets.get(page, {}))
+    return limits
+
+
+def check_budgets(record, budgets):
+    """Returns one message per budget the collected page went over."""
+    limits = budget_for(budgets, record["page"])
+    return [f"{record['page']}: {key} {record['totals'][key]} over budget {limit}"
+            for key, limit in limits.items() if key in BUDGET_KEYS and record["totals"][key] > limit]
+
+
+def write_waterfall(path, test_case_id, username, steps):
+    """Saves the per-step resource records of one test case as JSON."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"test_case": test_case_id, "username": username, "steps": steps}, f, indent=2)
@@ -0,0 +1,189 @@
+import atexit
+import glob
+import json
+import os
+import shutil
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+from Common.Config import PROJECT_ROOT
+from Common.PerfHistory import current_run_id
+
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "Results")
+PARTS_DIR = os.path.join(RESULTS_DIR, "Parts")
+RESULTS_JSONL = os.path.join(RESULTS_DIR, "results.jsonl")
+RESULTS_JUNIT = os.path.join(RESULTS_DIR, "results-junit.xml")
+
+# Set by Common.ShardRunner on its pytest workers: they only write their part
+# files and the runner merges all of them once every shard has finished.
+DEFER_MERGE_ENV = "SAUCEDEMO_RESULTS_DEFER_MERGE"
+
+FAILED_PREFIXES = ("Fail", "Error", "[FAIL]", "❌")
+
+
+def result_path(*parts):
+    """Absolute path of a file under the checkout, e.g. result_path("Security", "Compiled", "Results", "x.txt")."""
+    return os.path.join(PROJECT_ROOT, *parts)
+
+
+def _failed(value):
+    text = str(value).strip()
+    return text.startswith(FAILED_PREFIXES) or "❌" in text
+
+
+class ResultsSink:
+    """
+    Collects result records in memory and appends them to this process's own
+    part file (Results/Parts/<run>/<pid>.jsonl) when flushed, so concurrent
+    workers never write to the same file. merge() turns all part files of a
+    run into Results/results.jsonl, Results/results-junit.xml and the text
+    reports, which are rendered from the records.
+    """
+
+    def __init__(self):
+        self._records = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def add(self, report, text, test="", result="", **fields):
+        """
+        Buffers one record.
+
+        Args:
+            report: Text report it belongs to, relative to the checkout
+                (e.g. "Functionality/Compiled/Results/LoginLogout.txt").
+            text: Exactly what the record contributes to that report.
+            test, result: Test case id and its outcome, for JUnit and queries.
+            fields: Any further structured data kept in the JSONL record.
+        """
+        with self._lock:
+            self._seq += 1
+            self._records.append({
+                "run": current_run_id(),
+                "report": report,
+                "test": test,
+                "result": result,
+                "failed": bool(result) and _failed(result),
+                "nodeid": os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0],
+                "pid": os.getpid(),
+                "seq": self._seq,
+                "time": time.time(),
+                "text": text,
+                **fields,
+            })
+
+    def flush(self):
+        with self._lock:
+            records, self._records = self._records, []
+        if not records:
+            return
+        part = os.path.join(PARTS_DIR, current_run_id(), f"{os.getpid()}.jsonl")
+        os.makedirs(os.path.dirname(part), exist_ok=True)
+        with open(part, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+
+sink = ResultsSink()
+atexit.register(sink.flush)
+
+
+class Report:
+    """The result writer of one module; every call buffers a record instead of opening the file."""
+
+    def __init__(self, *path):
+        self.name = "/".join(path)
+
+    def write(self, test_id, result, details="", note=""):
+        """
+        `test_id: result` on one line, ` - note` appended when given, and a
+        Details block after failures that carry details.
+        """
+        text = f"{test_id}: {result}" + (f" - {note}" if note else "") + "\n"
+        if result == "Fail" and details:
+            text += f"Details:\n{details}\n\n"
+        sink.add(self.name, text, test_id, result, details=details, note=note)
+
+    def block_break(self):
+        """An empty line between the blocks of two test cases."""
+        sink.add(self.name, "\n")
+
+    def write_group(self, test_id, results):
+        """An `=== test_id ===` block with one `step: result` line per entry."""
+        text = f"\n=== {test_id} ===\n" + "".join(f"{step}: {result}\n" for step, result in results.items()) + "\n"
+        failed = any(_failed(result) for result in results.values())
+        sink.add(self.name, text, test_id, "Fail" if failed else "Pass", steps=results)
+
+    def write_text(self, test_id, result, text):
+        """A record whose report text the module formats itself."""
+        sink.add(self.name, text, test_id, result)
+
+
+def read_parts(run_id):
+    records = []
+    for part in sorted(glob.glob(os.path.join(PARTS_DIR, run_id, "*.jsonl"))):
+        with open(part, encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    records.sort(key=lambda record: (record["time"], record["pid"], record["seq"]))
+    return records
+
+
+def write_junit(records, path):
+    suites = {}
+    for record in records:
+        if record["test"]:
+            suites.setdefault(record["report"], []).append(record)
+    root = ET.Element("testsuites")
+    for report, cases in suites.items():
+        failures = sum(1 for case in cases if case["failed"])
+        suite = ET.SubElement(root, "testsuite", name=report, tests=str(len(cases)), failures=str(failures))
+        for case in cases:
+            element = ET.SubElement(suite, "testcase", classname=report, name=case["test"])
+            if case["failed"]:
+                failure = ET.SubElement(element, "failure", message=str(case["result"])[:200])
+                failure.text = case["text"]
+    root.set("tests", str(sum(len(cases) for cases in suites.values())))
+    root.set("failures", str(sum(1 for cases in suites.values() for case in cases if case["failed"])))
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def render_reports(records, run_id):
+    """
+    Appends the run's records to every text report they belong to, in the
+    order they were made, under a header naming the run. Earlier runs stay
+    in the reports, as they did when modules appended to them directly.
+    """
+    reports = {}
+    for record in records:
+        reports.setdefault(record["report"], []).append(record["text"])
+    for report, texts in reports.items():
+        path = result_path(*report.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"\n##### Run {run_id} #####\n" + "".join(texts))
+    return sorted(reports)
+
+
+def merge(run_id=None):
+    """
+    Merges every part file of the run into the views and removes the parts:
+    the records are appended to results.jsonl and the text reports, and
+    results-junit.xml holds this run alone. Returns the number of records merged.
+    """
+    run_id = run_id or current_run_id()
+    sink.flush()
+    records = read_parts(run_id)
+    if not records:
+        return 0
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(RESULTS_JSONL, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+    write_junit(records, RESULTS_JUNIT)
+    render_reports(records, run_id)
+    shutil.rmtree(os.path.join(PARTS_DIR, run_id), ignore_errors=True)
+    return len(records)
+
+
+def merge_deferred():
+    """Whether this process leaves merging to a parent (see DEFER_MERGE_ENV)."""
+    return bool(os.environ.get(DEFER_MERGE_ENV))
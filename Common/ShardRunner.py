@@ -0,0 +1,95 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from Common import Results
+from Common.Config import PROJECT_ROOT
+from Common.PerfHistory import current_run_id
+
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "Results")
+SHARDS_DIR = os.path.join(RESULTS_DIR, "Shards")
+MERGED_JUNIT = os.path.join(RESULTS_DIR, "pytest-junit.xml")
+
+# pytest exit code for "no tests collected"; an empty shard is not a failure.
+NO_TESTS_COLLECTED = 5
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Run the pytest suites sharded across several processes, each with its own headless Firefox.")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count).")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER,
+                        help="Test paths and extra arguments passed through to pytest.")
+    return parser.parse_args(argv)
+
+
+def start_shard(index, workers, pytest_args):
+    log_path = os.path.join(SHARDS_DIR, f"shard-{index}.log")
+    junit_path = os.path.join(SHARDS_DIR, f"shard-{index}.xml")
+    command = [
+        sys.executable, "-m", "pytest", *pytest_args,
+        "--shard-count", str(workers), "--shard-index", str(index),
+        "--headless", f"--junitxml={junit_path}",
+    ]
+    # The shards share the run id and only write their result part files;
+    # main() merges them once every shard is done.
+    env = dict(os.environ, SAUCEDEMO_RUN_ID=current_run_id(), **{Results.DEFER_MERGE_ENV: "1"})
+    log = open(log_path, "w")
+    process = subprocess.Popen(command, cwd=PROJECT_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    return {"index": index, "process": process, "log": log, "log_path": log_path,
+            "junit_path": junit_path, "started": time.perf_counter()}
+
+
+def merge_junit(junit_paths, output_path):
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    for path in junit_paths:
+        if not os.path.exists(path):
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            merged.append(suite)
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    ET.ElementTree(merged).write(output_path, encoding="utf-8", xml_declaration=True)
+    return totals
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    workers = max(1, args.workers)
+    os.makedirs(SHARDS_DIR, exist_ok=True)
+
+    print(f"Running tests across {workers} shard(s), logs in {SHARDS_DIR}")
+    started = time.perf_counter()
+    shards = [start_shard(i, workers, args.pytest_args) for i in range(workers)]
+
+    exit_code = 0
+    for shard in shards:
+        code = shard["process"].wait()
+        shard["log"].close()
+        elapsed = time.perf_counter() - shard["started"]
+        status = "ok" if code in (0, NO_TESTS_COLLECTED) else f"FAILED (exit {code})"
+        print(f"  shard {shard['index']}: {status} in {elapsed:.1f}s -> {shard['log_path']}")
+        if code not in (0, NO_TESTS_COLLECTED):
+            exit_code = exit_code or code
+
+    totals = merge_junit([shard["junit_path"] for shard in shards], MERGED_JUNIT)
+    wall_clock = time.perf_counter() - started
+    print(f"{totals['tests']} tests, {totals['failures']} failures, {totals['errors']} errors, "
+          f"{totals['skipped']} skipped in {wall_clock:.1f}s wall clock")
+    print(f"Merged JUnit report: {MERGED_JUNIT}")
+    records = Results.merge()
+    print(f"Merged {records} result records: {Results.RESULTS_JSONL}, {Results.RESULTS_JUNIT}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
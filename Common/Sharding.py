@@ -0,0 +1,25 @@
+def module_of(nodeid):
+    return nodeid.split("::", 1)[0]
+
+
+def assign_shards(nodeids, shard_count):
+    """
+    Splits test ids into `shard_count` groups, keeping every module together
+    because several modules carry state from one test to the next (e.g. the
+    standard_user baselines in UIColorFont_test.py). Modules are handed out
+    largest first to the currently lightest shard, which keeps shard sizes
+    close without knowing test durations.
+    """
+    modules = {}
+    for nodeid in nodeids:
+        modules.setdefault(module_of(nodeid), []).append(nodeid)
+
+    shards = [[] for _ in range(shard_count)]
+    for module in sorted(modules, key=lambda m: (-len(modules[m]), m)):
+        lightest = min(range(shard_count), key=lambda i: (len(shards[i]), i))
+        shards[lightest].extend(modules[module])
+    return shards
+
+
+def shard_modules(nodeids, shard_count, shard_index):
+    return {module_of(nodeid) for nodeid in assign_shards(nodeids, shard_count)[shard_index]}
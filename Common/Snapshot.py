@@ -0,0 +1,53 @@
+# Reads everything the inventory, cart and checkout assertions look at in one
+# script execution, instead of a find_element + .text round trip per field.
+# Text is innerText with surrounding whitespace trimmed, like WebElement.text.
+SNAPSHOT_SCRIPT = """
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+const items = Array.from(document.querySelectorAll(".inventory_item, .cart_item")).map(item => {
+    const button = item.querySelector("button");
+    const image = item.querySelector("img");
+    return {
+        name: text(item, ".inventory_item_name"),
+        description: text(item, ".inventory_item_desc"),
+        price: text(item, ".inventory_item_price"),
+        quantity: text(item, ".cart_quantity"),
+        button_id: button ? button.id : null,
+        button_text: button ? button.innerText.trim() : null,
+        image_src: image ? image.src : null,
+    };
+});
+const badge = text(document, ".shopping_cart_badge");
+return {
+    url: window.location.href,
+    title: text(document, ".title"),
+    items: items,
+    badge: badge,
+    badge_count: badge ? parseInt(badge, 10) : 0,
+    sort: (document.querySelector(".product_sort_container") || {}).value || null,
+    summary: {
+        subtotal: text(document, ".summary_subtotal_label"),
+        tax: text(document, ".summary_tax_label"),
+        total: text(document, ".summary_total_label"),
+    },
+    error: text(document, "[data-test='error']"),
+};
+"""
+
+
+def snapshot(driver):
+    """
+    Returns the structured state of the current page as a dict: `items` (one
+    dict per .inventory_item or .cart_item with name, description, price,
+    quantity, button_id, button_text and image_src), the cart `badge` text and
+    `badge_count`, the checkout `summary` labels, page `title`, `sort` value
+    and login `error`. Missing fields are None.
+    """
+    return driver.execute_script(SNAPSHOT_SCRIPT)
+
+
+def parse_price(text):
+    """'$29.99' or 'Item total: $29.99' -> 29.99"""
+    return float(text.split("$")[1])
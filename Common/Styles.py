@@ -0,0 +1,54 @@
+TEXT_ELEMENTS = "h1, h2, h3, p, span, button, label, a"
+FONT_PROPERTIES = ["font-family", "font-size"]
+STYLE_PROPERTIES = ["font-family", "font-size", "color", "background-color"]
+
+# Computed styles for every element matching a selector, in document order, in
+# one script execution. With textOnly, elements without visible text are
+# skipped, which is what filtering on WebElement.text used to do.
+COLLECT_STYLES_SCRIPT = """
+const [selector, properties, textOnly] = arguments;
+const visible = el => el.checkVisibility
+    ? el.checkVisibility({opacityProperty: true, visibilityProperty: true})
+    : el.getClientRects().length > 0;
+const rows = [];
+for (const el of document.querySelectorAll(selector)) {
+    if (textOnly && !(visible(el) && el.innerText.trim())) {
+        continue;
+    }
+    const style = window.getComputedStyle(el);
+    const row = {};
+    for (const property of properties) {
+        row[property] = style.getPropertyValue(property);
+    }
+    rows.push(row);
+}
+return rows;
+"""
+
+# One computed style property of the first element matching each selector;
+# null where nothing matches.
+FIRST_STYLES_SCRIPT = """
+const wanted = arguments[0];
+const values = {};
+for (const [name, [selector, property]] of Object.entries(wanted)) {
+    const el = document.querySelector(selector);
+    values[name] = el ? window.getComputedStyle(el).getPropertyValue(property) : null;
+}
+return values;
+"""
+
+
+def collect_styles(driver, selector=TEXT_ELEMENTS, properties=STYLE_PROPERTIES, text_only=True):
+    """Returns one {property: value} dict per matching element, for the whole page in one round trip."""
+    return driver.execute_script(COLLECT_STYLES_SCRIPT, selector, list(properties), text_only)
+
+
+def first_styles(driver, wanted):
+    """
+    Args:
+        wanted: {name: (css selector, css property)}
+
+    Returns:
+        {name: computed value of the property on the first match, or None}
+    """
+    return driver.execute_script(FIRST_STYLES_SCRIPT, {name: list(spec) for name, spec in wanted.items()})
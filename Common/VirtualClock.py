@@ -0,0 +1,83 @@
+import time
+
+# Shifts the page's Date by a fixed offset. Re-running it replaces the offset
+# instead of stacking another shift; the real Date is kept on the window so
+# the shim can be installed again after every navigation.
+CLOCK_SCRIPT = """
+const offsetMs = arguments[0];
+const RealDate = window.__realDate || (window.__realDate = Date);
+class VirtualDate extends RealDate {
+    constructor(...args) {
+        if (args.length === 0) {
+            super(RealDate.now() + offsetMs);
+        } else {
+            super(...args);
+        }
+    }
+    static now() {
+        return RealDate.now() + offsetMs;
+    }
+}
+window.Date = VirtualDate;
+window.__virtualClockOffset = offsetMs;
+return offsetMs;
+"""
+
+
+class VirtualClock:
+    """
+    Lets a test skip ahead in time instead of sleeping. advance(seconds)
+    ages every cookie of the current site by that much (a cookie whose
+    expiry falls behind the real clock is dropped, exactly as the browser
+    would have done after waiting) and moves the page's Date forward, so
+    the app sees the session as if the time had really passed.
+
+    Only expiry that the app reads from cookies or Date is covered; a server
+    holding its own session clock still needs a real-time run.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.offset = 0.0
+
+    def now(self):
+        """Current virtual time as a Unix timestamp."""
+        return time.time() + self.offset
+
+    def install(self):
+        """(Re)applies the Date offset to the current document; call after every navigation."""
+        self.driver.execute_script(CLOCK_SCRIPT, int(self.offset * 1000))
+
+    def get(self, url):
+        """
+        Loads `url` and shifts its Date. Navigate through here after
+        advance(): a plain driver.get() lands on a page with the real clock.
+        Scripts that ran while the page was loading still saw the real Date.
+        """
+        self.driver.get(url)
+        self.install()
+
+    def advance(self, seconds):
+        """
+        Returns:
+            Names of the cookies that expired during the jump.
+        """
+        self.offset += seconds
+        expired = self._age_cookies(seconds)
+        self.install()
+        return expired
+
+    def _age_cookies(self, seconds):
+        now = time.time()
+        expired = []
+        for cookie in self.driver.get_cookies():
+            if "expiry" not in cookie:
+                # Session cookies live until the browser closes, not for a duration.
+                continue
+            self.driver.delete_cookie(cookie["name"])
+            cookie["expiry"] = int(cookie["expiry"] - seconds)
+            if cookie["expiry"] <= now:
+                expired.append(cookie["name"])
+            else:
+                self.driver.add_cookie(cookie)
+        return expired
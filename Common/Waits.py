@@ -0,0 +1,315 @@
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+
+# Longest single in-page wait. Longer timeouts are split into several calls,
+# each also kept SCRIPT_TIMEOUT_MARGIN below the session's script timeout
+# (30s by default) so no call runs into it.
+MAX_SCRIPT_WAIT = 20.0
+SCRIPT_TIMEOUT_MARGIN = 0.5
+
+# True while the document that ran WAIT_SCRIPT is still loaded: the script
+# installs window.__sauceWaits, which a newly navigated document lacks.
+SAME_DOCUMENT_SCRIPT = "return !!window.__sauceWaits;"
+
+# Evaluates a condition inside the page and calls back as soon as it holds.
+# Re-evaluation is triggered by DOM mutations, URL changes (history API,
+# popstate, hashchange), transition/animation ends, network activity and
+# timers; a slow fallback poll covers anything else (e.g. layout-only changes).
+# Installs a small network tracker on first use so "network idle" can be
+# answered without polling.
+WAIT_SCRIPT = r"""
+const [spec, timeoutMs, fallbackMs] = arguments;
+const done = arguments[arguments.length - 1];
+
+const w = window;
+if (!w.__sauceWaits) {
+    const state = w.__sauceWaits = {inflight: 0, lastActivity: performance.now(), target: new EventTarget()};
+    const changed = () => state.target.dispatchEvent(new Event("change"));
+    const begin = () => { state.inflight++; state.lastActivity = performance.now(); changed(); };
+    const end = () => { state.inflight = Math.max(0, state.inflight - 1); state.lastActivity = performance.now(); changed(); };
+    for (const method of ["pushState", "replaceState"]) {
+        const original = history[method];
+        history[method] = function () { const result = original.apply(this, arguments); changed(); return result; };
+    }
+    if (w.fetch) {
+        const originalFetch = w.fetch;
+        w.fetch = function () {
+            begin();
+            return originalFetch.apply(this, arguments).finally(end);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener("loadend", end, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+    if (w.PerformanceObserver) {
+        try {
+            new PerformanceObserver(() => { state.lastActivity = performance.now(); changed(); })
+                .observe({type: "resource", buffered: false});
+        } catch (e) {}
+    }
+}
+const state = w.__sauceWaits;
+
+const find = (by, value) => {
+    switch (by) {
+        case "id": return document.getElementById(value);
+        case "class name": return document.getElementsByClassName(value)[0] || null;
+        case "tag name": return document.getElementsByTagName(value)[0] || null;
+        case "name": return document.getElementsByName(value)[0] || null;
+        case "xpath": return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        default: return document.querySelector(value);
+    }
+};
+const visible = el => {
+    if (!el || !el.isConnected) return false;
+    if (el.checkVisibility && !el.checkVisibility({opacityProperty: true, visibilityProperty: true})) return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+const text = el => (el.innerText || el.textContent || "").trim();
+
+let idleTimer = null;
+const evaluate = spec => {
+    const el = spec.by ? find(spec.by, spec.value) : null;
+    switch (spec.kind) {
+        case "present": return el ? {ok: true, value: el} : null;
+        case "visible": return visible(el) ? {ok: true, value: el} : null;
+        case "clickable": return visible(el) && !el.disabled ? {ok: true, value: el} : null;
+        case "invisible": return !visible(el) ? {ok: true, value: true} : null;
+        case "text": return el && text(el) === spec.text ? {ok: true, value: el} : null;
+        case "value": return el && el.value === spec.text ? {ok: true, value: el} : null;
+        case "url_contains": return location.href.includes(spec.text) ? {ok: true, value: location.href} : null;
+        case "url_not_contains": return !location.href.includes(spec.text) ? {ok: true, value: location.href} : null;
+        case "url_is": return location.href === spec.text ? {ok: true, value: location.href} : null;
+        case "url_changes": return location.href !== spec.text ? {ok: true, value: location.href} : null;
+        case "network_idle": {
+            if (document.readyState !== "complete" || state.inflight > 0) return null;
+            const quiet = performance.now() - state.lastActivity;
+            if (quiet >= spec.idleMs) return {ok: true, value: true};
+            clearTimeout(idleTimer);
+            idleTimer = setTimeout(attempt, spec.idleMs - quiet + 1);
+            return null;
+        }
+        case "any": {
+            for (let i = 0; i < spec.of.length; i++) {
+                const result = evaluate(spec.of[i]);
+                if (result) return {ok: true, value: result.value, index: i};
+            }
+            return null;
+        }
+    }
+    throw new Error("unknown wait condition " + spec.kind);
+};
+
+let finished = false;
+let observer = null, timer = null, poll = null;
+const events = ["popstate", "hashchange", "load", "transitionend", "animationend"];
+const finish = result => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(idleTimer);
+    clearInterval(poll);
+    for (const name of events) w.removeEventListener(name, attempt, true);
+    document.removeEventListener("readystatechange", attempt);
+    state.target.removeEventListener("change", attempt);
+    done(result);
+};
+function attempt() {
+    if (finished) return;
+    let result;
+    try {
+        result = evaluate(spec);
+    } catch (e) {
+        return finish({ok: false, error: String(e)});
+    }
+    if (result) finish(result);
+}
+
+attempt();
+if (!finished) {
+    observer = new MutationObserver(attempt);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    for (const name of events) w.addEventListener(name, attempt, true);
+    document.addEventListener("readystatechange", attempt);
+    state.target.addEventListener("change", attempt);
+    poll = setInterval(attempt, fallbackMs);
+    timer = setTimeout(() => finish({ok: false}), timeoutMs);
+}
+"""
+
+WaitRecord = namedtuple("WaitRecord", "description seconds ok test site")
+
+_records = []
+_records_lock = threading.Lock()
+
+
+Condition = namedtuple("Condition", "spec description")
+
+
+def _locator_spec(kind, locator, text=None):
+    by, value = locator
+    return {"kind": kind, "by": by, "value": value, "text": text}
+
+
+def present(locator):
+    return Condition(_locator_spec("present", locator), f"present {locator[1]}")
+
+
+def visible(locator):
+    return Condition(_locator_spec("visible", locator), f"visible {locator[1]}")
+
+
+def clickable(locator):
+    return Condition(_locator_spec("clickable", locator), f"clickable {locator[1]}")
+
+
+def invisible(locator):
+    return Condition(_locator_spec("invisible", locator), f"invisible {locator[1]}")
+
+
+def text_is(locator, text):
+    return Condition(_locator_spec("text", locator, text), f"text of {locator[1]} is {text!r}")
+
+
+def value_is(locator, value):
+    return Condition(_locator_spec("value", locator, value), f"value of {locator[1]} is {value!r}")
+
+
+def url_contains(fragment):
+    return Condition({"kind": "url_contains", "text": fragment}, f"url contains {fragment!r}")
+
+
+def url_not_contains(fragment):
+    return Condition({"kind": "url_not_contains", "text": fragment}, f"url leaves {fragment!r}")
+
+
+def url_is(url):
+    return Condition({"kind": "url_is", "text": url}, f"url is {url!r}")
+
+
+def url_changes(from_url):
+    return Condition({"kind": "url_changes", "text": from_url}, f"url changes from {from_url!r}")
+
+
+def network_idle(idle_ms=250):
+    """No fetch/XHR in flight, the document loaded, and no resource activity for `idle_ms`."""
+    return Condition({"kind": "network_idle", "idleMs": idle_ms}, f"network idle {idle_ms}ms")
+
+
+def any_of(*conditions):
+    return Condition({"kind": "any", "of": [c.spec for c in conditions]},
+                     " or ".join(c.description for c in conditions))
+
+
+def _call_site():
+    frame = sys._getframe(1)
+    while frame and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+
+def record_wait(description, seconds, ok):
+    test = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0]
+    with _records_lock:
+        _records.append(WaitRecord(description, seconds, ok, test, _call_site()))
+
+
+def wait_records():
+    with _records_lock:
+        return list(_records)
+
+
+class Wait:
+    """
+    Drop-in for WebDriverWait(driver, timeout).until(...) with in-page
+    conditions from this module: the browser reports back the moment the
+    condition holds instead of being polled every 500ms. Every wait is
+    recorded with the time it actually blocked.
+    """
+
+    def __init__(self, driver, timeout=10, fallback_poll=0.25):
+        self.driver = driver
+        self.timeout = timeout
+        self.fallback_poll = fallback_poll
+
+    def _max_chunk(self):
+        """Longest in-page wait one call may take under the session's script timeout."""
+        script_timeout = self.driver.timeouts.script
+        if script_timeout is None:
+            # A null script timeout never expires.
+            return MAX_SCRIPT_WAIT
+        return min(MAX_SCRIPT_WAIT, max(script_timeout - SCRIPT_TIMEOUT_MARGIN, script_timeout / 2))
+
+    def _navigated(self):
+        try:
+            return not self.driver.execute_script(SAME_DOCUMENT_SCRIPT)
+        except WebDriverException:
+            return False
+
+    def _wait(self, condition):
+        deadline = time.perf_counter() + self.timeout
+        max_chunk = self._max_chunk()
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            chunk = min(remaining, max_chunk)
+            try:
+                result = self.driver.execute_async_script(
+                    WAIT_SCRIPT, condition.spec, int(chunk * 1000), int(self.fallback_poll * 1000))
+            except JavascriptException:
+                # A navigation tore down the document the script was waiting
+                # in; evaluate again in the new one.
+                if self._navigated():
+                    continue
+                raise
+            if result and result.get("ok"):
+                return result
+            if result and result.get("error"):
+                raise WebDriverException(f"Wait for {condition.description} failed: {result['error']}")
+
+    def until(self, condition, message=""):
+        """Returns the condition's value (the element for element conditions) or raises TimeoutException."""
+        started = time.perf_counter()
+        result = self._wait(condition)
+        record_wait(condition.description, time.perf_counter() - started, result is not None)
+        if result is None:
+            raise TimeoutException(message or f"Timed out after {self.timeout}s waiting for {condition.description}")
+        return result.get("value")
+
+    def poll(self, condition):
+        """Like until(), but returns None instead of raising on timeout."""
+        try:
+            return self.until(condition)
+        except TimeoutException:
+            return None
+
+
+def slowest_waits(count=10):
+    return sorted(wait_records(), key=lambda record: record.seconds, reverse=True)[:count]
+
+
+def wait_summary(count=10):
+    records = wait_records()
+    if not records:
+        return []
+    total = sum(record.seconds for record in records)
+    timed_out = sum(1 for record in records if not record.ok)
+    lines = [f"{len(records)} waits blocked {total:.1f}s in total ({timed_out} timed out); slowest:"]
+    for record in slowest_waits(count):
+        status = "" if record.ok else " [timed out]"
+        where = record.test or record.site
+        lines.append(f"  {record.seconds:6.2f}s  {record.description}{status}  ({where}, {record.site})")
+    return lines
@@ -1,10 +1,11 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
-import os
+
+from Common.Auth import login
+from Common.Snapshot import parse_price, snapshot
+from Common.Waits import Wait, clickable, invisible, text_is, value_is
+from Common.Results import Report
 
 expected_product_details = {
     "Sauce Labs Backpack": {
@@ -33,40 +34,19 @@ expected_product_details = {
     },
 }
 
-results_file_path = os.path.expanduser("~/Official-SauceDemo/Functionality/Compiled/Results/ProductBrowsing.txt")
-os.makedirs(os.path.dirname(results_file_path), exist_ok=True)
-
-@pytest.fixture(scope="session")
-def driver():
-    driver = webdriver.Firefox()
-    yield driver
-    driver.quit()
-
-def login(driver, username, password):
-    driver.get("https://www.saucedemo.com/")
-    username_field = driver.find_element(By.ID, "user-name")
-    password_field = driver.find_element(By.ID, "password")
-    login_button = driver.find_element(By.ID, "login-button")
-    username_field.send_keys(username)
-    password_field.send_keys(password)
-    login_button.click()
-    WebDriverWait(driver, 10).until(EC.url_contains("inventory.html"))
+results = Report("Functionality", "Compiled", "Results", "ProductBrowsing.txt")
 
 def verify_product_details(driver):
     errors = {}
-    product_items = driver.find_elements(By.CLASS_NAME, "inventory_item")
+    product_items = snapshot(driver)["items"]
 
     if len(product_items) != len(expected_product_details):
         errors["product_count"] = f"Number of products does not match expected. Expected: {len(expected_product_details)}, Actual: {len(product_items)}"
 
     for item in product_items:
-        name_element = item.find_element(By.CLASS_NAME, "inventory_item_name")
-        desc_element = item.find_element(By.CLASS_NAME, "inventory_item_desc")
-        price_element = item.find_element(By.CLASS_NAME, "inventory_item_price")
-
-        actual_name = name_element.text
-        actual_description = desc_element.text.strip()
-        actual_price = price_element.text
+        actual_name = item["name"]
+        actual_description = item["description"]
+        actual_price = item["price"]
 
         if actual_name in expected_product_details:
             expected = expected_product_details[actual_name]
@@ -95,6 +75,7 @@ def verify_product_details(driver):
         ("FP_05", "visual_user"),
     ],
 )
+@pytest.mark.roundtrip_budget(commands=25)
 def test_verify_product_details_for_user(driver, test_id, username):
     login(driver, username, "secret_sauce")
     print(f"\nExecuting Test Case ID: {test_id} for user: {username}")
@@ -114,36 +95,34 @@ def test_verify_product_details_for_user(driver, test_id, username):
 
     print(f"{test_id} ({username}): {result_string}\n")
 
-    with open(results_file_path, "a") as f:
-        f.write(f"{test_id} ({username}): {result_string}\n\n")
+    results.write_text(test_id, "Fail" if errors else "Pass", f"{test_id} ({username}): {result_string}\n\n")
 
     if errors:
         pytest.fail(result_string)
 
 def reset_app_state(driver):
     driver.find_element(By.ID, "react-burger-menu-btn").click()
-    WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "reset_sidebar_link"))).click()
+    Wait(driver, 10).until(clickable((By.ID, "reset_sidebar_link"))).click()
     driver.find_element(By.ID, "react-burger-cross-btn").click()
 
 def get_product_names(driver):
-    product_name_elements = driver.find_elements(By.CLASS_NAME, "inventory_item_name")
-    return [element.text for element in product_name_elements]
+    return [item["name"] for item in snapshot(driver)["items"]]
 
 def verify_sorting(driver, sort_option):
     sort_dropdown = Select(driver.find_element(By.CLASS_NAME, "product_sort_container"))
     sort_dropdown.select_by_value(sort_option)
-    WebDriverWait(driver, 5).until(lambda d: Select(d.find_element(By.CLASS_NAME, "product_sort_container")).first_selected_option.get_attribute("value") == sort_option)
-    product_names = get_product_names(driver)
+    Wait(driver, 5).until(value_is((By.CLASS_NAME, "product_sort_container"), sort_option))
+    items = snapshot(driver)["items"]
+    product_names = [item["name"] for item in items]
+    prices = [parse_price(item["price"]) for item in items]
 
     if sort_option == "az":
         assert product_names == sorted(product_names), "Sorting A to Z failed."
     elif sort_option == "za":
         assert product_names == sorted(product_names, reverse=True), "Sorting Z to A failed."
     elif sort_option == "lohi":
-        prices = [float(p.text.replace("$", "")) for p in driver.find_elements(By.CLASS_NAME, "inventory_item_price")]
         assert prices == sorted(prices), "Sorting Low to High failed."
     elif sort_option == "hilo":
-        prices = [float(p.text.replace("$", "")) for p in driver.find_elements(By.CLASS_NAME, "inventory_item_price")]
         assert prices == sorted(prices, reverse=True), "Sorting High to Low failed."
 
 def add_all_items_to_cart(driver):
@@ -151,20 +130,14 @@ def add_all_items_to_cart(driver):
     add_to_cart_buttons = driver.find_elements(By.XPATH, "//button[text()='Add to cart']")
     for button in add_to_cart_buttons:
         button.click()
-    WebDriverWait(driver, 10).until(lambda d: d.find_element(By.CLASS_NAME, "shopping_cart_badge").text == "6")
+    Wait(driver, 10).until(text_is((By.CLASS_NAME, "shopping_cart_badge"), "6"))
     assert driver.find_element(By.CLASS_NAME, "shopping_cart_badge").text == "6", "shopping_cart_badge is not equal to 6"
 
 def remove_items_from_products_page(driver):
     remove_buttons = driver.find_elements(By.XPATH, "//button[text()='Remove']")
     for button in remove_buttons:
         button.click()
-    WebDriverWait(driver, 10).until(EC.invisibility_of_element_located((By.CLASS_NAME, "shopping_cart_badge")))
-
-def write_result(test_name, result):
-    filepath = os.path.expanduser("~/Official-SauceDemo/Functionality/Compiled/Results/ProductBrowsing.txt")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "a") as f:
-        f.write(f"{test_name}: {result}\n")
+    Wait(driver, 10).until(invisible((By.CLASS_NAME, "shopping_cart_badge")))
 
 def test_standard_user_product_filtering(driver):
     test_name = "FP_06"
@@ -172,9 +145,9 @@ def test_standard_user_product_filtering(driver):
         login(driver, "standard_user", "secret_sauce")
         for sort_option in ["az", "za", "lohi", "hilo"]:
             verify_sorting(driver, sort_option)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Sorting is broken!")
+        results.write(test_name, f"Fail: Sorting is broken!")
         raise
 
 def test_problem_user_product_filtering(driver):
@@ -183,9 +156,9 @@ def test_problem_user_product_filtering(driver):
         login(driver, "problem_user", "secret_sauce")
         for sort_option in ["az", "za", "lohi", "hilo"]:
             verify_sorting(driver, sort_option)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Sorting is broken!")
+        results.write(test_name, f"Fail: Sorting is broken!")
         raise
 
 def test_performance_glitch_user_product_filtering(driver):
@@ -194,9 +167,9 @@ def test_performance_glitch_user_product_filtering(driver):
         login(driver, "performance_glitch_user", "secret_sauce")
         for sort_option in ["az", "za", "lohi", "hilo"]:
             verify_sorting(driver, sort_option)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Sorting is broken!")
+        results.write(test_name, f"Fail: Sorting is broken!")
         raise
 
 def test_error_user_product_filtering(driver):
@@ -205,9 +178,9 @@ def test_error_user_product_filtering(driver):
         login(driver, "error_user", "secret_sauce")
         for sort_option in ["az", "za", "lohi", "hilo"]:
             verify_sorting(driver, sort_option)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Sorting is broken!")
+        results.write(test_name, f"Fail: Sorting is broken!")
         raise
 
 def test_visual_user_product_filtering(driver):
@@ -216,9 +189,9 @@ def test_visual_user_product_filtering(driver):
         login(driver, "visual_user", "secret_sauce")
         for sort_option in ["az", "za", "lohi", "hilo"]:
             verify_sorting(driver, sort_option)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Sorting is broken!")
+        results.write(test_name, f"Fail: Sorting is broken!")
         raise
 
 def test_standard_user_add_to_cart(driver):
@@ -227,9 +200,9 @@ def test_standard_user_add_to_cart(driver):
         login(driver, "standard_user", "secret_sauce")
         reset_app_state(driver)
         add_all_items_to_cart(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: {e}")
+        results.write(test_name, f"Fail: {e}")
         raise
 
 def test_problem_user_add_to_cart(driver):
@@ -238,9 +211,9 @@ def test_problem_user_add_to_cart(driver):
         login(driver, "problem_user", "secret_sauce")
         reset_app_state(driver)
         add_all_items_to_cart(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Unable to add other items.")
+        results.write(test_name, f"Fail: Unable to add other items.")
         raise
 
 def test_performance_glitch_user_add_to_cart(driver):
@@ -249,9 +222,9 @@ def test_performance_glitch_user_add_to_cart(driver):
         login(driver, "performance_glitch_user", "secret_sauce")
         reset_app_state(driver)
         add_all_items_to_cart(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: {e}")
+        results.write(test_name, f"Fail: {e}")
         raise
 
 def test_error_user_add_to_cart(driver):
@@ -260,9 +233,9 @@ def test_error_user_add_to_cart(driver):
         login(driver, "error_user", "secret_sauce")
         reset_app_state(driver)
         add_all_items_to_cart(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Unable to add other items.")
+        results.write(test_name, f"Fail: Unable to add other items.")
         raise
 
 def test_visual_user_add_to_cart(driver):
@@ -271,9 +244,9 @@ def test_visual_user_add_to_cart(driver):
         login(driver, "visual_user", "secret_sauce")
         reset_app_state(driver)
         add_all_items_to_cart(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: {e}")
+        results.write(test_name, f"Fail: {e}")
         raise
 
 def test_standard_user_remove_from_products_page(driver):
@@ -283,9 +256,9 @@ def test_standard_user_remove_from_products_page(driver):
         reset_app_state(driver)
         add_all_items_to_cart(driver)
         remove_items_from_products_page(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: {e}")
+        results.write(test_name, f"Fail: {e}")
         raise
 
 def test_problem_user_remove_from_products_page(driver):
@@ -295,9 +268,9 @@ def test_problem_user_remove_from_products_page(driver):
         reset_app_state(driver)
         add_all_items_to_cart(driver)
         remove_items_from_products_page(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Remove button on added items doesn't work.")
+        results.write(test_name, f"Fail: Remove button on added items doesn't work.")
         raise
 
 def test_performance_glitch_user_remove_from_products_page(driver):
@@ -307,9 +280,9 @@ def test_performance_glitch_user_remove_from_products_page(driver):
         reset_app_state(driver)
         add_all_items_to_cart(driver)
         remove_items_from_products_page(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: {e}")
+        results.write(test_name, f"Fail: {e}")
         raise
 
 def test_error_user_remove_from_products_page(driver):
@@ -319,9 +292,9 @@ def test_error_user_remove_from_products_page(driver):
         reset_app_state(driver)
         add_all_items_to_cart(driver)
         remove_items_from_products_page(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: Remove button on added items doesn't work.")
+        results.write(test_name, f"Fail: Remove button on added items doesn't work.")
         raise
 
 def test_visual_user_remove_from_products_page(driver):
@@ -331,7 +304,7 @@ def test_visual_user_remove_from_products_page(driver):
         reset_app_state(driver)
         add_all_items_to_cart(driver)
         remove_items_from_products_page(driver)
-        write_result(test_name, "Pass")
+        results.write(test_name, "Pass")
     except Exception as e:
-        write_result(test_name, f"Fail: {e}")
+        results.write(test_name, f"Fail: {e}")
         raise
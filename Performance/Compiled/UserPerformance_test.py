@@ -1,58 +1,46 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
 
-BASE_URL = "https://www.saucedemo.com/"
+from Common.Benchmark import run_iterations, summarize
+from Common.Journeys import page_load_journey
+from Common.PageTiming import TIMING_FIELDS, format_timing, measure_step, median_timing
+from Common.PerfHistory import record_samples
+from Common.Results import Report, result_path
+from Common.ResourceTiming import check_budgets, collect_resources, write_waterfall
+
 ACCEPTABLE_RESPONSE_TIME = 2  
 OUTPUT_FILENAME = "UserPerformance.txt"
+WATERFALL_DIR = result_path("Performance", "Compiled", "Results", "Waterfalls")
 
-def write_grouped_results(test_case_id, results_dict):
-    filepath = os.path.expanduser(f"~/Official-SauceDemo/Performance/Compiled/Results/{OUTPUT_FILENAME}")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "a") as f:
-        f.write(f"\n=== {test_case_id} ===\n")
-        for step, result in results_dict.items():
-            f.write(f"{step}: {result}\n")
-        f.write("\n")
-
-def login(driver, username, password):
-    driver.get(BASE_URL)
-    username_field = driver.find_element(By.ID, "user-name")
-    password_field = driver.find_element(By.ID, "password")
-    login_button = driver.find_element(By.ID, "login-button")
-    username_field.send_keys(username)
-    password_field.send_keys(password)
-    login_button.click()
-    WebDriverWait(driver, 10).until(EC.url_contains("inventory.html"))
-
-def go_to_cart(driver):
-    driver.find_element(By.CLASS_NAME, "shopping_cart_link").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("cart.html"))
-
-def go_back(driver):
-    driver.back()
-
-def go_to_all_items(driver):
-    driver.find_element(By.ID, "react-burger-menu-btn").click()
-    WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.CLASS_NAME, "bm-menu")))
-    driver.find_element(By.ID, "inventory_sidebar_link").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("inventory.html"))
+report = Report("Performance", "Compiled", "Results", OUTPUT_FILENAME)
 
 def measure_response_time(func, driver, *args):
-    start_time = time.time()
-    func(driver, *args)
-    end_time = time.time()
-    return end_time - start_time
-
-@pytest.fixture(scope="session")
-def driver():
-    driver = webdriver.Firefox()
-    yield driver
-    driver.quit()
+    """Wall-clock seconds for the step plus what the browser recorded for it (see Common.PageTiming)."""
+    return measure_step(driver, func, *args)
+
+def record_history(username, step_name, wall_samples, browser_timings):
+    """Every sample goes to the performance history database, which master.sh checks for regressions."""
+    record_samples(username, step_name, "wall", wall_samples)
+    for field in TIMING_FIELDS:
+        record_samples(username, step_name, f"{field}_ms", [timing.get(field) for timing in browser_timings])
+
+def run_journey(driver, username):
+    """{step name: (wall-clock seconds, browser timing, resources downloaded by the step)}"""
+    samples = {}
+    for step_name, step, args in page_load_journey(username):
+        step_time, browser_timing = measure_response_time(step, driver, *args)
+        samples[step_name] = (step_time, browser_timing, collect_resources(driver))
+    return samples
+
+def check_resources(test_case_id, username, first_run, budgets):
+    """
+    Saves the waterfall of the test's first journey and returns its budget
+    violations. Only the first journey fetches the pages cold; later ones,
+    warmup runs included, are largely served from the browser cache.
+    """
+    steps = [dict(first_run[step_name][2], step=step_name) for step_name in first_run]
+    write_waterfall(os.path.join(WATERFALL_DIR, f"{test_case_id}.json"), test_case_id, username, steps)
+    return [f"{step['step']} {violation}" for step in steps for violation in check_budgets(step, budgets)]
 
 @pytest.mark.parametrize(
     "username, test_case_id",
@@ -64,42 +52,42 @@ def driver():
         ("visual_user", "PUP_05"),
     ],
 )
-def test_page_load_times(driver, username, test_case_id):
+def test_page_load_times(driver, benchmark_settings, resource_budgets, username, test_case_id):
     results = {}
     failures = []
+    label = "" if benchmark_settings.iterations == 1 else f"p{benchmark_settings.percentile:g} "
 
     try:
-        login_time = measure_response_time(login, driver, username, "secret_sauce")
-        if login_time < ACCEPTABLE_RESPONSE_TIME:
-            results["Login"] = f"Pass ({login_time:.2f}s)"
-        else:
-            results["Login"] = f"Fail ({login_time:.2f}s)"
-            failures.append(f"Login took too long: {login_time:.2f}s")
-
-        go_to_cart_time = measure_response_time(go_to_cart, driver)
-        if go_to_cart_time < ACCEPTABLE_RESPONSE_TIME:
-            results["GoToCart"] = f"Pass ({go_to_cart_time:.2f}s)"
-        else:
-            results["GoToCart"] = f"Fail ({go_to_cart_time:.2f}s)"
-            failures.append(f"GoToCart took too long: {go_to_cart_time:.2f}s")
-
-        back_to_inventory_time = measure_response_time(go_back, driver)
-        if back_to_inventory_time < ACCEPTABLE_RESPONSE_TIME:
-            results["BackToInventory"] = f"Pass ({back_to_inventory_time:.2f}s)"
-        else:
-            results["BackToInventory"] = f"Fail ({back_to_inventory_time:.2f}s)"
-            failures.append(f"BackToInventory took too long: {back_to_inventory_time:.2f}s")
-
-        all_items_time = measure_response_time(go_to_all_items, driver)
-        if all_items_time < ACCEPTABLE_RESPONSE_TIME:
-            results["AllItems"] = f"Pass ({all_items_time:.2f}s)"
-        else:
-            results["AllItems"] = f"Fail ({all_items_time:.2f}s)"
-            failures.append(f"AllItems took too long: {all_items_time:.2f}s")
+        journeys = []
+
+        def journey():
+            journeys.append(run_journey(driver, username))
+            return journeys[-1]
+
+        runs = run_iterations(journey, benchmark_settings, reset=driver.delete_all_cookies)
+        first_run = journeys[0]
+        for step_name, _, _ in page_load_journey(username):
+            wall_samples = [run[step_name][0] for run in runs]
+            record_history(username, step_name, wall_samples, [run[step_name][1] for run in runs])
+            stats = summarize(wall_samples, benchmark_settings.percentile)
+            step_time = stats.percentile_value
+            if step_time < ACCEPTABLE_RESPONSE_TIME:
+                results[step_name] = f"Pass ({label}{step_time:.2f}s)"
+            else:
+                results[step_name] = f"Fail ({label}{step_time:.2f}s)"
+                failures.append(f"{step_name} took too long: {label}{step_time:.2f}s")
+            if stats.count > 1:
+                results[f"{step_name} [stats]"] = stats.describe()
+            results[f"{step_name} [browser]"] = format_timing(median_timing([run[step_name][1] for run in runs]))
+            totals = first_run[step_name][2]["totals"]
+            results[f"{step_name} [resources]"] = (f"{totals['requests']} requests, {totals['transfer_bytes']} bytes "
+                                                   f"transferred, {totals['decoded_bytes']} decoded")
+
+        violations = check_resources(test_case_id, username, first_run, resource_budgets)
+        results["ResourceBudget"] = f"Fail ({'; '.join(violations)})" if violations else "Pass"
+        failures.extend(f"Over budget: {violation}" for violation in violations)
 
     finally:
-        write_grouped_results(test_case_id, results)
+        report.write_group(test_case_id, results)
 
     assert not failures, f"{test_case_id} failed steps:\n" + "\n".join(failures)
-
-
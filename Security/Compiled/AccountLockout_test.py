@@ -1,80 +1,57 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-import os
 
-@pytest.fixture(scope="function")
-def driver():
-    driver = webdriver.Firefox()  
-    yield driver
-    driver.quit()
+from Common.Results import Report, result_path
+from LockoutProbe import LOCKOUT_USERS, run_matrix, sweep, write_matrix
 
-def login(driver, username, password):
-    driver.get("https://www.saucedemo.com/")
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "user-name")))
-    driver.find_element(By.ID, "user-name").send_keys(username)
-    driver.find_element(By.ID, "password").send_keys(password)
-    driver.find_element(By.ID, "login-button").click()
+matrix_file = result_path("Security", "Compiled", "Results", "AccountLockoutMatrix.txt")
 
-def check_login_error(driver):
-    try:
-        error_element = WebDriverWait(driver, 5).until(EC.visibility_of_element_located((By.XPATH, "//*[contains(text(), 'Username and password do not match')]")))
-        return error_element.is_displayed()
-    except:
-        return False
+results = Report("Security", "Compiled", "Results", "AccountLockout.txt")
 
-def check_account_locked(driver, lockout_message_part):
-    try:
-        locked_element = WebDriverWait(driver, 10).until(EC.visibility_of_element_located((By.XPATH, f"//*[contains(text(), '{lockout_message_part}')]")))
-        return locked_element.is_displayed()
-    except:
-        return False
-
-def write_result(test_id, result, details=""):
-    filepath = os.path.expanduser("~/Official-SauceDemo/Security/Compiled/Results/AccountLockout.txt")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "a") as f:
-        f.write(f"{test_id}: {result}\n")
-        if result == "Fail" and details:
-            f.write(f"Details:\n{details}\n\n")
-
-def test_login_lockout_standard_user(driver):
-    test_id = "SLS_01_standard_user_30_attempts"
-    result = "Pass"
+def describe(cell):
     details = ""
-    username = "standard_user"
-    incorrect_password_base = "wrong_password_"
-    lockout_threshold = 30
-
-    driver.get("https://www.saucedemo.com/")
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "user-name")))
-    username_field = driver.find_element(By.ID, "user-name")
-    password_field = driver.find_element(By.ID, "password")
-    login_button = driver.find_element(By.ID, "login-button")
-
-    username_field.send_keys(username)
-
-    for attempt in range(1, lockout_threshold + 1):
-        password_field.clear()
-        password_field.send_keys(f"{incorrect_password_base}{attempt}")
-        login_button.click()
-        if not check_login_error(driver):
-            result = "Fail"
-            details += f"Attempt {attempt}: Login did not fail with incorrect credentials.\n"
-            break
-
-    password_field.clear()
-    password_field.send_keys("secret_sauce")
-    login_button.click()
-
-    if driver.current_url == "https://www.saucedemo.com/inventory.html":
-        result = "Fail"
-        details += "Account lockout did not occur after 30 failed attempts.\n"
+    for attempt, message in cell.unexpected:
+        details += f"Attempt {attempt}: Login did not fail with the mismatch error ({message!r}).\n"
+    if cell.error is not None:
+        details += f"Probe failed: {cell.error}\n"
+    elif cell.logged_in:
+        details += f"Account lockout did not occur after {cell.threshold} failed attempts.\n"
     else:
-        details += "Account lockout was triggered after 30 failed attempts.\n"
+        details += f"Account lockout was triggered after {cell.threshold} failed attempts.\n"
+    return details
+
+@pytest.fixture(scope="module")
+def lockout_matrix(request, browser_pool):
+    """
+    Every persona x threshold sweep, spread over the session's pooled browsers
+    (as many in parallel as --browser-pool-size allows) and written to one
+    matrix file.
+    """
+    thresholds = [int(value) for value in request.config.getoption("--lockout-thresholds").split(",") if value.strip()]
+    matrix = run_matrix(browser_pool, LOCKOUT_USERS, thresholds)
+    write_matrix(matrix_file, matrix, thresholds)
+    return matrix
 
-    write_result(test_id, result, details)
-    assert result == "Pass", f"{test_id} failed: {details}"
\ No newline at end of file
+def test_login_lockout_standard_user(driver):
+    test_id = "SLS_01_standard_user_30_attempts"
+    cell = sweep(driver, "standard_user", 30)
+    details = describe(cell)
+    result = "Pass" if cell.locked and not cell.unexpected else "Fail"
+
+    results.write(test_id, result, details)
+    assert result == "Pass", f"{test_id} failed: {details}"
+
+@pytest.mark.parametrize("username,test_id", [
+    ("standard_user", "SLM_01"),
+    ("locked_out_user", "SLM_02"),
+    ("problem_user", "SLM_03"),
+    ("performance_glitch_user", "SLM_04"),
+    ("error_user", "SLM_05"),
+    ("visual_user", "SLM_06"),
+])
+def test_lockout_matrix(lockout_matrix, username, test_id):
+    cells = lockout_matrix[username]
+    details = "".join(describe(cell) for cell in cells)
+    result = "Pass" if all(cell.locked and not cell.unexpected for cell in cells) else "Fail"
+
+    results.write(test_id, result, details)
+    assert result == "Pass", f"{test_id} failed: {details}"
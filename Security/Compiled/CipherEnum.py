@@ -1,10 +1,17 @@
 import subprocess
 import re
 import os
+import sys
+from urllib.parse import urlsplit
 
-def run_nmap_scan(target):
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from Common.Config import BASE_URL
+from Common.Results import result_path
+
+def run_nmap_scan(target, port=443):
     try:
-        command = ["nmap", "--script", "ssl-enum-ciphers", "-p", "443", target]
+        command = ["nmap", "--script", "ssl-enum-ciphers", "-p", str(port), target]
         result = subprocess.run(command, capture_output=True, text=True)
         return result.stdout
     except Exception as e:
@@ -38,17 +45,19 @@ def analyze_ciphers(nmap_output):
     else:
         output += "No critical vulnerabilities detected!\n"
 
-    results_path = os.path.expanduser("~/Official-SauceDemo/Security/Compiled/Results/CipherEnum.txt")
+    results_path = result_path("Security", "Compiled", "Results", "CipherEnum.txt")
+    os.makedirs(os.path.dirname(results_path), exist_ok=True)
     with open(results_path, "w") as file:
         file.write(output)
 
     print("\n📄 Results saved to **Cipher-Scan-Results.txt**")
 
 if __name__ == "__main__":
-    target_site = "saucedemo.com" 
+    target = urlsplit(BASE_URL)
+    target_site = target.hostname
     print(f"🔎 Running SSL Cipher Scan on {target_site}...\n")
     
-    scan_output = run_nmap_scan(target_site)
+    scan_output = run_nmap_scan(target_site, target.port or 443)
     if scan_output:
         print(scan_output)  
         analyze_ciphers(scan_output)
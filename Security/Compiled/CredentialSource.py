@@ -0,0 +1,117 @@
+import gzip
+import io
+import itertools
+import os
+from collections import namedtuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CHUNK_SIZE = 1 << 20  # bytes read from a wordlist at a time
+
+# One candidate pair plus its line numbers in the two lists, which is what
+# checkpoints store as the cursor.
+Credential = namedtuple("Credential", "username password user_index password_index")
+
+
+def open_wordlist(path):
+    """Opens a wordlist as a binary stream, decompressing .gz and .zst files on the fly."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"Reading {path} needs the zstandard package (pip install -r requirements.txt)")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+        return io.BufferedReader(reader, CHUNK_SIZE)
+    return open(path, "rb", buffering=CHUNK_SIZE)
+
+
+def iter_raw_lines(path):
+    """
+    Yields the lines of a wordlist as bytes without loading it: only one chunk
+    plus a partial line is held in memory, however large the file is.
+    """
+    with open_wordlist(path) as stream:
+        pending = b""
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if pending:
+            yield pending.rstrip(b"\r")
+
+
+def iter_lines(path, encoding="latin-1"):
+    for line in iter_raw_lines(path):
+        yield line.decode(encoding)
+
+
+def count_lines(path):
+    total = 0
+    ends_with_newline = True
+    with open_wordlist(path) as stream:
+        while True:
+            chunk = stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            total += chunk.count(b"\n")
+            ends_with_newline = chunk.endswith(b"\n")
+    return total if ends_with_newline else total + 1
+
+
+class CredentialSource:
+    """
+    Lazy username x password product over two wordlists. The password list is
+    streamed again for every username instead of being kept in memory, so
+    memory use does not depend on the size of either list.
+    """
+
+    def __init__(self, userlist_path, wordlist_path, encoding="latin-1"):
+        for label, path in (("Username", userlist_path), ("Password", wordlist_path)):
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"{label} list not found at {path}")
+        self.userlist_path = userlist_path
+        self.wordlist_path = wordlist_path
+        self.encoding = encoding
+
+    def usernames(self):
+        return iter_lines(self.userlist_path, self.encoding)
+
+    def passwords(self):
+        return iter_lines(self.wordlist_path, self.encoding)
+
+    def credentials(self, start=(0, 0), stop=None):
+        """
+        Yields every Credential from the (user_index, password_index) cursor
+        `start` up to, but not including, the cursor `stop` (the end of the
+        keyspace if None).
+        """
+        start_user, start_password = start
+        stop_user, stop_password = stop if stop is not None else (None, None)
+        last_user = None if stop_user is None else stop_user + 1
+        for user_index, username in itertools.islice(enumerate(self.usernames()), start_user, last_user):
+            first_password = start_password if user_index == start_user else 0
+            last_password = stop_password if user_index == stop_user else None
+            for password_index, password in itertools.islice(enumerate(self.passwords()), first_password, last_password):
+                yield Credential(username, password, user_index, password_index)
+
+    def size(self):
+        """(username count, password count); reads both lists once."""
+        return count_lines(self.userlist_path), count_lines(self.wordlist_path)
+
+    def __iter__(self):
+        return self.credentials()
+
+    def fingerprint(self):
+        """Identifies the two lists so a checkpoint is never resumed against different files."""
+        parts = []
+        for path in (self.userlist_path, self.wordlist_path):
+            stat = os.stat(path)
+            parts.append(f"{os.path.abspath(path)}:{stat.st_size}:{int(stat.st_mtime)}")
+        return "|".join(parts)
@@ -0,0 +1,187 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from Common.Auth import VALID_PASSWORD
+from Common.Config import BASE_URL
+from Common.Waits import Wait, present
+
+ERROR_SELECTOR = "h3[data-test='error']"
+MISMATCH_MESSAGE = "Username and password do not match"
+WRONG_PASSWORD_BASE = "wrong_password_"
+
+# Every persona the login form knows, including the one that is always locked out.
+LOCKOUT_USERS = [
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+]
+
+# Submits `passwords` for one user from inside the page and reads the error
+# banner right after every click (the app renders it while handling the
+# click), then tries the real password once. Same form filling as
+# BruteForceEngine.BATCH_LOGIN_SCRIPT; a second tick is only spent when the
+# banner has not shown up yet.
+LOCKOUT_SWEEP_SCRIPT = """
+var username = arguments[0], passwords = arguments[1], finalPassword = arguments[2], selector = arguments[3];
+var done = arguments[arguments.length - 1];
+var user = document.getElementById("user-name");
+var pass = document.getElementById("password");
+var button = document.getElementById("login-button");
+if (!user || !pass || !button) {
+    done({error: "login form not found"});
+    return;
+}
+var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+var channel = new MessageChannel();
+var pending = [];
+channel.port1.onmessage = function () { pending.shift()(); };
+function tick() {
+    return new Promise(function (resolve) { pending.push(resolve); channel.port2.postMessage(null); });
+}
+function fill(input, value) {
+    setValue.call(input, value);
+    input.dispatchEvent(new Event("input", {bubbles: true}));
+}
+function loggedIn() {
+    return document.cookie.indexOf("session-username=") !== -1 || location.pathname.indexOf("inventory.html") !== -1;
+}
+function banner() {
+    var el = document.querySelector(selector);
+    return el ? el.textContent.trim() : null;
+}
+async function submit(password) {
+    fill(user, username);
+    fill(pass, password);
+    await tick();
+    button.click();
+    if (loggedIn()) return {loggedIn: true, message: null};
+    var message = banner();
+    if (message === null) {
+        await tick();
+        if (loggedIn()) return {loggedIn: true, message: null};
+        message = banner();
+    }
+    return {loggedIn: false, message: message};
+}
+(async function () {
+    var messages = [];
+    for (var i = 0; i < passwords.length; i++) {
+        var attempt = await submit(passwords[i]);
+        if (attempt.loggedIn) {
+            done({messages: messages, loggedIn: true, loggedInAt: i + 1});
+            return;
+        }
+        messages.push(attempt.message);
+    }
+    var last = await submit(finalPassword);
+    done({messages: messages, loggedIn: last.loggedIn, finalError: last.message});
+})().catch(function (e) { done({error: String(e)}); });
+"""
+
+
+class LockoutCell(namedtuple("LockoutCell", "username threshold messages logged_in final_error error")):
+    """
+    Outcome of `threshold` wrong passwords followed by the right one.
+    `messages` holds the banner text read after every wrong attempt (None when
+    no banner appeared).
+    """
+
+    @property
+    def rejected(self):
+        """Wrong attempts that were turned down with the usual mismatch error."""
+        return sum(1 for message in self.messages if message and MISMATCH_MESSAGE in message)
+
+    @property
+    def unexpected(self):
+        """(attempt number, banner text) for every wrong attempt without the mismatch error."""
+        return [(number, message) for number, message in enumerate(self.messages, 1)
+                if not (message and MISMATCH_MESSAGE in message)]
+
+    @property
+    def locked(self):
+        return self.error is None and not self.logged_in
+
+    @property
+    def status(self):
+        if self.error is not None:
+            return "error"
+        return "locked" if self.locked else "open"
+
+
+def sweep(driver, username, threshold, password=VALID_PASSWORD, login_url=BASE_URL):
+    """Runs one lockout probe on a fresh login page and returns its LockoutCell."""
+    passwords = [f"{WRONG_PASSWORD_BASE}{attempt}" for attempt in range(1, threshold + 1)]
+    try:
+        driver.delete_all_cookies()
+        driver.get(login_url)
+        Wait(driver, 10).until(present((By.ID, "login-button")))
+        outcome = driver.execute_async_script(LOCKOUT_SWEEP_SCRIPT, username, passwords, password, ERROR_SELECTOR)
+    except WebDriverException as e:
+        return LockoutCell(username, threshold, [], False, None, str(e).strip())
+    if outcome.get("error"):
+        return LockoutCell(username, threshold, [], False, None, outcome["error"])
+    messages = outcome["messages"]
+    if outcome.get("loggedInAt"):
+        # A wrong password got in; record it where the banner would have been.
+        messages = messages + [f"logged in with {passwords[outcome['loggedInAt'] - 1]!r}"]
+    return LockoutCell(username, threshold, messages, outcome["loggedIn"], outcome.get("finalError"), None)
+
+
+def run_matrix(pool, usernames=LOCKOUT_USERS, thresholds=(30,), workers=None):
+    """
+    Sweeps every (username, threshold) pair, spreading them over browsers
+    leased from `pool`. Every sweep starts from a cookie-less login page, so
+    the cells do not depend on each other or on which browser ran them.
+
+    Returns:
+        {username: [LockoutCell per threshold, in the order given]}
+    """
+    cells = [(username, threshold) for username in usernames for threshold in thresholds]
+    workers = min(len(cells), workers or pool.size) or 1
+
+    def probe(cell):
+        with pool.lease() as driver:
+            return sweep(driver, *cell)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(probe, cells))
+
+    matrix = {username: [] for username in usernames}
+    for cell in results:
+        matrix[cell.username].append(cell)
+    return matrix
+
+
+def write_matrix(path, matrix, thresholds):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    width = max(len(username) for username in matrix) + 2
+    with open(path, "w") as f:
+        f.write("Account Lockout Matrix: wrong passwords submitted, then the correct one\n\n")
+        f.write("persona".ljust(width) + "".join(f"{threshold:>9}" for threshold in thresholds) + "\n")
+        for username, cells in matrix.items():
+            f.write(username.ljust(width) + "".join(f"{cell.status:>9}" for cell in cells) + "\n")
+        f.write("\nopen   = the correct password still logged in\n")
+        f.write("locked = the correct password was refused\n")
+        f.write("error  = the probe itself failed\n")
+
+        details = []
+        for username, cells in matrix.items():
+            for cell in cells:
+                if cell.error is not None:
+                    details.append(f"{username} @ {cell.threshold}: {cell.error}")
+                    continue
+                if cell.final_error:
+                    details.append(f"{username} @ {cell.threshold}: refused with {cell.final_error!r}")
+                for number, message in cell.unexpected:
+                    details.append(f"{username} @ {cell.threshold}: attempt {number} showed {message!r}")
+        if details:
+            f.write("\nDetails:\n")
+            for line in details:
+                f.write(f"{line}\n")
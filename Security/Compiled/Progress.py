@@ -0,0 +1,127 @@
+import sys
+import time
+
+from BruteForceEngine import ERROR, SUCCESS
+
+CHECK_EVERY = 64  # attempts between clock reads on the hot path
+
+
+def format_duration(seconds):
+    if seconds is None:
+        return "--:--:--"
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter:
+    """
+    Keeps attempt/error/hit counts and redraws one status line (throughput,
+    ETA, error rate, hits) at most every `interval` seconds, instead of
+    printing a line per attempt. `done` and `total` are positions in the whole
+    keyspace, so a resumed run reports an ETA for what is actually left.
+    """
+
+    def __init__(self, total, done=0, interval=2.0, stream=None):
+        self.total = total
+        self.done_before = done
+        self.interval = interval
+        self.stream = stream or sys.stdout
+        self.inline = self.stream.isatty()
+
+        self.attempts = 0
+        self.errors = 0
+        self.hits = 0
+        self.detail = ""
+
+        self.started = time.monotonic()
+        self._reported_at = self.started
+        self._ticks = 0
+        self._line_shown = False
+
+    def record(self, status):
+        if status == ERROR:
+            self.errors += 1
+        else:
+            self.attempts += 1
+            if status == SUCCESS:
+                self.hits += 1
+        self._ticks += 1
+        if self._ticks >= CHECK_EVERY:
+            self._ticks = 0
+            self.tick()
+
+    def set_counts(self, attempts, errors, hits, done=None):
+        """Replaces the counts wholesale, for callers that aggregate them elsewhere (the shard pool)."""
+        self.attempts, self.errors, self.hits = attempts, errors, hits
+        if done is not None:
+            self.done_before = done - attempts
+
+    def tick(self):
+        now = time.monotonic()
+        if now - self._reported_at >= self.interval:
+            self.report(now)
+
+    def stats(self, now=None):
+        elapsed = (now or time.monotonic()) - self.started
+        rate = self.attempts / elapsed if elapsed > 0 else 0.0
+        done = self.done_before + self.attempts
+        tried = self.attempts + self.errors
+        return {
+            "attempts": self.attempts,
+            "errors": self.errors,
+            "error_rate": self.errors / tried if tried else 0.0,
+            "hits": self.hits,
+            "elapsed": elapsed,
+            "rate": rate,
+            "done": done,
+            "total": self.total,
+            "eta": (self.total - done) / rate if rate and self.total else None,
+        }
+
+    def status_line(self, stats):
+        percent = 100 * stats["done"] / self.total if self.total else 0.0
+        line = (f"[PROGRESS] {stats['done']}/{self.total} ({percent:.1f}%) | {stats['rate']:.1f} attempts/sec"
+                f" | ETA {format_duration(stats['eta'])} | errors {100 * stats['error_rate']:.1f}%"
+                f" | hits {stats['hits']}")
+        return f"{line} | {self.detail}" if self.detail else line
+
+    def report(self, now=None):
+        now = now or time.monotonic()
+        self._reported_at = now
+        line = self.status_line(self.stats(now))
+        if self.inline:
+            self.stream.write(f"\r\033[K{line}")
+            self._line_shown = True
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def log(self, message):
+        """Prints a message (a hit, an error, a debug line) without mangling the status line."""
+        if self._line_shown:
+            self.stream.write("\r\033[K")
+            self._line_shown = False
+        self.stream.write(message + "\n")
+        self.stream.flush()
+
+    def finish(self):
+        self.report()
+        if self._line_shown:
+            self.stream.write("\n")
+            self._line_shown = False
+        return self.stats()
+
+
+def write_stats(path, stats, **run_info):
+    lines = [f"Run finished: {time.strftime('%Y-%m-%d %H:%M:%S')}"]
+    lines += [f"{key.replace('_', ' ').capitalize()}: {value}" for key, value in run_info.items()]
+    lines += [
+        f"Attempts: {stats['attempts']}",
+        f"Errors: {stats['errors']} ({100 * stats['error_rate']:.2f}%)",
+        f"Hits: {stats['hits']}",
+        f"Elapsed: {stats['elapsed']:.1f}s",
+        f"Throughput: {stats['rate']:.1f} attempts/sec",
+        f"Keyspace covered: {stats['done']}/{stats['total']}",
+    ]
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
@@ -1,7 +1,17 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
+from concurrent.futures import ThreadPoolExecutor
+import argparse
 import time
 import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from Common.Config import BASE_URL
+from Common.DriverPool import launch_firefox
+from Common.Results import result_path
+from Common.VirtualClock import VirtualClock
+from Common.Waits import Wait, any_of, present, url_contains, url_not_contains
 
 test_cases = {
     "SSM_01": "standard_user",
@@ -11,50 +21,155 @@ test_cases = {
      "SSM_05": "visual_user",
 }
 password = "secret_sauce"
-timeout_duration = 900 
-results_file = os.path.expanduser("~/Official-SauceDemo/Security/Compiled/Results/SessionTimeout.txt")
+timeout_duration = 900
+
+parser = argparse.ArgumentParser(description="Checks that SauceDemo sessions expire after a period of inactivity.")
+parser.add_argument("--real-time", action="store_true", default=bool(os.environ.get("SAUCEDEMO_REAL_TIME")),
+                    help="Really wait out the inactivity period instead of advancing a virtual clock "
+                         "(also enabled by SAUCEDEMO_REAL_TIME=1)")
+parser.add_argument("--timeout", type=int, default=timeout_duration,
+                    help=f"Seconds of inactivity to simulate (default {timeout_duration})")
+parser.add_argument("--sequential", action="store_true",
+                    help="Probe one persona after another instead of all at once")
+parser.add_argument("--headless", action="store_true", help="Run the browsers without a window")
+args = parser.parse_args()
+timeout_duration = args.timeout
+mode = "real time" if args.real_time else "virtual clock"
+
+results_file = result_path("Security", "Compiled", "Results", "SessionTimeout.txt")
 os.makedirs(os.path.dirname(results_file), exist_ok=True)
 
-with open(results_file, "w") as f:
-    f.write("Session Timeout Test Results:\n\n")
 
-    for test_id, user in test_cases.items():
-        print(f"\nTesting session timeout for Test Case ID: {test_id} ({user})")
-        f.write(f"Test Case ID: {test_id} ({user})\n")
+class Probe:
+    """One persona's browser and the lines it contributes to the results file."""
 
-        try:
-            driver = webdriver.Firefox()
-        except Exception as e:
-            print(f"Error setting up Firefox driver: {e}")
-            print("Make sure geckodriver is installed and in your system's PATH.")
-            f.write(f"Error setting up Firefox driver: {e}\n")
-            f.write("Make sure geckodriver is installed and in your system's PATH.\n")
-            continue
+    def __init__(self, test_id, user):
+        self.test_id = test_id
+        self.user = user
+        self.driver = None
+        self.clock = None
+        self.lines = [f"Test Case ID: {test_id} ({user})"]
 
-        driver.get("https://www.saucedemo.com")
+    def log(self, message):
+        print(f"[{self.test_id}] {message}")
+        self.lines.append(message)
 
-        # Login
-        driver.find_element(By.ID, "user-name").send_keys(user)
-        driver.find_element(By.ID, "password").send_keys(password)
-        driver.find_element(By.ID, "login-button").click()
 
-        print(f"Logged in as {user}. Waiting {timeout_duration} seconds to simulate inactivity...")
-        f.write(f"Logged in as {user}. Waiting {timeout_duration} seconds to simulate inactivity...\n")
+def start_session(probe):
+    """Launches a browser for the persona and logs in through the form."""
+    # Every Firefox that WebDriver starts gets its own throw-away profile, so
+    # the personas share no cookies or storage even when they run side by side.
+    try:
+        probe.driver = launch_firefox(headless=args.headless)
+    except Exception as e:
+        probe.log(f"Error setting up Firefox driver: {e}")
+        probe.log("Make sure geckodriver is installed and in your system's PATH.")
+        return
+
+    driver = probe.driver
+    # Kept for the whole probe: the jump made while inactive has to be
+    # re-applied on every page the check loads afterwards.
+    probe.clock = VirtualClock(driver)
+    driver.get(BASE_URL)
+
+    # Login
+    driver.find_element(By.ID, "user-name").send_keys(probe.user)
+    driver.find_element(By.ID, "password").send_keys(password)
+    driver.find_element(By.ID, "login-button").click()
+    Wait(driver, 10).poll(url_contains("inventory.html"))
+    probe.log(f"Logged in as {probe.user}.")
+
+
+def simulate_inactivity(probes):
+    """Lets `timeout_duration` seconds pass for every probe at once."""
+    if args.real_time:
+        print(f"Waiting {timeout_duration} seconds to simulate inactivity...")
+        for probe in probes:
+            probe.lines.append(f"Waited {timeout_duration} seconds to simulate inactivity.")
         time.sleep(timeout_duration)
+        return
+
+    print(f"Advancing the clock {timeout_duration} seconds to simulate inactivity...")
+    for probe in probes:
+        probe.lines.append(f"Advanced the clock {timeout_duration} seconds to simulate inactivity.")
+        expired = probe.clock.advance(timeout_duration)
+        probe.lines.append(f"Virtual time is now {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(probe.clock.now()))}; "
+                           f"cookies expired by the jump: {', '.join(expired) or 'none'}")
+
 
-        driver.get("https://www.saucedemo.com/cart.html")
-        time.sleep(2)
+def check_session(probe):
+    driver = probe.driver
+    # Through the clock, so the cart page sees the shifted Date too (the
+    # offset is 0 in a real-time run).
+    probe.clock.get(f"{BASE_URL}cart.html")
+    Wait(driver, 5).poll(any_of(present((By.CLASS_NAME, "cart_list")), url_not_contains("cart.html")))
 
-        current_url = driver.current_url
-        if "saucedemo.com" in current_url and "/cart.html" not in current_url:
-            result = "[PASS] Session expired. Redirected to: " + current_url
-            print(result)
-            f.write(f"{test_id}: {result}\n")
-        else:
-            result = "[FAIL] Session still active. Current URL: " + current_url
-            print(result)
-            f.write(f"{test_id}: {result}\n")
+    current_url = driver.current_url
+    if BASE_URL in current_url and "/cart.html" not in current_url:
+        result = "[PASS] Session expired. Redirected to: " + current_url
+    else:
+        result = "[FAIL] Session still active. Current URL: " + current_url
+    probe.log(f"{probe.test_id}: {result}")
 
-        driver.quit()
 
-print(f"\nSession timeout testing complete. Results saved to: {results_file}")
\ No newline at end of file
+def run_safely(step, probe):
+    try:
+        step(probe)
+    except Exception as e:
+        probe.log(f"{probe.test_id}: [FAIL] Error during {step.__name__}: {e}")
+        quit_browser(probe)
+
+
+def quit_browser(probe):
+    if probe.driver is not None:
+        try:
+            probe.driver.quit()
+        except Exception:
+            pass
+        probe.driver = None
+        probe.clock = None
+
+
+def probe_together(probes):
+    """
+    Logs every persona in at once, lets a single inactivity window pass for
+    all of them and checks them in parallel, so a real-time run takes one
+    timeout instead of one per persona.
+    """
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        list(pool.map(lambda probe: run_safely(start_session, probe), probes))
+        active = [probe for probe in probes if probe.driver is not None]
+        if active:
+            simulate_inactivity(active)
+            list(pool.map(lambda probe: run_safely(check_session, probe), active))
+            list(pool.map(quit_browser, active))
+
+
+def probe_one_by_one(probes):
+    for probe in probes:
+        run_safely(start_session, probe)
+        if probe.driver is None:
+            continue
+        simulate_inactivity([probe])
+        run_safely(check_session, probe)
+        quit_browser(probe)
+
+
+probes = [Probe(test_id, user) for test_id, user in test_cases.items()]
+print(f"\nTesting session timeout for {len(probes)} users ({mode}, "
+      f"{'sequential' if args.sequential else 'concurrent'})")
+started = time.perf_counter()
+if args.sequential:
+    probe_one_by_one(probes)
+else:
+    probe_together(probes)
+elapsed = time.perf_counter() - started
+
+with open(results_file, "w") as f:
+    f.write(f"Session Timeout Test Results ({mode}):\n\n")
+    for probe in probes:
+        for line in probe.lines:
+            f.write(f"{line}\n")
+    f.write(f"\nCompleted in {elapsed:.1f}s\n")
+
+print(f"\nSession timeout testing complete in {elapsed:.1f}s. Results saved to: {results_file}")
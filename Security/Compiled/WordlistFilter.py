@@ -0,0 +1,208 @@
+import hashlib
+import itertools
+import json
+import os
+import string
+from collections import Counter, namedtuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from CredentialSource import iter_raw_lines
+
+FILTER_BATCH = 1 << 18  # lines filtered per vectorized batch
+
+# Every SauceDemo account (and the shared password) is 1-64 printable ASCII
+# characters without whitespace; anything else cannot log in.
+SAUCEDEMO_CHARSET = string.ascii_letters + string.digits + string.punctuation
+
+Policy = namedtuple("Policy", "min_length max_length charset invalid")
+REASONS = ("empty", "length", "charset", "invalid", "duplicate")
+
+
+class FilterReport(namedtuple("FilterReport", "label total kept dropped")):
+    def summary(self):
+        removed = self.total - self.kept
+        share = 100 * removed / self.total if self.total else 0.0
+        reasons = ", ".join(f"{self.dropped[reason]} {reason}" for reason in REASONS if self.dropped.get(reason))
+        return f"{self.label}: {self.total} -> {self.kept} (-{share:.1f}%{': ' + reasons if reasons else ''})"
+
+
+def make_policy(min_length=1, max_length=64, charset=SAUCEDEMO_CHARSET, invalid_paths=()):
+    invalid = set()
+    for path in invalid_paths:
+        invalid.update(line for line in iter_raw_lines(path) if line)
+    return Policy(min_length, max_length, charset.encode("latin-1") if charset else None, frozenset(invalid))
+
+
+def policy_key(policy):
+    invalid_digest = hashlib.sha1(b"\n".join(sorted(policy.invalid))).hexdigest()
+    return [policy.min_length, policy.max_length, (policy.charset or b"").decode("latin-1"), invalid_digest]
+
+
+def _batches(path):
+    lines = iter_raw_lines(path)
+    while True:
+        batch = list(itertools.islice(lines, FILTER_BATCH))
+        if not batch:
+            return
+        yield batch
+
+
+def _fnv1a(matrix, lengths):
+    """64-bit FNV-1a of every row of a padded byte matrix, one column at a time."""
+    hashes = numpy.full(len(lengths), 0xCBF29CE484222325, dtype=numpy.uint64)
+    prime = numpy.uint64(0x100000001B3)
+    for column in range(matrix.shape[1]):
+        active = lengths > column
+        mixed = (hashes ^ matrix[:, column].astype(numpy.uint64)) * prime
+        hashes = numpy.where(active, mixed, hashes)
+    return hashes ^ lengths.astype(numpy.uint64)
+
+
+class _NumpyFilter:
+    """
+    Filters a batch of lines with array operations: lengths, charset and the
+    invalid list are masks over a padded byte matrix. Duplicates are found by
+    hashing every row: a line whose hash is new and unique in its batch is
+    kept straight away, and only lines whose hash was seen before are
+    compared byte for byte with the kept lines, so a hash collision never
+    drops a distinct line.
+    """
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.allowed = numpy.ones(256, dtype=bool)
+        if policy.charset is not None:
+            self.allowed[:] = False
+            self.allowed[numpy.frombuffer(policy.charset, dtype=numpy.uint8)] = True
+        self.invalid = numpy.array(sorted(policy.invalid), dtype=bytes) if policy.invalid else None
+        self.seen = numpy.empty(0, dtype=numpy.uint64)
+        self.kept = set()
+
+    def __call__(self, batch, dropped):
+        policy = self.policy
+        lengths = numpy.fromiter((len(line) for line in batch), dtype=numpy.int64, count=len(batch))
+        empty = lengths == 0
+        dropped["empty"] += int(empty.sum())
+        in_range = lengths >= policy.min_length
+        if policy.max_length:
+            in_range &= lengths <= policy.max_length
+        dropped["length"] += int((~empty & ~in_range).sum())
+
+        # Only lines of an acceptable length make it into the byte matrix, so
+        # one absurdly long line cannot blow up its width.
+        candidates = numpy.flatnonzero(~empty & in_range)
+        if not len(candidates):
+            return []
+        lines = numpy.array([batch[index] for index in candidates], dtype=bytes)
+        lengths = lengths[candidates]
+        width = lines.dtype.itemsize
+        matrix = numpy.frombuffer(lines.tobytes(), dtype=numpy.uint8).reshape(len(lines), width)
+        padding = numpy.arange(width) >= lengths[:, None]
+
+        keep = numpy.ones(len(lines), dtype=bool)
+        for reason, mask in (
+            ("charset", (self.allowed[matrix] | padding).all(axis=1)),
+            ("invalid", ~numpy.isin(lines, self.invalid) if self.invalid is not None else keep),
+        ):
+            rejected = keep & ~mask
+            dropped[reason] += int(rejected.sum())
+            keep &= ~rejected
+
+        survivors = numpy.flatnonzero(keep)
+        with numpy.errstate(over="ignore"):
+            hashes = _fnv1a(matrix[survivors], lengths[survivors])
+        unique, inverse, counts = numpy.unique(hashes, return_inverse=True, return_counts=True)
+        suspect = (counts[inverse] > 1) | numpy.isin(hashes, self.seen)
+
+        rows = candidates[survivors]
+        kept = list(rows[~suspect])
+        for index in rows[suspect]:
+            if batch[index] not in self.kept:
+                self.kept.add(batch[index])
+                kept.append(index)
+        kept.sort()
+        self.kept.update(batch[index] for index in rows[~suspect])
+        self.seen = numpy.union1d(self.seen, unique)
+        dropped["duplicate"] += len(survivors) - len(kept)
+        return [batch[index] for index in kept]
+
+
+class _PythonFilter:
+    """Same rules as _NumpyFilter, one line at a time, for when NumPy is not installed."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.allowed = set(policy.charset) if policy.charset is not None else None
+        self.seen = set()
+
+    def __call__(self, batch, dropped):
+        policy = self.policy
+        kept = []
+        for line in batch:
+            if not line:
+                reason = "empty"
+            elif len(line) < policy.min_length or (policy.max_length and len(line) > policy.max_length):
+                reason = "length"
+            elif self.allowed is not None and not self.allowed.issuperset(line):
+                reason = "charset"
+            elif line in policy.invalid:
+                reason = "invalid"
+            elif line in self.seen:
+                reason = "duplicate"
+            else:
+                self.seen.add(line)
+                kept.append(line)
+                continue
+            dropped[reason] += 1
+        return kept
+
+
+def filter_wordlist(path, output_path, policy, label):
+    """Writes the lines of `path` that pass `policy` to `output_path`, first occurrence order kept."""
+    line_filter = _NumpyFilter(policy) if numpy is not None else _PythonFilter(policy)
+    dropped = Counter()
+    total = kept = 0
+    with open(f"{output_path}.tmp", "wb") as out:
+        for batch in _batches(path):
+            passed = line_filter(batch, dropped)
+            total += len(batch)
+            kept += len(passed)
+            if passed:
+                out.write(b"\n".join(passed) + b"\n")
+    os.replace(f"{output_path}.tmp", output_path)
+    return FilterReport(label, total, kept, dict(dropped))
+
+
+def _source_key(path):
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+def prefilter(path, output_dir, policy, label):
+    """
+    Returns (filtered path, FilterReport). The filtered list is cached in
+    `output_dir` and only rebuilt when the source list or the policy changes,
+    so its mtime, and with it any checkpoint fingerprint, stays stable.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    name = os.path.basename(path)
+    for suffix in (".gz", ".zst"):
+        name = name[:-len(suffix)] if name.endswith(suffix) else name
+    output_path = os.path.join(output_dir, f"{label.lower()}-{name}")
+    meta_path = f"{output_path}.json"
+    key = {"source": _source_key(path), "policy": policy_key(policy)}
+
+    if os.path.exists(output_path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta["key"] == key:
+            return output_path, FilterReport(label, meta["total"], meta["kept"], meta["dropped"])
+
+    report = filter_wordlist(path, output_path, policy, label)
+    with open(meta_path, "w") as f:
+        json.dump({"key": key, "total": report.total, "kept": report.kept, "dropped": report.dropped}, f)
+    return output_path, report
@@ -0,0 +1,84 @@
+# Product and persona data mirrored from the live SauceDemo build, so the
+# stand-in renders the same names, descriptions, prices and image paths the
+# test modules assert on.
+
+PRODUCTS = [
+    {
+        "id": 4,
+        "name": "Sauce Labs Backpack",
+        "slug": "sauce-labs-backpack",
+        "description": "Carry all the things with the sleek, streamlined sly pack that melds uncompromising style with unequaled laptop and tablet protection.",
+        "price": 29.99,
+        "image": "static/media/sauce-backpack-1200x1500.0a0b85a3.jpg",
+        "image_bytes": 62_406,
+    },
+    {
+        "id": 0,
+        "name": "Sauce Labs Bike Light",
+        "slug": "sauce-labs-bike-light",
+        "description": "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included.",
+        "price": 9.99,
+        "image": "static/media/bike-light-1200x1500.37c843b0.jpg",
+        "image_bytes": 37_882,
+    },
+    {
+        "id": 1,
+        "name": "Sauce Labs Bolt T-Shirt",
+        "slug": "sauce-labs-bolt-t-shirt",
+        "description": "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt.",
+        "price": 15.99,
+        "image": "static/media/bolt-shirt-1200x1500.c2599ac5.jpg",
+        "image_bytes": 44_571,
+    },
+    {
+        "id": 5,
+        "name": "Sauce Labs Fleece Jacket",
+        "slug": "sauce-labs-fleece-jacket",
+        "description": "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office.",
+        "price": 49.99,
+        "image": "static/media/sauce-pullover-1200x1500.51d7ffaf.jpg",
+        "image_bytes": 57_360,
+    },
+    {
+        "id": 2,
+        "name": "Sauce Labs Onesie",
+        "slug": "sauce-labs-onesie",
+        "description": "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel.",
+        "price": 7.99,
+        "image": "static/media/red-onesie-1200x1500.2ec615b2.jpg",
+        "image_bytes": 31_248,
+    },
+    {
+        "id": 3,
+        "name": "Test.allTheThings() T-Shirt (Red)",
+        "slug": "test.allthethings()-t-shirt-(red)",
+        "description": "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton.",
+        "price": 15.99,
+        "image": "static/media/red-tatt-1200x1500.30dadef4.jpg",
+        "image_bytes": 41_935,
+    },
+]
+
+# Image every product shows for problem_user (and the backpack for visual_user).
+BROKEN_IMAGE = {"image": "static/media/sl-404.168b1cce.jpg", "image_bytes": 18_930}
+
+PASSWORD = "secret_sauce"
+
+USERS = [
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+]
+
+LOCKED_OUT_USERS = ["locked_out_user"]
+
+# Products whose "Add to cart" button is broken for the given persona.
+BROKEN_ADD_TO_CART = {
+    "problem_user": [1, 5, 3],
+    "error_user": [1, 5, 3],
+}
+
+TAX_RATE = 0.08
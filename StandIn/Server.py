@@ -0,0 +1,244 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from StandIn.Catalog import BROKEN_ADD_TO_CART, BROKEN_IMAGE, LOCKED_OUT_USERS, PASSWORD, PRODUCTS, TAX_RATE, USERS
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+SESSION_COOKIE = "session-username"
+
+PAGES = {
+    "/": ("login", "Swag Labs"),
+    "/index.html": ("login", "Swag Labs"),
+    "/inventory.html": ("inventory", "Products"),
+    "/inventory-item.html": ("inventory-item", ""),
+    "/cart.html": ("cart", "Your Cart"),
+    "/checkout-step-one.html": ("checkout-step-one", "Checkout: Your Information"),
+    "/checkout-step-two.html": ("checkout-step-two", "Checkout: Overview"),
+    "/checkout-complete.html": ("checkout-complete", "Checkout: Complete!"),
+}
+
+STATIC_TYPES = {
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+}
+
+# A minimal baseline JPEG (one grey pixel); product
+# images are padded with a comment segment up to the size of the real file so
+# transfer sizes stay representative.
+JPEG_HEAD = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000"
+    "ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27393d38323c2e333432"
+    "ffc0000b080001000101011100"
+    "ffc4001f0000010501010101010100000000000000000102030405060708090a0b"
+    "ffc400b5100002010303020403050504040000017d01020300041105122131410613516107227114328191a1082342b1c11552d1f02433627282090a161718191a25262728292a3435363738393a434445464748494a535455565758595a636465666768696a737475767778797a838485868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9fa"
+)
+JPEG_TAIL = bytes.fromhex("ffda0008010100003f002bffd9")
+
+
+def build_jpeg(size):
+    padding = max(0, size - len(JPEG_HEAD) - len(JPEG_TAIL))
+    segments = []
+    while padding > 4:
+        chunk = min(padding - 4, 65533)
+        segments.append(b"\xff\xfe" + (chunk + 2).to_bytes(2, "big") + b"\x00" * chunk)
+        padding -= chunk + 4
+    return JPEG_HEAD + b"".join(segments) + JPEG_TAIL
+
+
+MEDIA = {"/" + item["image"]: item["image_bytes"] for item in PRODUCTS + [BROKEN_IMAGE]}
+
+
+class LatencyRule:
+    """
+    Delays responses whose path starts with `path_prefix`, optionally only for
+    requests carrying a given persona's session cookie. `jitter_ms` adds a
+    uniform +/- spread drawn from the server's seeded RNG.
+    """
+
+    def __init__(self, path_prefix, delay_ms, jitter_ms=0, user=None):
+        self.path_prefix = path_prefix
+        self.delay_ms = delay_ms
+        self.jitter_ms = jitter_ms
+        self.user = user
+
+    @classmethod
+    def parse(cls, spec):
+        """Parses "[user@]/path=delay_ms[~jitter_ms]", e.g. "performance_glitch_user@/inventory.html=3000~250"."""
+        target, _, timing = spec.partition("=")
+        if not timing:
+            raise ValueError(f"Latency rule '{spec}' is missing '=<delay_ms>'")
+        user, _, path_prefix = target.rpartition("@")
+        delay, _, jitter = timing.partition("~")
+        return cls(path_prefix or "/", float(delay), float(jitter or 0), user or None)
+
+    def matches(self, path, user):
+        return path.startswith(self.path_prefix) and (self.user is None or self.user == user)
+
+    def __repr__(self):
+        user = f"{self.user}@" if self.user else ""
+        return f"{user}{self.path_prefix}={self.delay_ms:g}~{self.jitter_ms:g}"
+
+
+# Reproduces performance_glitch_user's slow landing on the product pages.
+DEFAULT_LATENCY = [
+    LatencyRule("/inventory", 2500, 0, user="performance_glitch_user"),
+]
+
+
+def render_page(page, title):
+    app_data = {
+        "page": page,
+        "title": title,
+        "products": PRODUCTS,
+        "brokenImage": BROKEN_IMAGE["image"],
+        "users": USERS,
+        "lockedOut": LOCKED_OUT_USERS,
+        "password": PASSWORD,
+        "brokenAddToCart": BROKEN_ADD_TO_CART,
+        "taxRate": TAX_RATE,
+    }
+    # "</" would end the inline script early if it ever appeared in the data.
+    app_json = json.dumps(app_data).replace("</", "<\\/")
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width,initial-scale=1">\n'
+        "<title>Swag Labs</title>\n"
+        '<link rel="stylesheet" href="static/css/main.css">\n'
+        "</head>\n<body>\n"
+        '<div id="root"></div>\n'
+        f'<script>window.SAUCE = {app_json};</script>\n'
+        '<script src="static/js/main.js"></script>\n'
+        "</body>\n</html>\n"
+    ).encode("utf-8")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = "SauceDemoStandIn/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def session_user(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def inject_latency(self, path):
+        delay = self.server.latency_for(path, self.session_user())
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def send_body(self, status, content_type, body, cache=False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable" if cache else "no-cache")
+        # Lets Resource Timing report sizes and phases for every asset.
+        self.send_header("Timing-Allow-Origin", "*")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.inject_latency(path)
+
+        if path in PAGES:
+            self.send_body(200, "text/html; charset=utf-8", render_page(*PAGES[path]))
+        elif path in MEDIA:
+            self.send_body(200, "image/jpeg", self.server.media(path), cache=True)
+        elif path.startswith("/static/") and os.path.splitext(path)[1] in STATIC_TYPES:
+            file_path = os.path.join(STATIC_DIR, os.path.basename(path))
+            if not os.path.isfile(file_path):
+                self.send_body(404, "text/plain; charset=utf-8", b"Not Found")
+                return
+            with open(file_path, "rb") as f:
+                body = f.read()
+            self.send_body(200, STATIC_TYPES[os.path.splitext(path)[1]], body, cache=True)
+        elif path == "/favicon.ico":
+            self.send_body(204, "image/x-icon", b"")
+        else:
+            self.send_body(404, "text/plain; charset=utf-8", b"Not Found")
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_rules=None, seed=0, verbose=False):
+        super().__init__(address, StandInHandler)
+        self.latency_rules = list(DEFAULT_LATENCY if latency_rules is None else latency_rules)
+        self.verbose = verbose
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._media_cache = {}
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def latency_for(self, path, user):
+        total = 0.0
+        for rule in self.latency_rules:
+            if rule.matches(path, user):
+                jitter = 0.0
+                if rule.jitter_ms:
+                    with self._random_lock:
+                        jitter = self._random.uniform(-rule.jitter_ms, rule.jitter_ms)
+                total += max(0.0, rule.delay_ms + jitter)
+        return total
+
+    def media(self, path):
+        if path not in self._media_cache:
+            self._media_cache[path] = build_jpeg(MEDIA[path])
+        return self._media_cache[path]
+
+
+def start_in_background(host="127.0.0.1", port=0, latency_rules=None, seed=0):
+    """Starts the stand-in on a daemon thread and returns the running server."""
+    server = StandInServer((host, port), latency_rules, seed)
+    threading.Thread(target=server.serve_forever, name="saucedemo-stand-in", daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for https://www.saucedemo.com/.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", action="append", default=[], metavar="[USER@]/PATH=MS[~JITTER]",
+                        help="Add a latency rule; can be repeated.")
+    parser.add_argument("--no-default-latency", action="store_true",
+                        help="Drop the built-in performance_glitch_user delay.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency jitter.")
+    parser.add_argument("--verbose", action="store_true", help="Log every request.")
+    args = parser.parse_args(argv)
+
+    rules = [] if args.no_default_latency else list(DEFAULT_LATENCY)
+    rules.extend(LatencyRule.parse(spec) for spec in args.latency)
+
+    server = StandInServer((args.host, args.port), rules, args.seed, args.verbose)
+    print(f"SauceDemo stand-in serving on {server.base_url}")
+    for rule in rules:
+        print(f"  latency: {rule!r}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
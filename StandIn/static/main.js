@@ -0,0 +1,611 @@
+(function () {
+  "use strict";
+
+  var app = window.SAUCE;
+  var SESSION_COOKIE = "session-username";
+  var SESSION_LIFETIME_MS = 10 * 60 * 1000;
+  var CART_KEY = "cart-contents";
+  var LOGIN_ERROR_KEY = "login-error";
+  var SORT_LABELS = {
+    az: "Name (A to Z)",
+    za: "Name (Z to A)",
+    lohi: "Price (low to high)",
+    hilo: "Price (high to low)"
+  };
+
+  // ---- session and cart state ----------------------------------------------
+
+  function getCookie(name) {
+    var parts = document.cookie ? document.cookie.split("; ") : [];
+    for (var i = 0; i < parts.length; i++) {
+      var index = parts[i].indexOf("=");
+      if (parts[i].slice(0, index) === name) {
+        return decodeURIComponent(parts[i].slice(index + 1));
+      }
+    }
+    return null;
+  }
+
+  function startSession(username) {
+    var expires = new Date(Date.now() + SESSION_LIFETIME_MS).toUTCString();
+    document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/; expires=" + expires;
+  }
+
+  function endSession() {
+    document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+  }
+
+  function currentUser() {
+    return getCookie(SESSION_COOKIE);
+  }
+
+  function readCart() {
+    try {
+      return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function writeCart(ids) {
+    if (ids.length) {
+      window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    } else {
+      window.localStorage.removeItem(CART_KEY);
+    }
+    renderBadge();
+  }
+
+  function productById(id) {
+    for (var i = 0; i < app.products.length; i++) {
+      if (app.products[i].id === id) {
+        return app.products[i];
+      }
+    }
+    return null;
+  }
+
+  function isAddToCartBroken(product) {
+    var broken = app.brokenAddToCart[currentUser()] || [];
+    return broken.indexOf(product.id) !== -1;
+  }
+
+  function displayedProduct(product) {
+    var user = currentUser();
+    var shown = Object.assign({}, product);
+    if (user === "problem_user" || (user === "visual_user" && product.id === 4)) {
+      shown.image = app.brokenImage;
+    }
+    if (user === "visual_user" && Math.random() < 0.5) {
+      shown.price = Math.round(Math.random() * 10000) / 100;
+    }
+    return shown;
+  }
+
+  function formatPrice(price) {
+    return "$" + price.toFixed(2);
+  }
+
+  // ---- DOM helpers -----------------------------------------------------------
+
+  function el(tag, attrs, children) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) {
+      if (key === "text") {
+        node.textContent = attrs[key];
+      } else if (key === "className") {
+        node.className = attrs[key];
+      } else {
+        node.setAttribute(key, attrs[key]);
+      }
+    });
+    (children || []).forEach(function (child) {
+      if (child) {
+        node.appendChild(child);
+      }
+    });
+    return node;
+  }
+
+  function go(page) {
+    window.location.href = page;
+  }
+
+  // ---- shared chrome -----------------------------------------------------------
+
+  function renderBadge() {
+    var link = document.querySelector(".shopping_cart_link");
+    if (!link) {
+      return;
+    }
+    var badge = link.querySelector(".shopping_cart_badge");
+    var count = readCart().length;
+    if (!count && badge) {
+      link.removeChild(badge);
+    } else if (count) {
+      if (!badge) {
+        badge = el("span", { className: "shopping_cart_badge", "data-test": "shopping-cart-badge" });
+        link.appendChild(badge);
+      }
+      badge.textContent = String(count);
+    }
+  }
+
+  function setMenuOpen(open) {
+    var wrap = document.querySelector(".bm-menu-wrap");
+    wrap.style.display = open ? "block" : "none";
+    wrap.setAttribute("aria-hidden", open ? "false" : "true");
+  }
+
+  function renderHeader(root) {
+    var menuLinks = [
+      ["inventory_sidebar_link", "All Items", "inventory.html"],
+      ["about_sidebar_link", "About", "https://saucelabs.com/"],
+      ["logout_sidebar_link", "Logout", "./"],
+      ["reset_sidebar_link", "Reset App State", "#"]
+    ].map(function (link) {
+      return el("a", { id: link[0], className: "bm-item menu-item", href: link[2], "data-test": link[0].replace(/_/g, "-"), text: link[1] });
+    });
+
+    var menu = el("div", { className: "bm-menu-wrap", "aria-hidden": "true", style: "display: none" }, [
+      el("div", { className: "bm-menu" }, [el("nav", { className: "bm-item-list" }, menuLinks)]),
+      el("div", { className: "bm-cross-button" }, [
+        el("button", { id: "react-burger-cross-btn", type: "button", text: "Close Menu" })
+      ])
+    ]);
+
+    var cartLink = el("a", { className: "shopping_cart_link", href: "cart.html", "data-test": "shopping-cart-link" });
+    if (currentUser() === "visual_user") {
+      cartLink.className += " visual_failure";
+    }
+
+    var header = el("div", { className: "header_container", id: "header_container" }, [
+      el("div", { className: "primary_header" }, [
+        el("div", { id: "menu_button_container" }, [
+          el("div", { className: "bm-burger-button" }, [
+            el("button", { id: "react-burger-menu-btn", type: "button", text: "Open Menu" })
+          ]),
+          menu
+        ]),
+        el("div", { className: "header_label" }, [el("div", { className: "app_logo", text: "Swag Labs" })]),
+        el("div", { id: "shopping_cart_container", className: "shopping_cart_container" }, [cartLink])
+      ]),
+      el("div", { className: "header_secondary_container" }, [
+        el("span", { className: "title", "data-test": "title", text: app.title })
+      ])
+    ]);
+    root.appendChild(header);
+    renderBadge();
+
+    document.getElementById("react-burger-menu-btn").addEventListener("click", function () {
+      setMenuOpen(true);
+    });
+    document.getElementById("react-burger-cross-btn").addEventListener("click", function () {
+      setMenuOpen(false);
+    });
+    document.getElementById("logout_sidebar_link").addEventListener("click", function (event) {
+      event.preventDefault();
+      endSession();
+      go("./");
+    });
+    document.getElementById("reset_sidebar_link").addEventListener("click", function (event) {
+      event.preventDefault();
+      writeCart([]);
+      document.querySelectorAll("[data-product-id]").forEach(function (button) {
+        renderCartButton(button, productById(Number(button.getAttribute("data-product-id"))));
+      });
+    });
+    return header;
+  }
+
+  function renderFooter(root) {
+    var social = ["twitter", "facebook", "linkedin"].map(function (name) {
+      return el("li", { className: "social_" + name }, [
+        el("a", { href: "https://" + name + ".com/saucelabs", target: "_blank", rel: "noreferrer", text: name.charAt(0).toUpperCase() + name.slice(1) })
+      ]);
+    });
+    root.appendChild(el("footer", { className: "footer", "data-test": "footer" }, [
+      el("ul", { className: "social" }, social),
+      el("div", { className: "footer_copy", text: "© " + new Date().getFullYear() + " Sauce Labs. All Rights Reserved. Terms of Service | Privacy Policy" })
+    ]));
+  }
+
+  // ---- login -----------------------------------------------------------------------
+
+  function renderLogin(root) {
+    var errorContainer = el("div", { className: "error-message-container" });
+    var form = el("form", { id: "login-form", novalidate: "novalidate" }, [
+      el("div", { className: "form_group" }, [
+        el("input", { className: "input_error form_input", placeholder: "Username", type: "text", "data-test": "username", id: "user-name", name: "user-name", autocorrect: "off", autocapitalize: "none" })
+      ]),
+      el("div", { className: "form_group" }, [
+        el("input", { className: "input_error form_input", placeholder: "Password", type: "password", "data-test": "password", id: "password", name: "password", autocorrect: "off", autocapitalize: "none" })
+      ]),
+      errorContainer,
+      el("input", { type: "submit", className: "submit-button btn_action", "data-test": "login-button", id: "login-button", name: "login-button", value: "Login" })
+    ]);
+
+    root.appendChild(el("div", { className: "login_container" }, [
+      el("div", { className: "login_logo", text: "Swag Labs" }),
+      el("div", { className: "login_wrapper" }, [
+        el("div", { className: "login_wrapper-inner" }, [
+          el("div", { id: "login_button_container", className: "form_column" }, [el("div", { className: "login-box" }, [form])])
+        ]),
+        el("div", { className: "login_credentials_wrap" }, [
+          el("div", { className: "login_credentials_wrap-inner" }, [
+            el("div", { id: "login_credentials", className: "login_credentials", "data-test": "login-credentials" }, [
+              el("h4", { text: "Accepted usernames are:" })
+            ].concat(app.users.map(function (user) { return el("div", { text: user }); }))),
+            el("div", { className: "login_password", "data-test": "login-password" }, [
+              el("h4", { text: "Password for all users:" }),
+              el("div", { text: app.password })
+            ])
+          ])
+        ])
+      ])
+    ]));
+
+    function showError(message) {
+      errorContainer.innerHTML = "";
+      errorContainer.className = "error-message-container error";
+      var heading = el("h3", { "data-test": "error" });
+      heading.appendChild(el("button", { className: "error-button", type: "button", "data-test": "error-button", "aria-label": "Close" }));
+      heading.appendChild(document.createTextNode(message));
+      errorContainer.appendChild(heading);
+      heading.querySelector("button").addEventListener("click", function () {
+        errorContainer.innerHTML = "";
+        errorContainer.className = "error-message-container";
+      });
+    }
+
+    var pendingError = window.sessionStorage.getItem(LOGIN_ERROR_KEY);
+    if (pendingError) {
+      window.sessionStorage.removeItem(LOGIN_ERROR_KEY);
+      showError(pendingError);
+    }
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var username = document.getElementById("user-name").value;
+      var password = document.getElementById("password").value;
+      if (!username) {
+        showError("Epic sadface: Username is required");
+      } else if (!password) {
+        showError("Epic sadface: Password is required");
+      } else if (app.users.indexOf(username) === -1 || password !== app.password) {
+        showError("Epic sadface: Username and password do not match any user in this service");
+      } else if (app.lockedOut.indexOf(username) !== -1) {
+        showError("Epic sadface: Sorry, this user has been locked out.");
+      } else {
+        startSession(username);
+        go("inventory.html");
+      }
+    });
+  }
+
+  // ---- products ------------------------------------------------------------------
+
+  function renderCartButton(button, product) {
+    var inCart = readCart().indexOf(product.id) !== -1;
+    var onDetails = app.page === "inventory-item";
+    var suffix = onDetails ? "" : "-" + product.slug;
+    button.id = (inCart ? "remove" : "add-to-cart") + suffix;
+    button.setAttribute("name", button.id);
+    button.setAttribute("data-test", button.id);
+    button.textContent = inCart ? "Remove" : "Add to cart";
+    button.className = "btn " + (inCart ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+    if (currentUser() === "visual_user" && product.id === 3) {
+      button.className += " btn_inventory_misaligned";
+    }
+  }
+
+  function cartButton(product) {
+    var button = el("button", { "data-product-id": String(product.id) });
+    renderCartButton(button, product);
+    button.addEventListener("click", function () {
+      var cart = readCart();
+      var index = cart.indexOf(product.id);
+      var user = currentUser();
+      if (index === -1) {
+        if (isAddToCartBroken(product)) {
+          console.error("Failed to add item to the cart.");
+          return;
+        }
+        cart.push(product.id);
+      } else {
+        // problem_user and error_user cannot remove items from the product pages.
+        if (user === "problem_user" || user === "error_user") {
+          console.error("Failed to remove item from cart.");
+          return;
+        }
+        cart.splice(index, 1);
+      }
+      writeCart(cart);
+      renderCartButton(button, product);
+    });
+    return button;
+  }
+
+  function inventoryItem(product) {
+    var shown = displayedProduct(product);
+    var detailsLink = "inventory-item.html?id=" + product.id;
+    return el("div", { className: "inventory_item", "data-test": "inventory-item" }, [
+      el("div", { className: "inventory_item_img" }, [
+        el("a", { href: detailsLink, id: "item_" + product.id + "_img_link" }, [
+          el("img", { alt: product.name, className: "inventory_item_img", src: shown.image })
+        ])
+      ]),
+      el("div", { className: "inventory_item_description" }, [
+        el("div", { className: "inventory_item_label" }, [
+          el("a", { href: detailsLink, id: "item_" + product.id + "_title_link" }, [
+            el("div", { className: "inventory_item_name", "data-test": "inventory-item-name", text: product.name })
+          ]),
+          el("div", { className: "inventory_item_desc", "data-test": "inventory-item-desc", text: product.description })
+        ]),
+        el("div", { className: "pricebar" }, [
+          el("div", { className: "inventory_item_price", "data-test": "inventory-item-price", text: formatPrice(shown.price) }),
+          cartButton(product)
+        ])
+      ])
+    ]);
+  }
+
+  function sortProducts(products, option) {
+    var sorted = products.slice();
+    sorted.sort(function (a, b) {
+      if (option === "lohi" || option === "hilo") {
+        return option === "lohi" ? a.price - b.price : b.price - a.price;
+      }
+      var order = a.name < b.name ? -1 : a.name > b.name ? 1 : 0;
+      return option === "za" ? -order : order;
+    });
+    return sorted;
+  }
+
+  function renderInventory(root) {
+    var header = renderHeader(root);
+    var select = el("select", { className: "product_sort_container", "data-test": "product-sort-container" },
+      Object.keys(SORT_LABELS).map(function (value) { return el("option", { value: value, text: SORT_LABELS[value] }); }));
+    var activeOption = el("span", { className: "active_option", "data-test": "active-option", text: SORT_LABELS.az });
+    header.querySelector(".header_secondary_container").appendChild(
+      el("div", { className: "right_component" }, [el("span", { className: "select_container" }, [activeOption, select])]));
+
+    var list = el("div", { className: "inventory_list", "data-test": "inventory-list" });
+    root.appendChild(el("div", { id: "inventory_container", className: "inventory_container" }, [list]));
+
+    function renderList(option) {
+      list.innerHTML = "";
+      sortProducts(app.products, option).forEach(function (product) {
+        list.appendChild(inventoryItem(product));
+      });
+    }
+
+    select.addEventListener("change", function () {
+      var user = currentUser();
+      activeOption.textContent = SORT_LABELS[select.value];
+      if (user === "error_user") {
+        window.alert("Sorting is broken! This error has been reported to Backtrace.");
+        return;
+      }
+      if (user === "problem_user") {
+        return;
+      }
+      renderList(select.value);
+    });
+    renderList("az");
+  }
+
+  function renderInventoryItem(root) {
+    renderHeader(root);
+    var id = Number(new URLSearchParams(window.location.search).get("id"));
+    // problem_user always lands on the neighbouring product.
+    if (currentUser() === "problem_user") {
+      id = (id + 1) % app.products.length;
+    }
+    var product = productById(id);
+    var back = el("button", { id: "back-to-products", className: "btn btn_secondary back btn_large inventory_details_back_button", text: "Back to products" });
+    back.addEventListener("click", function () { go("inventory.html"); });
+    if (!product) {
+      root.appendChild(el("div", { className: "inventory_details" }, [back, el("div", { className: "inventory_details_name large_size", text: "ITEM NOT FOUND" })]));
+      return;
+    }
+    var shown = displayedProduct(product);
+    root.appendChild(el("div", { className: "inventory_details", "data-test": "inventory-container" }, [
+      back,
+      el("div", { className: "inventory_details_container" }, [
+        el("div", { className: "inventory_details_img_container" }, [
+          el("img", { alt: product.name, className: "inventory_details_img", src: shown.image })
+        ]),
+        el("div", { className: "inventory_details_desc_container" }, [
+          el("div", { className: "inventory_details_name large_size", "data-test": "inventory-item-name", text: product.name }),
+          el("div", { className: "inventory_details_desc large_size", "data-test": "inventory-item-desc", text: product.description }),
+          el("div", { className: "inventory_details_price", "data-test": "inventory-item-price", text: formatPrice(shown.price) }),
+          cartButton(product)
+        ])
+      ])
+    ]));
+  }
+
+  // ---- cart and checkout -----------------------------------------------------------
+
+  function cartItem(product, withRemove) {
+    var pricebar = [el("div", { className: "inventory_item_price", "data-test": "inventory-item-price", text: formatPrice(product.price) })];
+    if (withRemove) {
+      var remove = el("button", { className: "btn btn_secondary btn_small cart_button", id: "remove-" + product.slug, name: "remove-" + product.slug, "data-test": "remove-" + product.slug, text: "Remove" });
+      remove.addEventListener("click", function () {
+        writeCart(readCart().filter(function (id) { return id !== product.id; }));
+        var row = remove.closest(".cart_item");
+        row.parentNode.removeChild(row);
+      });
+      pricebar.push(remove);
+    }
+    return el("div", { className: "cart_item", "data-test": "inventory-item" }, [
+      el("div", { className: "cart_quantity", "data-test": "item-quantity", text: "1" }),
+      el("div", { className: "cart_item_label" }, [
+        el("a", { href: "inventory-item.html?id=" + product.id, id: "item_" + product.id + "_title_link" }, [
+          el("div", { className: "inventory_item_name", "data-test": "inventory-item-name", text: product.name })
+        ]),
+        el("div", { className: "inventory_item_desc", "data-test": "inventory-item-desc", text: product.description }),
+        el("div", { className: "item_pricebar" }, pricebar)
+      ])
+    ]);
+  }
+
+  function cartProducts() {
+    return readCart().map(productById).filter(Boolean);
+  }
+
+  function cartList(withRemove) {
+    return el("div", { className: "cart_list", "data-test": "cart-list" }, [
+      el("div", { className: "cart_quantity_label", text: "QTY" }),
+      el("div", { className: "cart_desc_label", text: "Description" })
+    ].concat(cartProducts().map(function (product) { return cartItem(product, withRemove); })));
+  }
+
+  function button(id, label, className, onClick) {
+    var node = el("button", { id: id, name: id, "data-test": id, className: className, text: label });
+    node.addEventListener("click", onClick);
+    return node;
+  }
+
+  function renderCart(root) {
+    renderHeader(root);
+    root.appendChild(el("div", { id: "cart_contents_container", className: "cart_contents_container" }, [
+      cartList(true),
+      el("div", { className: "cart_footer" }, [
+        button("continue-shopping", "Continue Shopping", "btn btn_secondary back btn_medium", function () { go("inventory.html"); }),
+        button("checkout", "Checkout", "btn btn_action btn_medium checkout_button", function () { go("checkout-step-one.html"); })
+      ])
+    ]));
+  }
+
+  function formField(id, placeholder) {
+    return el("div", { className: "form_group" }, [
+      el("input", { className: "input_error form_input", placeholder: placeholder, type: "text", "data-test": id.replace("-", ""), id: id, name: id, autocorrect: "off", autocapitalize: "none" })
+    ]);
+  }
+
+  function renderCheckoutStepOne(root) {
+    renderHeader(root);
+    var errorContainer = el("div", { className: "error-message-container" });
+    var form = el("form", { novalidate: "novalidate" }, [
+      el("div", { className: "checkout_info" }, [
+        formField("first-name", "First Name"),
+        formField("last-name", "Last Name"),
+        formField("postal-code", "Zip/Postal Code"),
+        errorContainer
+      ]),
+      el("div", { className: "checkout_buttons" }, [
+        button("cancel", "Cancel", "btn btn_secondary back btn_medium cart_cancel_link", function () { go("cart.html"); }),
+        el("input", { type: "submit", className: "submit-button btn btn_primary cart_button btn_action", "data-test": "continue", id: "continue", name: "continue", value: "Continue" })
+      ])
+    ]);
+    root.appendChild(el("div", { id: "checkout_info_container", className: "checkout_info_container" }, [
+      el("div", { className: "checkout_info_wrapper" }, [form])
+    ]));
+
+    var firstName = document.getElementById("first-name");
+    var lastName = document.getElementById("last-name");
+    lastName.addEventListener("input", function () {
+      var user = currentUser();
+      if (user === "problem_user") {
+        // Typing into "Last Name" overwrites "First Name" for problem_user.
+        firstName.value = lastName.value.slice(-1);
+        lastName.value = "";
+      } else if (user === "error_user") {
+        lastName.value = "";
+      }
+    });
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var message = null;
+      if (!firstName.value) {
+        message = "Error: First Name is required";
+      } else if (!lastName.value) {
+        message = "Error: Last Name is required";
+      } else if (!document.getElementById("postal-code").value) {
+        message = "Error: Postal Code is required";
+      }
+      if (message) {
+        errorContainer.innerHTML = "";
+        errorContainer.className = "error-message-container error";
+        errorContainer.appendChild(el("h3", { "data-test": "error", text: message }));
+        return;
+      }
+      go("checkout-step-two.html");
+    });
+  }
+
+  function renderCheckoutStepTwo(root) {
+    renderHeader(root);
+    var subtotal = cartProducts().reduce(function (sum, product) { return sum + product.price; }, 0);
+    var tax = Math.round(subtotal * app.taxRate * 100) / 100;
+    root.appendChild(el("div", { id: "checkout_summary_container", className: "checkout_summary_container" }, [
+      cartList(false),
+      el("div", { className: "summary_info" }, [
+        el("div", { className: "summary_info_label", text: "Payment Information:" }),
+        el("div", { className: "summary_value_label", text: "SauceCard #31337" }),
+        el("div", { className: "summary_info_label", text: "Shipping Information:" }),
+        el("div", { className: "summary_value_label", text: "Free Pony Express Delivery!" }),
+        el("div", { className: "summary_info_label", text: "Price Total" }),
+        el("div", { className: "summary_subtotal_label", "data-test": "subtotal-label", text: "Item total: " + formatPrice(subtotal) }),
+        el("div", { className: "summary_tax_label", "data-test": "tax-label", text: "Tax: " + formatPrice(tax) }),
+        el("div", { className: "summary_total_label", "data-test": "total-label", text: "Total: " + formatPrice(subtotal + tax) }),
+        el("div", { className: "cart_footer" }, [
+          button("cancel", "Cancel", "btn btn_secondary back btn_medium cart_cancel_link", function () { go("inventory.html"); }),
+          button("finish", "Finish", "btn btn_action btn_medium cart_button", function () {
+            if (currentUser() === "error_user") {
+              console.error("Failed to finish the order.");
+              return;
+            }
+            writeCart([]);
+            go("checkout-complete.html");
+          })
+        ])
+      ])
+    ]));
+  }
+
+  function renderCheckoutComplete(root) {
+    renderHeader(root);
+    root.appendChild(el("div", { id: "checkout_complete_container", className: "checkout_complete_container" }, [
+      el("h2", { className: "complete-header", "data-test": "complete-header", text: "Thank you for your order!" }),
+      el("div", { className: "complete-text", "data-test": "complete-text", text: "Your order has been dispatched, and will arrive just as fast as the pony can get there!" }),
+      button("back-to-products", "Back Home", "btn btn_primary btn_small", function () { go("inventory.html"); })
+    ]));
+  }
+
+  // ---- routing -----------------------------------------------------------------------
+
+  var PAGES = {
+    "login": renderLogin,
+    "inventory": renderInventory,
+    "inventory-item": renderInventoryItem,
+    "cart": renderCart,
+    "checkout-step-one": renderCheckoutStepOne,
+    "checkout-step-two": renderCheckoutStepTwo,
+    "checkout-complete": renderCheckoutComplete
+  };
+
+  var root = document.getElementById("root");
+  if (app.page !== "login" && !currentUser()) {
+    window.sessionStorage.setItem(LOGIN_ERROR_KEY,
+      "Epic sadface: You can only access '" + window.location.pathname + "' when you are logged in.");
+    window.location.replace("./");
+    return;
+  }
+
+  document.body.className = app.page === "login" ? "login" : "app";
+  if (currentUser() === "visual_user") {
+    document.body.className += " visual_user";
+  }
+  var wrapper = el("div", { className: "page_wrapper" });
+  root.appendChild(wrapper);
+  var container = el("div", { id: app.page === "login" ? "login_container" : "contents_wrapper" });
+  wrapper.appendChild(container);
+  PAGES[app.page](container);
+  if (app.page !== "login") {
+    renderFooter(wrapper);
+  }
+})();
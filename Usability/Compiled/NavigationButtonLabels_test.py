@@ -1,26 +1,14 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import os
 
-@pytest.fixture(scope="session")
-def driver():
-    driver = webdriver.Firefox()
-    yield driver
-    driver.quit()
+from Common.Auth import login as auth_login, page_url
+from Common.Waits import Wait, present, url_contains
+from Common.Results import Report
 
 def login(driver, username, password):
-    driver.get("https://www.saucedemo.com/")
-    username_field = driver.find_element(By.ID, "user-name")
-    password_field = driver.find_element(By.ID, "password")
-    login_button = driver.find_element(By.ID, "login-button")
-    login_label = login_button.get_attribute("value").strip()
-    username_field.send_keys(username)
-    password_field.send_keys(password)
-    login_button.click()
-    WebDriverWait(driver, 30).until(EC.url_contains("inventory.html"))
+    driver.get(page_url())
+    login_label = driver.find_element(By.ID, "login-button").get_attribute("value").strip()
+    auth_login(driver, username, password)
     return login_label
 
 def get_labels(driver):
@@ -34,38 +22,24 @@ def get_labels(driver):
     labels["Remove"] = remove_button.text.strip()
 
     driver.find_element(By.CLASS_NAME, "shopping_cart_link").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("cart.html"))
+    Wait(driver, 10).until(url_contains("cart.html"))
 
     labels["Checkout"] = driver.find_element(By.ID, "checkout").text.strip()
     labels["Continue Shopping"] = driver.find_element(By.ID, "continue-shopping").text.strip()
 
     driver.find_element(By.ID, "checkout").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("checkout-step-one.html"))
+    Wait(driver, 10).until(url_contains("checkout-step-one.html"))
 
-    wait = WebDriverWait(driver, 10)
-    continue_btn = wait.until(EC.presence_of_element_located((By.ID, "continue")))
-    cancel_btn = wait.until(EC.presence_of_element_located((By.ID, "cancel")))
+    wait = Wait(driver, 10)
+    continue_btn = wait.until(present((By.ID, "continue")))
+    cancel_btn = wait.until(present((By.ID, "cancel")))
 
     labels["Continue"] = continue_btn.get_attribute("value").strip()
     labels["Cancel"] = cancel_btn.get_attribute("data-test").capitalize().strip()
 
     return labels
 
-def write_result(test_name, message, new_block=False):
-    """
-    Writes test result to file.
-
-    Args:
-        test_name (str): The name of the test case (e.g., "UN_06").
-        message (str): The result message.
-        new_block (bool, optional):  If True, adds a newline *before* writing.
-    """
-    filepath = os.path.expanduser("~/Official-SauceDemo/Usability/Compiled/Results/NavigationButtonLabels.txt")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "a") as f:
-        if new_block:
-            f.write("\n")
-        f.write(f"{test_name}: {message}\n")
+results = Report("Usability", "Compiled", "Results", "NavigationButtonLabels.txt")
 
 baseline_labels = {
     "Add to Cart": "Add to cart",
@@ -98,12 +72,12 @@ def test_button_labels(driver, username, test_id):
             expected = baseline_labels[key]
             actual = labels.get(key, "Missing")
             if expected.lower() == actual.lower():
-                write_result(test_name, f"{key}: ✅ Match - '{actual}'")
+                results.write(test_name, f"{key}: ✅ Match - '{actual}'")
             else:
-                write_result(test_name, f"{key}: ❌ Mismatch - Expected: '{expected}', Got: '{actual}'")
+                results.write(test_name, f"{key}: ❌ Mismatch - Expected: '{expected}', Got: '{actual}'")
         if test_id != "UN_10":
-            write_result("", "", new_block=True)
+            results.block_break()
 
     except Exception as e:
-        write_result(test_name, f"❌ Error: {e}")
+        results.write(test_name, f"❌ Error: {e}")
         raise
@@ -1,27 +1,13 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import os
-
-@pytest.fixture(scope="function")
-def driver():
-    driver = webdriver.Firefox() 
-    yield driver
-    driver.quit()
-
-def login(driver, username="standard_user", password="secret_sauce"):
-    driver.get("https://www.saucedemo.com/")
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "user-name")))
-    driver.find_element(By.ID, "user-name").send_keys(username)
-    driver.find_element(By.ID, "password").send_keys(password)
-    driver.find_element(By.ID, "login-button").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("inventory"))
+
+from Common.Auth import login
+from Common.Waits import Wait, present, url_contains
+from Common.Results import Report
 
 def navigate_to_cart(driver):
     driver.find_element(By.CLASS_NAME, "shopping_cart_link").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("cart"))
+    Wait(driver, 10).until(url_contains("cart"))
 
 def add_all_items_to_cart(driver):
     add_buttons = driver.find_elements(By.XPATH, "//button[starts-with(@id, 'add-to-cart')]")
@@ -37,23 +23,17 @@ def get_cart_item_count(driver):
 
 def check_element_presence(driver, by_type, locator):
     try:
-        WebDriverWait(driver, 5).until(EC.presence_of_element_located((by_type, locator)))
+        Wait(driver, 5).until(present((by_type, locator)))
         return True, ""
     except:
         return False, f"Element with locator '{locator}' not found."
 
-def write_result(test_id, result, details=""):
-    filepath = os.path.expanduser("~/Official-SauceDemo/Usability/Compiled/Results/Responsiveness.txt")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "a") as f:
-        f.write(f"{test_id}: {result}\n")
-        if result == "Fail" and details:
-            f.write(f"Details:\n{details}\n\n")
+results = Report("Usability", "Compiled", "Results", "Responsiveness.txt")
 
 def check_cart_responsiveness(driver, width, height):
     driver.set_window_size(width, height)
     try:
-        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CLASS_NAME, "cart_list")))
+        Wait(driver, 5).until(present((By.CLASS_NAME, "cart_list")))
         cart_list = driver.find_element(By.CLASS_NAME, "cart_list")
         return cart_list.is_displayed(), ""
     except:
@@ -65,7 +45,7 @@ def check_cart_responsiveness(driver, width, height):
 ])
 def test_mobile_and_tablet_cart_functionality(driver, test_id, width, height):
     try:
-        login(driver)
+        login(driver, "standard_user")
         add_all_items_to_cart(driver)
         navigate_to_cart(driver)
 
@@ -90,18 +70,18 @@ def test_mobile_and_tablet_cart_functionality(driver, test_id, width, height):
             overall_result = "Fail"
             details += f"Cart layout issue at {width}x{height}: {cart_details}\n"
 
-        write_result(test_id, overall_result, details.strip())
+        results.write(test_id, overall_result, details.strip())
 
     except pytest.fail.Exception:
         pass
     except Exception as e:
-        write_result(test_id, "Error", str(e))
+        results.write(test_id, "Error", str(e))
         raise
 
 def test_desktop_resize_cart_functionality(driver):
     test_id = "UR_03"
     try:
-        login(driver)
+        login(driver, "standard_user")
         add_all_items_to_cart(driver)
         navigate_to_cart(driver)
 
@@ -133,10 +113,10 @@ def test_desktop_resize_cart_functionality(driver):
                 overall_result = "Fail"
                 details += f"Cart layout issue at {w}x{h}: {cart_details}\n"
 
-        write_result(test_id, overall_result, details.strip())
+        results.write(test_id, overall_result, details.strip())
 
     except pytest.fail.Exception:
         pass
     except Exception as e:
-        write_result(test_id, "Error", str(e))
+        results.write(test_id, "Error", str(e))
         raise
\ No newline at end of file
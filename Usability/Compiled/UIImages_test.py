@@ -1,9 +1,9 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import os
+
+from Common.Config import BASE_URL
+from Common.Auth import login
+from Common.Results import Report
 
 SAUCE_USERS = [
     "standard_user",
@@ -14,32 +14,15 @@ SAUCE_USERS = [
 ]
 
 EXPECTED_PRODUCT_IMAGES = {
-    "Sauce Labs Backpack": "https://www.saucedemo.com/static/media/sauce-backpack-1200x1500.0a0b85a3.jpg",
-    "Sauce Labs Bike Light": "https://www.saucedemo.com/static/media/bike-light-1200x1500.37c843b0.jpg",
-    "Sauce Labs Bolt T-Shirt": "https://www.saucedemo.com/static/media/bolt-shirt-1200x1500.c2599ac5.jpg",
-    "Sauce Labs Fleece Jacket": "https://www.saucedemo.com/static/media/sauce-pullover-1200x1500.51d7ffaf.jpg",
-    "Sauce Labs Onesie": "https://www.saucedemo.com/static/media/red-onesie-1200x1500.2ec615b2.jpg",
-    "Test.allTheThings() T-Shirt (Red)": "https://www.saucedemo.com/static/media/red-tatt-1200x1500.30dadef4.jpg",
+    "Sauce Labs Backpack": f"{BASE_URL}static/media/sauce-backpack-1200x1500.0a0b85a3.jpg",
+    "Sauce Labs Bike Light": f"{BASE_URL}static/media/bike-light-1200x1500.37c843b0.jpg",
+    "Sauce Labs Bolt T-Shirt": f"{BASE_URL}static/media/bolt-shirt-1200x1500.c2599ac5.jpg",
+    "Sauce Labs Fleece Jacket": f"{BASE_URL}static/media/sauce-pullover-1200x1500.51d7ffaf.jpg",
+    "Sauce Labs Onesie": f"{BASE_URL}static/media/red-onesie-1200x1500.2ec615b2.jpg",
+    "Test.allTheThings() T-Shirt (Red)": f"{BASE_URL}static/media/red-tatt-1200x1500.30dadef4.jpg",
 }
 
-@pytest.fixture(scope="session")
-def driver():
-    driver = webdriver.Firefox()
-    yield driver
-    driver.quit()
-
-def login(driver, username, password="secret_sauce"):
-    driver.get("https://www.saucedemo.com/")
-    driver.find_element(By.ID, "user-name").send_keys(username)
-    driver.find_element(By.ID, "password").send_keys(password)
-    driver.find_element(By.ID, "login-button").click()
-    WebDriverWait(driver, 10).until(EC.url_contains("inventory.html"))
-
-def write_result(test_name, result):
-    filepath = os.path.expanduser("~/Official-SauceDemo/Usability/Compiled/Results/UIImages.txt")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "a") as f:
-        f.write(f"{test_name}: {result}\n")
+results = Report("Usability", "Compiled", "Results", "UIImages.txt")
 
 @pytest.mark.parametrize("user_type", SAUCE_USERS)
 def test_user_product_images_match(driver, user_type):
@@ -85,5 +68,5 @@ def test_user_product_images_match(driver, user_type):
     except Exception as e:
         result = f"🚨 Exception occurred: {e}"
 
-    write_result(test_name, result)
+    results.write(test_name, result)
     assert result == "Pass", f"{test_name} failed — {result}"
\ No newline at end of file
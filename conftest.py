@@ -0,0 +1,154 @@
+import pytest
+
+from Common.Benchmark import BenchmarkSettings
+from Common.CommandTrace import check_budget, command_count, command_records, command_summary, trace_path, write_trace
+from Common.Crawler import CrawlCache
+from Common.DriverPool import BrowserPool
+from Common.ResourceTiming import DEFAULT_BUDGETS_FILE, load_budgets
+from Common.Results import merge, merge_deferred, sink
+from Common.Sharding import module_of, shard_modules
+from Common.Waits import wait_summary
+
+browser_pool_key = pytest.StashKey[BrowserPool]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo")
+    group.addoption("--browser-pool-size", type=int, default=1,
+                    help="Number of Firefox sessions kept alive and shared by the tests.")
+    group.addoption("--headless", action="store_true", default=False,
+                    help="Run the pooled Firefox sessions headless.")
+    group.addoption("--shard-count", type=int, default=1,
+                    help="Split the collected modules into this many shards (used by Common.ShardRunner).")
+    group.addoption("--shard-index", type=int, default=0,
+                    help="Only run the modules of this shard (0-based).")
+    group.addoption("--lockout-thresholds", default="5",
+                    help="Comma-separated numbers of wrong passwords the account lockout matrix tries per persona "
+                         "(e.g. 5,10,30 for the full matrix).")
+    group.addoption("--benchmark-warmup", type=int, default=0,
+                    help="Unmeasured runs of each performance journey before the measured ones.")
+    group.addoption("--benchmark-iterations", type=int, default=1,
+                    help="Measured runs of each performance journey.")
+    group.addoption("--benchmark-percentile", type=float, default=95,
+                    help="Percentile of the measured samples that the performance thresholds apply to.")
+    group.addoption("--resource-budgets", default=DEFAULT_BUDGETS_FILE,
+                    help="JSON file with per-page request and byte budgets for the performance journey.")
+    group.addoption("--roundtrip-max-commands", type=int, default=None,
+                    help="Fail any test that sends more WebDriver commands than this "
+                         "(a roundtrip_budget marker overrides it).")
+    group.addoption("--roundtrip-max-seconds", type=float, default=None,
+                    help="Fail any test whose WebDriver commands take longer than this in total "
+                         "(a roundtrip_budget marker overrides it).")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "roundtrip_budget(commands=None, seconds=None): fail the test when its body sends more WebDriver "
+        "commands or spends more protocol time than this")
+
+
+def pytest_collection_modifyitems(config, items):
+    shard_count = config.getoption("--shard-count")
+    if shard_count <= 1:
+        return
+    selected_modules = shard_modules([item.nodeid for item in items], shard_count, config.getoption("--shard-index"))
+    selected = [item for item in items if module_of(item.nodeid) in selected_modules]
+    deselected = [item for item in items if module_of(item.nodeid) not in selected_modules]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def roundtrip_budget(item):
+    """(max commands, max seconds) for the test: the marker's values, else the command-line defaults."""
+    marker = item.get_closest_marker("roundtrip_budget")
+    kwargs = marker.kwargs if marker else {}
+    return (kwargs.get("commands", item.config.getoption("--roundtrip-max-commands")),
+            kwargs.get("seconds", item.config.getoption("--roundtrip-max-seconds")))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    start = command_count()
+    result = yield
+    max_commands, max_seconds = roundtrip_budget(item)
+    if max_commands is None and max_seconds is None:
+        return result
+    records = [record for record in command_records(start) if record.test == item.nodeid]
+    problems = check_budget(records, max_commands, max_seconds)
+    if problems:
+        pytest.fail("\n".join(problems), pytrace=False)
+    return result
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    pool = BrowserPool(
+        size=request.config.getoption("--browser-pool-size"),
+        headless=request.config.getoption("--headless"),
+    )
+    request.config.stash[browser_pool_key] = pool
+    try:
+        # Every pooled browser is started before the first test runs, so no
+        # test's timing includes a Firefox cold start.
+        pool.warm()
+        yield pool
+    finally:
+        pool.close()
+
+
+@pytest.fixture
+def driver(browser_pool):
+    with browser_pool.lease() as driver:
+        yield driver
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings(request):
+    return BenchmarkSettings(
+        warmup=max(0, request.config.getoption("--benchmark-warmup")),
+        iterations=max(1, request.config.getoption("--benchmark-iterations")),
+        percentile=request.config.getoption("--benchmark-percentile"),
+    )
+
+
+@pytest.fixture(scope="session")
+def resource_budgets(request):
+    return load_budgets(request.config.getoption("--resource-budgets"))
+
+
+@pytest.fixture(scope="session")
+def crawl_cache():
+    """Per-persona snapshots of the inventory -> checkout -> sidebar journey, crawled once per session."""
+    return CrawlCache()
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    sink.flush()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Shard workers leave their part files to Common.ShardRunner, which
+    # merges every shard at once.
+    if not merge_deferred():
+        merge()
+    if command_records():
+        write_trace(trace_path())
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pool = config.stash.get(browser_pool_key, None)
+    if pool is not None and pool.leases:
+        terminalreporter.write_sep("-", pool.summary())
+    waits = wait_summary()
+    if waits:
+        terminalreporter.write_sep("-", "slowest waits")
+        for line in waits:
+            terminalreporter.write_line(line)
+    commands = command_summary()
+    if commands:
+        terminalreporter.write_sep("-", "webdriver commands per test")
+        for line in commands:
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"Command trace: {trace_path()}")
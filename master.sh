@@ -1,10 +1,45 @@
 #!/bin/bash
 
-pytest Functionality/Compiled Performance/Compiled Security/Compiled Usability/Compiled -v
+# Set SAUCEDEMO_STAND_IN=1 to run everything against the bundled offline
+# stand-in (StandIn/) instead of https://www.saucedemo.com/.
+if [ -n "$SAUCEDEMO_STAND_IN" ]; then
+    STAND_IN_PORT=${SAUCEDEMO_STAND_IN_PORT:-8000}
+    python3 -m StandIn.Server --port "$STAND_IN_PORT" &
+    STAND_IN_PID=$!
+    trap 'kill $STAND_IN_PID 2>/dev/null' EXIT
+    export SAUCEDEMO_BASE_URL="http://127.0.0.1:$STAND_IN_PORT/"
+    for _ in $(seq 50); do
+        curl -s -o /dev/null "$SAUCEDEMO_BASE_URL" && break
+        sleep 0.1
+    done
+fi
+
+# Every timing sample of this run is stored under one run id in
+# Results/perf_history.sqlite3 (see Common/PerfHistory.py).
+export SAUCEDEMO_RUN_ID=${SAUCEDEMO_RUN_ID:-$(date +%Y%m%d-%H%M%S)-$$}
+
+# Set SAUCEDEMO_WORKERS to a number above 1 to shard the pytest suites across
+# that many processes, each driving its own headless Firefox.
+WORKERS=${SAUCEDEMO_WORKERS:-1}
+
+if [ "$WORKERS" -gt 1 ]; then
+    python3 -m Common.ShardRunner --workers "$WORKERS" Functionality/Compiled Performance/Compiled Security/Compiled Usability/Compiled
+else
+    pytest Functionality/Compiled Performance/Compiled Security/Compiled Usability/Compiled -v
+fi
+
+# Compare this run's timings with the previous runs; a significant slowdown
+# makes the whole script exit non-zero once everything else has run.
+python3 -m Common.PerfHistory
+PERF_STATUS=$?
 
 # Execution of Security Related Tasks that is not dependent to pytest.
 python3 Security/Compiled/BruteForceLogin.py
 
 python3 Security/Compiled/CipherEnum.py
 
+# Session expiry is checked on a virtual clock; set SAUCEDEMO_REAL_TIME=1 to
+# really wait out the 15 minutes per persona.
 python3 Security/Compiled/SessionManagement.py
+
+exit $PERF_STATUS